@@ -1,4 +1,6 @@
+from django import forms
 from django.contrib import admin
+from django.db.models import Count
 from django.utils.translation import gettext_lazy as _
 from .models import (
     Region, District, Nation, EducationLevel,
@@ -6,6 +8,8 @@ from .models import (
     LanguageProficiency, StateAward, WorkExperience
 )
 from ..personnel.models import Employee, Candidate
+from .filters import ReferenceListFilter, AutocompleteListFilter, AutocompleteFilterMixin
+from .forms import ReferenceChoiceField, ReferenceFormMixin
 
 
 class DistrictInline(admin.TabularInline):
@@ -14,57 +18,78 @@ class DistrictInline(admin.TabularInline):
 
 @admin.register(Region)
 class RegionAdmin(admin.ModelAdmin):
-    list_display = ('name', 'get_districts_count')
+    list_display = ('name', 'get_districts_count', 'is_active')
+    list_filter = ('is_active',)
     search_fields = ('name',)
+    autocomplete_prefix_fields = ('name',)
     ordering = ('name',)
     inlines = [DistrictInline]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(districts_count=Count('districts'))
+
     def get_districts_count(self, obj):
-        return obj.districts.count()
+        return obj.districts_count
     get_districts_count.short_description = _("Tumanlar soni")
+    get_districts_count.admin_order_field = 'districts_count'
+
+class DistrictForm(ReferenceFormMixin, forms.ModelForm):
+    class Meta:
+        model = District
+        fields = '__all__'
+        # Faolsizlantirilgan viloyat yangi tanlov sifatida chiqmaydi, joriy qiymat esa saqlanadi
+        field_classes = {'region': ReferenceChoiceField}
 
 @admin.register(District)
 class DistrictAdmin(admin.ModelAdmin):
-    list_display = ('name', 'region')
-    list_filter = ('region',)
+    form = DistrictForm
+    list_display = ('name', 'region', 'is_active')
+    list_filter = ('is_active', ('region', ReferenceListFilter))
     search_fields = ('name', 'region__name')
+    autocomplete_prefix_fields = ('name',)
     ordering = ('region', 'name')
     autocomplete_fields = ['region']
+    list_select_related = ('region',)
 
 @admin.register(Nation)
 class NationAdmin(admin.ModelAdmin):
     list_display = ('name',)
     search_fields = ('name',)
+    autocomplete_prefix_fields = ('name',)
     ordering = ('name',)
 
 @admin.register(EducationLevel)
 class EducationLevelAdmin(admin.ModelAdmin):
     list_display = ('name',)
     search_fields = ('name',)
+    autocomplete_prefix_fields = ('name',)
     ordering = ('name',)
 
 @admin.register(AcademicDegree)
 class AcademicDegreeAdmin(admin.ModelAdmin):
     list_display = ('name',)
     search_fields = ('name',)
+    autocomplete_prefix_fields = ('name',)
     ordering = ('name',)
 
 @admin.register(AcademicSpecialization)
 class AcademicSpecializationAdmin(admin.ModelAdmin):
     list_display = ('name',)
     search_fields = ('name',)
+    autocomplete_prefix_fields = ('name',)
     ordering = ('name',)
 
 @admin.register(AcademicTitle)
 class AcademicTitleAdmin(admin.ModelAdmin):
     list_display = ('name',)
     search_fields = ('name',)
+    autocomplete_prefix_fields = ('name',)
     ordering = ('name',)
 
 @admin.register(LanguageProficiency)
-class LanguageProficiencyAdmin(admin.ModelAdmin):
+class LanguageProficiencyAdmin(AutocompleteFilterMixin, admin.ModelAdmin):
     list_display = ('personnel', 'get_language_display', 'get_level_display', )
-    list_filter = ('language_name', 'proficiency_level', 'personnel')
+    list_filter = ('language_name', 'proficiency_level', ('personnel', AutocompleteListFilter))
     search_fields = ('language_name', 'personnel__fullname')
     ordering = ('personnel', 'language_name', 'proficiency_level')
     autocomplete_fields = ['personnel']
@@ -79,9 +104,9 @@ class LanguageProficiencyAdmin(admin.ModelAdmin):
 
 
 @admin.register(StateAward)
-class StateAwardAdmin(admin.ModelAdmin):
+class StateAwardAdmin(AutocompleteFilterMixin, admin.ModelAdmin):
     list_display = ('personnel', 'name', 'year', )
-    list_filter = ('year', 'personnel')
+    list_filter = ('year', ('personnel', AutocompleteListFilter))
     search_fields = ('name', 'personnel__fullname')
     ordering = ('-year', 'name')
     autocomplete_fields = ['personnel']
@@ -92,9 +117,9 @@ class StateAwardAdmin(admin.ModelAdmin):
         }
 
 @admin.register(WorkExperience)
-class WorkExperienceAdmin(admin.ModelAdmin):
+class WorkExperienceAdmin(AutocompleteFilterMixin, admin.ModelAdmin):
     list_display = ('personnel', 'workplace', 'position', 'start_date', 'end_date', 'get_duration')
-    list_filter = ('start_date', 'end_date', 'personnel')
+    list_filter = ('start_date', 'end_date', ('personnel', AutocompleteListFilter))
     search_fields = ('workplace', 'position', 'personnel__fullname')
     ordering = ('-start_date',)
     date_hierarchy = 'start_date'
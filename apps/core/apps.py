@@ -6,3 +6,11 @@ class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.core'
     verbose_name = _('Asosiy ma‘lumotlar')
+
+    def ready(self):
+        from django.db.models.indexes import IndexExpression
+        from .indexes import PrefixSearchKey
+
+        # Meta.indexes dagi PrefixSearchKey collation/opclass kabi ifodadan tashqarida yoziladi
+        if PrefixSearchKey not in IndexExpression.wrapper_classes:
+            IndexExpression.register_wrappers(*IndexExpression.wrapper_classes, PrefixSearchKey)
@@ -0,0 +1,85 @@
+from django import forms
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.admin.views.main import PAGE_VAR
+from django.contrib.admin.widgets import get_select2_language
+from django.urls import reverse
+
+from . import reference
+
+
+class ReferenceListFilter(admin.RelatedFieldListFilter):
+    """ReferenceModel bo'yicha yon panel filtri, tanlovlar ma'lumotnoma keshidan olinadi"""
+
+    def field_choices(self, field, request, model_admin):
+        return list(reference.get_table(field.related_model))
+
+
+class AutocompleteListFilter(admin.RelatedFieldListFilter):
+    """
+    Ko'p qatorli bog'langan jadvallar (xodim, foydalanuvchi) uchun yon panel filtri.
+    Har bir qator uchun havola o'rniga select2 qidiruv maydoni chiqariladi: sahifa faqat
+    tanlangan qiymatni o'qiydi, qolganlari admin:autocomplete orqali yozilganda olinadi.
+    Bog'langan model adminida search_fields bo'lishi, ModelAdmin esa AutocompleteFilterMixin
+    bilan select2 fayllarini ulashi kerak.
+    """
+    template = 'admin/autocomplete_list_filter.html'
+
+    def field_choices(self, field, request, model_admin):
+        if not self.lookup_val:
+            return []
+        related_model = field.remote_field.model
+        to_field = field.target_field.name
+        objects = related_model._default_manager.filter(**{f'{to_field}__in': self.lookup_val})
+        return [(getattr(obj, to_field), str(obj)) for obj in objects]
+
+    def has_output(self):
+        return True
+
+    def choices(self, changelist):
+        removed = {self.lookup_kwarg, self.lookup_kwarg_isnull, PAGE_VAR}
+        yield {
+            'selected': bool(self.lookup_val),
+            'query_string': changelist.get_query_string(remove=list(removed)),
+            'lookup_kwarg': self.lookup_kwarg,
+            'hidden_params': [
+                (name, value)
+                for name, values in changelist.filter_params.items() if name not in removed
+                for value in values
+            ],
+            'url': reverse('admin:autocomplete', current_app=changelist.model_admin.admin_site.name),
+            'app_label': self.field.model._meta.app_label,
+            'model_name': self.field.model._meta.model_name,
+            'field_name': self.field.name,
+            'selected_choices': self.lookup_choices,
+        }
+
+    @staticmethod
+    def media():
+        extra = '' if settings.DEBUG else '.min'
+        language = get_select2_language()
+        return forms.Media(
+            js=(
+                f'admin/js/vendor/jquery/jquery{extra}.js',
+                f'admin/js/vendor/select2/select2.full{extra}.js',
+                *((f'admin/js/vendor/select2/i18n/{language}.js',) if language else ()),
+                'admin/js/jquery.init.js',
+                'admin/js/autocomplete.js',
+            ),
+            css={
+                'screen': (f'admin/css/vendor/select2/select2{extra}.css', 'admin/css/autocomplete.css'),
+            },
+        )
+
+
+class AutocompleteFilterMixin:
+    """ModelAdmin uchun: list_filter da AutocompleteListFilter bo'lsa select2 fayllarini ulash"""
+
+    @property
+    def media(self):
+        media = super().media
+        for spec in self.list_filter:
+            filter_class = spec[1] if isinstance(spec, (list, tuple)) else spec
+            if isinstance(filter_class, type) and issubclass(filter_class, AutocompleteListFilter):
+                return media + filter_class.media()
+        return media
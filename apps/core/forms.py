@@ -0,0 +1,58 @@
+from django import forms
+from django.forms.models import ModelChoiceIterator
+
+from . import reference
+
+
+class ReferenceChoiceIterator(ModelChoiceIterator):
+    """Tanlovlarni bazadan emas, ma'lumotnoma keshidan olish"""
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        table = reference.get_table(self.queryset.model)
+        # Faolsizlantirilgan, lekin obyektga allaqachon bog'langan qiymat ro'yxatda qoladi
+        if self.field.current in table.inactive:
+            yield (self.field.current, table.get(self.field.current))
+        yield from table
+
+    def __len__(self):
+        table = reference.get_table(self.queryset.model)
+        return len(table) + (self.field.current in table.inactive) + (self.field.empty_label is not None)
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(len(self))
+
+
+class ReferenceChoiceField(forms.ModelChoiceField):
+    """ReferenceModel uchun ModelChoiceField: ro'yxat keshdan, tekshiruv esa odatdagidek bazadan"""
+    iterator = ReferenceChoiceIterator
+    # Obyektning joriy qiymati (ReferenceFormMixin belgilaydi)
+    current = None
+
+    def __init__(self, queryset, **kwargs):
+        # Faolsizlantirilgan yozuvlar yangi tanlov sifatida qabul qilinmaydi
+        super().__init__(queryset.model.limit_to_active(queryset), **kwargs)
+
+    def label_from_instance(self, obj):
+        # Tanlangan qiymat nomi ham keshdan (tuman uchun viloyat so'rovisiz)
+        label = reference.get_table(type(obj)).get(obj.pk)
+        return super().label_from_instance(obj) if label is None else label
+
+    def keep_current(self, value):
+        """Obyektning joriy qiymati faolsizlantirilgan bo'lsa ham tanlovda va tekshiruvda qoladi"""
+        if value in self.empty_values:
+            return
+        model = self.queryset.model
+        self.current = model._meta.pk.to_python(value)
+        self.queryset = self.queryset | model._default_manager.filter(pk=self.current)
+
+
+class ReferenceFormMixin:
+    """ModelForm uchun: ReferenceChoiceField maydonlarida obyektning joriy qiymatini saqlab qolish"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for name, field in self.fields.items():
+            if isinstance(field, ReferenceChoiceField):
+                field.keep_current(self.initial.get(name))
@@ -0,0 +1,35 @@
+from django.db import models
+
+
+class PrefixSearchValue(models.Func):
+    """Indekslanadigan qiymat: PostgreSQL'da istartswith solishtiradigan UPPER(name::text)"""
+    template = 'UPPER((%(expressions)s)::text)'
+    arity = 1
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, template='%(expressions)s', **extra_context)
+
+
+class PrefixSearchKey(models.Func):
+    """
+    name__istartswith qidiruvi uchun indeks ifodasi (Meta.indexes da ishlatiladi):
+
+        models.Index(PrefixSearchKey('name'), name='region_prefix')
+
+    SQLite'da "name COLLATE NOCASE" (LIKE 'x%' shu indeksdan foydalanadi), PostgreSQL'da
+    "(UPPER(name::text)) text_pattern_ops" (UPPER(name::text) LIKE UPPER('x%') uchun).
+    CoreConfig.ready() uni IndexExpression o'ramlari qatoriga qo'shadi (contrib.postgres dagi
+    OpClass kabi), shuning uchun collation/opclass qavslardan tashqarida turadi. Indeks
+    Django'ga ma'lum bo'lgani uchun SQLite jadvalni qayta qurganda ham saqlanadi.
+    """
+    template = '%(expressions)s'
+    arity = 1
+
+    def __init__(self, expression):
+        super().__init__(PrefixSearchValue(expression))
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, template='%(expressions)s COLLATE NOCASE', **extra_context)
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, template='%(expressions)s text_pattern_ops', **extra_context)
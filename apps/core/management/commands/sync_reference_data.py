@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from apps.core.sync import sync_reference_data
+
+
+class Command(BaseCommand):
+    help = "Apply changed seed datasets from data/ (regions, then districts), skipping unchanged ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Apply every dataset even if its checksum has not changed",
+        )
+
+    def handle(self, *args, **options):
+        results = sync_reference_data(force=options["force"], on_skip=self.warn_skipped)
+
+        for name, result in results.items():
+            if result is None:
+                self.stdout.write(f"{name}: unchanged, skipped")
+            else:
+                self.stdout.write(self.style.SUCCESS(f"{name}: {result}"))
+
+    def warn_skipped(self, row):
+        self.stdout.write(
+            self.style.WARNING(f'Skipping "{row["names"]["uz"]}" - Region {row["region_id"]} not found')
+        )
@@ -0,0 +1,45 @@
+# Generated by Django 5.1.6 on 2026-10-17 19:20
+
+import apps.core.indexes
+from django.db import migrations, models
+
+# Admin autocomplete name__istartswith bilan qidiradi:
+# SQLite'da "name LIKE 'x%'" (NOCASE indeks), PostgreSQL'da "UPPER(name::text) LIKE 'X%'"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='academicdegree',
+            index=models.Index(apps.core.indexes.PrefixSearchKey('name'), name='academicdegree_prefix'),
+        ),
+        migrations.AddIndex(
+            model_name='academicspecialization',
+            index=models.Index(apps.core.indexes.PrefixSearchKey('name'), name='academicspecialization_prefix'),
+        ),
+        migrations.AddIndex(
+            model_name='academictitle',
+            index=models.Index(apps.core.indexes.PrefixSearchKey('name'), name='academictitle_prefix'),
+        ),
+        migrations.AddIndex(
+            model_name='district',
+            index=models.Index(apps.core.indexes.PrefixSearchKey('name'), name='district_prefix'),
+        ),
+        migrations.AddIndex(
+            model_name='educationlevel',
+            index=models.Index(apps.core.indexes.PrefixSearchKey('name'), name='educationlevel_prefix'),
+        ),
+        migrations.AddIndex(
+            model_name='nation',
+            index=models.Index(apps.core.indexes.PrefixSearchKey('name'), name='nation_prefix'),
+        ),
+        migrations.AddIndex(
+            model_name='region',
+            index=models.Index(apps.core.indexes.PrefixSearchKey('name'), name='region_prefix'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.6 on 2026-10-17 19:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_name_prefix_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReferenceDataset',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Yaratilgan vaqti')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Yangilangan vaqti')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='To‘plam nomi')),
+                ('checksum', models.CharField(max_length=64, verbose_name='Nazorat yig‘indisi')),
+            ],
+            options={
+                'verbose_name': 'Ma’lumotlar to‘plami',
+                'verbose_name_plural': 'Ma’lumotlar to‘plamlari',
+            },
+        ),
+        migrations.AddField(
+            model_name='district',
+            name='is_active',
+            field=models.BooleanField(default=True, verbose_name='Faol'),
+        ),
+        migrations.AddField(
+            model_name='region',
+            name='is_active',
+            field=models.BooleanField(default=True, verbose_name='Faol'),
+        ),
+    ]
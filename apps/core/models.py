@@ -2,6 +2,8 @@ from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import RegexValidator
+from . import reference
+from .indexes import PrefixSearchKey
 
 phone_validator = RegexValidator(
     regex=r'^\+?998?\d{9}$',
@@ -17,8 +19,59 @@ class BaseModel(models.Model):
         abstract = True
 
 
-class Region(models.Model):
+class ReferenceModel(models.Model):
+    """
+    Kam o'zgaradigan ma'lumotnoma jadvallari uchun asos.
+    Saqlash va o'chirishda apps.core.reference keshidagi versiyani oshiradi.
+    """
+    # Nomi shu jadvalga bog'liq bo'lgan boshqa ma'lumotnomalar
+    reference_dependents = ()
+    # Faollik maydoni: False bo'lgan yozuvlar yangi tanlovlarda chiqmaydi, mavjud bog'lanishlar qoladi
+    reference_active_field = None
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def get_reference_labels(cls):
+        return cls.objects.values_list('pk', 'name')
+
+    @classmethod
+    def get_reference_inactive(cls):
+        """Yangi tanlovlarda chiqmaydigan yozuvlar id lari"""
+        if cls.reference_active_field is None:
+            return ()
+        return cls.objects.filter(**{cls.reference_active_field: False}).values_list('pk', flat=True)
+
+    @classmethod
+    def limit_to_active(cls, queryset):
+        """Yangi tanlovlar uchun faqat faol yozuvlar"""
+        if cls.reference_active_field is None:
+            return queryset
+        return queryset.filter(**{cls.reference_active_field: True})
+
+    @classmethod
+    def invalidate_reference(cls):
+        reference.invalidate(cls)
+        for model in cls.reference_dependents:
+            reference.invalidate(cls._meta.apps.get_model(cls._meta.app_label, model))
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.invalidate_reference()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self.invalidate_reference()
+        return result
+
+
+class Region(ReferenceModel):
     name = models.CharField(_("Viloyat nomi"), max_length=255)
+    is_active = models.BooleanField(_("Faol"), default=True)
+
+    reference_dependents = ('District',)
+    reference_active_field = 'is_active'
 
     def __str__(self):
         return self.name
@@ -27,9 +80,11 @@ class Region(models.Model):
         verbose_name = _("Viloyat")
         verbose_name_plural = _("Viloyatlar")
         ordering = ['name']
+        # Admin autocomplete'i uchun (name__istartswith)
+        indexes = [models.Index(PrefixSearchKey('name'), name='region_prefix')]
 
 
-class District(models.Model):
+class District(ReferenceModel):
     region = models.ForeignKey(
         Region,
         verbose_name=_("Viloyat"),
@@ -37,17 +92,41 @@ class District(models.Model):
         related_name='districts'
     )
     name = models.CharField(_("Tuman nomi"), max_length=255)
+    is_active = models.BooleanField(_("Faol"), default=True)
+
+    reference_active_field = 'is_active'
 
     def __str__(self):
         return f"{self.name}, {self.region.name}"
 
+    @classmethod
+    def get_reference_labels(cls):
+        return (
+            (pk, f"{name}, {region}")
+            for pk, name, region in cls.objects.values_list('pk', 'name', 'region__name')
+        )
+
     class Meta:
         verbose_name = _("Tuman")
         verbose_name_plural = _("Tumanlar")
         ordering = ['region', 'name']
+        indexes = [models.Index(PrefixSearchKey('name'), name='district_prefix')]
+
+
+class ReferenceDataset(BaseModel):
+    """data/ dagi to'plamning oxirgi qo'llangan nazorat yig'indisi (sync_reference_data)"""
+    name = models.CharField(_("To‘plam nomi"), max_length=100, unique=True)
+    checksum = models.CharField(_("Nazorat yig‘indisi"), max_length=64)
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        verbose_name = _("Ma’lumotlar to‘plami")
+        verbose_name_plural = _("Ma’lumotlar to‘plamlari")
 
 
-class Nation(models.Model):
+class Nation(ReferenceModel):
     name = models.CharField(_("Millat nomi"), max_length=255)
 
     def __str__(self):
@@ -57,9 +136,10 @@ class Nation(models.Model):
         verbose_name = _("Millat")
         verbose_name_plural = _("Millatlar")
         ordering = ['name']
+        indexes = [models.Index(PrefixSearchKey('name'), name='nation_prefix')]
 
 
-class EducationLevel(models.Model):
+class EducationLevel(ReferenceModel):
     name = models.CharField(_("Ta’lim darajasi"), max_length=255)
 
     def __str__(self):
@@ -69,9 +149,10 @@ class EducationLevel(models.Model):
         verbose_name = _("Ta’lim darajasi")
         verbose_name_plural = _("Ta’lim darajalari")
         ordering = ['name']
+        indexes = [models.Index(PrefixSearchKey('name'), name='educationlevel_prefix')]
 
 
-class AcademicDegree(models.Model):
+class AcademicDegree(ReferenceModel):
     name = models.CharField(_("Ilmiy daraja nomi"), max_length=255)
 
     def __str__(self):
@@ -81,9 +162,10 @@ class AcademicDegree(models.Model):
         verbose_name = _("Ilmiy daraja")
         verbose_name_plural = _("Ilmiy darajalar")
         ordering = ['name']
+        indexes = [models.Index(PrefixSearchKey('name'), name='academicdegree_prefix')]
 
 
-class AcademicSpecialization(models.Model):
+class AcademicSpecialization(ReferenceModel):
     name = models.CharField(_("Ilmiy yo‘nalish nomi"), max_length=255)
 
     def __str__(self):
@@ -93,9 +175,10 @@ class AcademicSpecialization(models.Model):
         verbose_name = _("Ilmiy yo‘nalish")
         verbose_name_plural = _("Ilmiy yo‘nalishlar")
         ordering = ['name']
+        indexes = [models.Index(PrefixSearchKey('name'), name='academicspecialization_prefix')]
 
 
-class AcademicTitle(models.Model):
+class AcademicTitle(ReferenceModel):
     name = models.CharField(_("Ilmiy unvon nomi"), max_length=255)
 
     def __str__(self):
@@ -105,6 +188,7 @@ class AcademicTitle(models.Model):
         verbose_name = _("Ilmiy unvon")
         verbose_name_plural = _("Ilmiy unvonlar")
         ordering = ['name']
+        indexes = [models.Index(PrefixSearchKey('name'), name='academictitle_prefix')]
 
 
 class LanguageProficiency(models.Model):
@@ -0,0 +1,94 @@
+"""
+Ma'lumotnoma jadvallari (viloyat, tuman, millat va h.k.) uchun jarayon ichidagi kesh.
+
+Har bir jadval bir marta o'qiladi va id -> nom lug'ati sifatida xotirada saqlanadi.
+Eskirganligi umumiy keshdagi (settings.CACHES, standart DatabaseCache) versiya kaliti orqali
+aniqlanadi: ReferenceModel.save()/delete() versiyani oshiradi, shuning uchun barcha worker'lar
+keyingi murojaatda jadvalni qayta o'qiydi.
+"""
+import time
+
+from django.core.cache import cache
+
+VERSION_KEY = 'reference-version:%s'
+
+# model label -> (versiya, ReferenceTable)
+_tables = {}
+
+
+class ReferenceTable:
+    """
+    Tartiblangan (id, nom) juftliklari va id bo'yicha O(1) qidiruv.
+    Faolsizlantirilgan yozuvlar tanlovlar ro'yxatiga kirmaydi, lekin nomi get() orqali
+    olinaveradi (mavjud bog'lanishlar ko'rsatilishi uchun).
+    """
+
+    def __init__(self, items, inactive=()):
+        items = list(items)
+        self.labels = dict(items)
+        self.inactive = set(inactive)
+        self.items = [item for item in items if item[0] not in self.inactive]
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def get(self, pk, default=None):
+        return self.labels.get(pk, default)
+
+
+def new_version():
+    """
+    Boshlang'ich versiya. Kalit keshdan siqib chiqarilsa (DatabaseCache/Redis to'lganda) yangi
+    versiya avvalgilarining hech biriga teng bo'lmasligi uchun 1 emas, joriy vaqt olinadi.
+    """
+    return time.time_ns()
+
+
+def get_key_version(key):
+    """Keshdagi versiya hisoblagichi, kalit yo'q bo'lsa yangisi yoziladi"""
+    version = cache.get(key)
+    if version is None:
+        version = new_version()
+        cache.add(key, version, None)
+        version = cache.get(key, version)
+    return version
+
+
+def bump_key_version(key):
+    """Versiya hisoblagichini oshirish (boshqa jarayonlardagi nusxalar eskiradi)"""
+    cache.add(key, new_version(), None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Kalit add va incr orasida o'chirilgan bo'lsa
+        cache.set(key, new_version(), None)
+
+
+def get_version(model):
+    return get_key_version(VERSION_KEY % model._meta.label_lower)
+
+
+def get_table(model):
+    """Model uchun keshlangan jadval, versiya o'zgargan bo'lsa qayta o'qiladi"""
+    label = model._meta.label_lower
+    version = get_version(model)
+    cached = _tables.get(label)
+    if cached and cached[0] == version:
+        return cached[1]
+    table = ReferenceTable(model.get_reference_labels(), model.get_reference_inactive())
+    _tables[label] = (version, table)
+    return table
+
+
+def get_label(model, pk, default=''):
+    if pk is None:
+        return default
+    return get_table(model).get(pk, default)
+
+
+def invalidate(model):
+    bump_key_version(VERSION_KEY % model._meta.label_lower)
+    _tables.pop(model._meta.label_lower, None)
@@ -0,0 +1,18 @@
+from django.contrib import admin
+from django.urls import path
+
+from .views import PrefixAutocompleteJsonView
+
+
+class AdminSite(admin.AdminSite):
+    """Loyiha admin sayti (config.apps.AdminConfig orqali admin.site sifatida o'rnatiladi)"""
+
+    def get_urls(self):
+        # Standart autocomplete manzili never_cache bilan o'raladi, javob esa qisqa muddat
+        # keshlanadi (PrefixAutocompleteJsonView.cache_timeout), shuning uchun cacheable=True
+        return [
+            path('autocomplete/', self.admin_view(self.autocomplete_view, cacheable=True), name='autocomplete'),
+        ] + super().get_urls()
+
+    def autocomplete_view(self, request):
+        return PrefixAutocompleteJsonView.as_view(admin_site=self)(request)
@@ -0,0 +1,163 @@
+"""
+Ma'lumotnoma jadvallarini data/ dagi boshlang'ich ma'lumotlar bilan sinxronlash.
+
+Jadval bitta so'rov bilan o'qiladi, farq xotirada hisoblanadi va bitta tranzaksiyada
+bulk_create/bulk_update bilan qo'llanadi. O'zgarmagan qatorlar umuman yozilmaydi.
+
+sync_reference_data() esa har bir to'plam faylining xeshini ReferenceDataset da saqlangan
+qiymat bilan solishtiradi va faqat o'zgargan to'plamlarni qo'llaydi.
+"""
+import hashlib
+from dataclasses import dataclass
+
+from django.core.management.color import no_style
+from django.db import connections, router, transaction
+
+import data
+from .models import Region, District, ReferenceDataset
+
+BATCH_SIZE = 500
+
+
+@dataclass
+class SyncResult:
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    orphaned: int = 0
+
+    @property
+    def changed(self):
+        return bool(self.created or self.updated)
+
+    def __str__(self):
+        return (
+            f'{self.created} created, {self.updated} updated, '
+            f'{self.unchanged} unchanged, {self.orphaned} orphaned'
+        )
+
+
+def reset_sequence(model):
+    """Aniq id bilan qo'shilgan qatorlardan keyin PostgreSQL ketma-ketligini to'g'rilash"""
+    connection = connections[router.db_for_write(model)]
+    statements = connection.ops.sequence_reset_sql(no_style(), [model])
+    if statements:
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+
+def sync_table(model, rows, fields):
+    """
+    rows: {id: {maydon: qiymat}} ko'rinishidagi kerakli holat, fields: solishtiriladigan
+    maydonlar (attname). Bazada bor, lekin rows da yo'q qatorlar o'chirilmaydi, faqat sanaladi.
+    """
+    existing = {
+        values[0]: values[1:]
+        for values in model._default_manager.order_by().values_list('pk', *fields)
+    }
+    result = SyncResult(orphaned=len(existing.keys() - rows.keys()))
+    to_create = []
+    to_update = []
+    for pk, values in rows.items():
+        current = existing.get(pk)
+        desired = tuple(values[field] for field in fields)
+        if current is None:
+            to_create.append(model(pk=pk, **values))
+        elif current != desired:
+            to_update.append(model(pk=pk, **values))
+        else:
+            result.unchanged += 1
+
+    if to_create or to_update:
+        with transaction.atomic():
+            if to_create:
+                # Parallel ishga tushirilgan sinxronlash bilan to'qnashuvda yangilanadi
+                model._default_manager.bulk_create(
+                    to_create,
+                    batch_size=BATCH_SIZE,
+                    update_conflicts=True,
+                    unique_fields=['pk'],
+                    update_fields=list(fields),
+                )
+                reset_sequence(model)
+            if to_update:
+                model._default_manager.bulk_update(to_update, list(fields), batch_size=BATCH_SIZE)
+
+    result.created = len(to_create)
+    result.updated = len(to_update)
+    # bulk_* save() ni chaqirmaydi, shuning uchun ma'lumotnoma keshi qo'lda eskirtiriladi
+    if result.changed:
+        model.invalidate_reference()
+    return result
+
+
+def region_rows(on_skip=None):
+    return {
+        row['region_id']: {'name': row['names']['uz'], 'is_active': row.get('active', True)}
+        for row in data.regions
+    }
+
+
+def district_rows(on_skip=None):
+    """Viloyati bazada yo'q tumanlar o'tkazib yuboriladi va on_skip(yozuv) chaqiriladi"""
+    region_ids = set(Region.objects.order_by().values_list('id', flat=True))
+    rows = {}
+    for row in data.districts:
+        if row['region_id'] not in region_ids:
+            if on_skip:
+                on_skip(row)
+            continue
+        rows[row['city_id']] = {
+            'name': row['names']['uz'],
+            'region_id': row['region_id'],
+            'is_active': row.get('active', True),
+        }
+    return rows
+
+
+@dataclass
+class SeedDataset:
+    name: str
+    dataset: data.Dataset
+    model: type
+    fields: tuple
+    build_rows: object
+    depends_on: tuple = ()
+
+    def sync(self, on_skip=None):
+        return sync_table(self.model, self.build_rows(on_skip), self.fields)
+
+
+# Bog'liqlik tartibida: viloyatlar tumanlardan oldin
+SEED_DATASETS = (
+    SeedDataset('regions', data.regions, Region, ('name', 'is_active'), region_rows),
+    SeedDataset(
+        'districts', data.districts, District, ('name', 'region_id', 'is_active'), district_rows,
+        depends_on=('regions',)
+    ),
+)
+
+
+def sync_reference_data(force=False, on_skip=None):
+    """
+    O'zgargan to'plamlarni qo'llash. {nomi: SyncResult yoki None (o'tkazib yuborilgan)} qaytaradi.
+    To'plam xeshi bog'liq to'plamlar xeshini ham o'z ichiga oladi, shuning uchun viloyatlar
+    o'zgarsa tumanlar ham qayta tekshiriladi.
+    """
+    applied = dict(ReferenceDataset.objects.values_list('name', 'checksum'))
+    checksums = {}
+    results = {}
+    for seed in SEED_DATASETS:
+        digest = hashlib.sha256(seed.dataset.checksum().encode())
+        for name in seed.depends_on:
+            digest.update(checksums[name].encode())
+        checksum = checksums[seed.name] = digest.hexdigest()
+
+        if not force and applied.get(seed.name) == checksum:
+            results[seed.name] = None
+            continue
+        with transaction.atomic():
+            results[seed.name] = seed.sync(on_skip)
+            ReferenceDataset.objects.update_or_create(name=seed.name, defaults={'checksum': checksum})
+    return results
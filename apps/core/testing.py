@@ -0,0 +1,46 @@
+"""Ilovalar testlari uchun umumiy yordamchilar"""
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# Admin sahifalari testlarida manifest talab qilinmaydi, fayllar esa xotirada saqlanadi
+TEST_STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.InMemoryStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+# So'rovlar sonini o'lchaydigan testlar uchun: DatabaseCache murojaatlari ilova so'rovlariga qo'shilmaydi
+TEST_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+}
+
+
+class ChangelistQueryCountMixin:
+    """
+    Admin ro'yxatlari qatorlar soniga bog'liq bo'lmagan so'rovlar sonida qolishini tekshirish.
+    assertQueriesPerPage() uchun test klassi create_rows(count) ni aniqlaydi.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.superuser = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password')
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.superuser)
+
+    def create_rows(self, count):
+        raise NotImplementedError
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def assertQueriesPerPage(self, url, expected):
+        self.create_rows(2)
+        self.assertEqual(self.count_queries(url), expected)
+        self.create_rows(10)
+        self.assertEqual(self.count_queries(url), expected)
@@ -1,3 +1,304 @@
-from django.test import TestCase
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+import data
+
+from . import reference
+from .admin import RegionAdmin, DistrictForm
+from .models import Region, District, Nation, ReferenceDataset
+from .testing import TEST_CACHES, TEST_STORAGES, ChangelistQueryCountMixin
+from .widgets import GroupedDistrictSelect
+
+User = get_user_model()
+
+
+@override_settings(STORAGES=TEST_STORAGES, CACHES=TEST_CACHES)
+class ChangelistQueryCountTest(ChangelistQueryCountMixin, TestCase):
+    """Viloyat va tumanlar ro'yxatlari qatorlar soniga bog'liq bo'lmagan so'rovlar sonida qolishi kerak"""
+
+    def setUp(self):
+        super().setUp()
+        self.created = 0
+
+    def create_rows(self, count):
+        self.create_regions(count)
+
+    def create_regions(self, count, districts=2):
+        for _ in range(count):
+            self.created += 1
+            region = Region.objects.create(name=f'Viloyat {self.created}')
+            for number in range(districts):
+                District.objects.create(region=region, name=f'Tuman {self.created}-{number}')
+
+    def test_region_changelist(self):
+        self.assertQueriesPerPage(reverse('admin:core_region_changelist'), 5)
+
+    def test_district_changelist(self):
+        # Viloyat filtri jadvali: nomlar va faolsizlantirilganlar
+        self.assertQueriesPerPage(reverse('admin:core_district_changelist'), 7)
+
+    def test_districts_count_is_sortable(self):
+        self.create_regions(1, districts=1)
+        self.create_regions(1, districts=3)
+        column = RegionAdmin.list_display.index('get_districts_count') + 1
+        response = self.client.get(reverse('admin:core_region_changelist') + f'?o=-{column}')
+        self.assertEqual([region.districts_count for region in response.context['cl'].result_list], [3, 1])
+
+
+class ReferenceCacheTest(TestCase):
+    """Ma'lumotnoma keshi saqlash/o'chirishda yangilanadi"""
+
+    def setUp(self):
+        cache.clear()
+        self.region = Region.objects.create(name='Toshkent viloyati')
+        self.district = District.objects.create(region=self.region, name='Zangiota tumani')
+        self.nation = Nation.objects.create(name='Qozoq')
+
+    def test_labels_are_cached(self):
+        self.assertEqual(reference.get_label(Nation, self.nation.pk), 'Qozoq')
+        # Jadval qayta o'qilmaydi, faqat umumiy keshdagi (DatabaseCache) versiya tekshiriladi
+        with self.assertNumQueries(1):
+            self.assertEqual(reference.get_label(Nation, self.nation.pk), 'Qozoq')
+            self.assertEqual(reference.get_label(Nation, None), '')
+
+    def test_save_and_delete_invalidate(self):
+        self.assertEqual(reference.get_label(District, self.district.pk), 'Zangiota tumani, Toshkent viloyati')
+        self.region.name = 'Toshkent v.'
+        self.region.save()
+        self.assertEqual(reference.get_label(District, self.district.pk), 'Zangiota tumani, Toshkent v.')
+
+        self.nation.delete()
+        self.assertEqual(list(reference.get_table(Nation)), [])
+
+    def test_other_workers_see_new_version(self):
+        self.assertEqual(reference.get_label(Nation, self.nation.pk), 'Qozoq')
+        # Boshqa jarayondagi o'zgarish: faqat umumiy keshdagi versiya oshadi
+        Nation.objects.filter(pk=self.nation.pk).update(name='Qoraqalpoq')
+        cache.incr(reference.VERSION_KEY % Nation._meta.label_lower)
+        self.assertEqual(reference.get_label(Nation, self.nation.pk), 'Qoraqalpoq')
+
+    def test_evicted_version_does_not_repeat(self):
+        key = reference.VERSION_KEY % Nation._meta.label_lower
+        self.assertEqual(reference.get_label(Nation, self.nation.pk), 'Qozoq')
+        version = cache.get(key)
+        # Kalit keshdan siqib chiqarilgan: yangi versiya eski jadval versiyasiga teng emas
+        Nation.objects.filter(pk=self.nation.pk).update(name='Qoraqalpoq')
+        cache.delete(key)
+        self.assertNotEqual(reference.get_version(Nation), version)
+        self.assertEqual(reference.get_label(Nation, self.nation.pk), 'Qoraqalpoq')
+
+
+@override_settings(CACHES=TEST_CACHES)
+class GroupedDistrictSelectTest(TestCase):
+    """Tumanlar viloyatlar bo'yicha guruhlanadi, HTML esa keshdan olinadi"""
+
+    def setUp(self):
+        cache.clear()
+        self.region = Region.objects.create(name='Toshkent viloyati')
+        self.district = District.objects.create(region=self.region, name='Zangiota tumani')
+        other = Region.objects.create(name='Andijon viloyati')
+        District.objects.create(region=other, name='Asaka tumani')
+
+    def test_render_grouped_and_cached(self):
+        widget = GroupedDistrictSelect()
+        html = widget.render('birthplace', self.district.pk)
+        self.assertInHTML(
+            f'<optgroup label="Toshkent viloyati"><option value="{self.district.pk}" selected>Zangiota tumani</option></optgroup>',
+            html
+        )
+        self.assertLess(html.index('Andijon viloyati'), html.index('Toshkent viloyati'))
+        with self.assertNumQueries(0):
+            html = widget.render('place_of_residence', None)
+        self.assertNotIn('selected', html)
+
+    def test_region_change_invalidates(self):
+        widget = GroupedDistrictSelect()
+        widget.render('birthplace', None)
+        self.region.name = 'Toshkent v.'
+        self.region.save()
+        self.assertIn('label="Toshkent v."', widget.render('birthplace', None))
+
+    def test_deactivated_district_is_kept_only_when_selected(self):
+        self.district.is_active = False
+        self.district.save()
+        widget = GroupedDistrictSelect()
+        self.assertNotIn('Zangiota', widget.render('birthplace', None))
+        self.assertInHTML(
+            f'<option value="{self.district.pk}" selected>Zangiota tumani, Toshkent viloyati</option>',
+            widget.render('birthplace', self.district.pk)
+        )
+
+    def test_deactivated_region_is_kept_for_existing_district(self):
+        self.region.is_active = False
+        self.region.save()
+        self.assertNotIn(self.region.pk, dict(reference.get_table(Region)))
+        self.assertEqual(reference.get_label(Region, self.region.pk), 'Toshkent viloyati')
+
+        data = {'region': self.region.pk, 'name': 'Zangiota tumani', 'is_active': True}
+        self.assertTrue(DistrictForm(data, instance=self.district).is_valid())
+        form = DistrictForm(data)
+        self.assertFalse(form.is_valid())
+        self.assertIn('region', form.errors)
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class AutocompleteViewTest(TestCase):
+    """Admin autocomplete prefiks bo'yicha qidiradi va COUNT(*) so'rovisiz sahifalaydi"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        region = Region.objects.create(name='Toshkent viloyati')
+        District.objects.bulk_create(
+            [District(region=region, name=f'Tuman {number:02}') for number in range(25)]
+            + [District(region=region, name='Zangiota tumani')]
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.superuser)
+
+    def autocomplete(self, term, page=1):
+        return self.client.get(reverse('admin:autocomplete'), {
+            'app_label': 'personnel', 'model_name': 'employee', 'field_name': 'birthplace',
+            'term': term, 'page': page,
+        })
+
+    def test_prefix_search(self):
+        response = self.autocomplete('zang')
+        self.assertEqual(response.json()['results'], [{
+            'id': str(District.objects.get(name='Zangiota tumani').pk),
+            'text': 'Zangiota tumani, Toshkent viloyati',
+        }])
+        # Ichki mos kelishlar (icontains) qaytarilmaydi
+        self.assertEqual(self.autocomplete('tumani').json()['results'], [])
+        self.assertIn('max-age=60', response['Cache-Control'])
+
+    def test_pagination_without_count(self):
+        self.autocomplete('')
+        with CaptureQueriesContext(connection) as context:
+            data = self.autocomplete('tuman').json()
+        self.assertEqual(len(data['results']), 20)
+        self.assertTrue(data['pagination']['more'])
+        self.assertFalse([query for query in context.captured_queries if 'COUNT(' in query['sql']])
+
+        data = self.autocomplete('tuman', page=2).json()
+        self.assertEqual(len(data['results']), 5)
+        self.assertFalse(data['pagination']['more'])
+
+    def test_deactivated_district_is_hidden(self):
+        district = District.objects.get(name='Zangiota tumani')
+        district.is_active = False
+        district.save()
+        self.assertEqual(self.autocomplete('zang').json()['results'], [])
+
+
+class SyncCommandsTest(TestCase):
+    """sync_regions/sync_districts faqat farqni yozadi va qisqa hisobot chiqaradi"""
+
+    def sync(self, command):
+        out = StringIO()
+        call_command(command, stdout=out)
+        return out.getvalue()
+
+    def test_sync_is_idempotent(self):
+        self.assertIn('14 created, 0 updated, 0 unchanged, 0 orphaned', self.sync('sync_regions'))
+        self.assertIn('200 created, 0 updated, 0 unchanged, 0 orphaned', self.sync('sync_districts'))
+
+        # Qayta ishga tushirishda faqat o'qish so'rovlari bajariladi
+        with self.assertNumQueries(2):
+            self.assertIn('0 created, 0 updated, 200 unchanged, 0 orphaned', self.sync('sync_districts'))
+
+    def test_updates_changed_rows_and_counts_orphans(self):
+        self.sync('sync_regions')
+        self.sync('sync_districts')
+        district = District.objects.get(pk=1)
+        district.name = 'Eski nom'
+        district.save()
+        District.objects.create(pk=10000, region=district.region, name='Qo‘lda qo‘shilgan')
+
+        self.assertIn('0 created, 1 updated, 199 unchanged, 1 orphaned', self.sync('sync_districts'))
+        self.assertEqual(District.objects.get(pk=1).name, 'Amudaryo tuman')
+        self.assertEqual(reference.get_label(District, 1), 'Amudaryo tuman, Qoraqalpog‘iston Respublikasi')
+
+
+class SeedDatasetTest(TestCase):
+    """data/ to'plamlari faqat murojaat qilinganda o'qiladi"""
+
+    def test_indexed_access(self):
+        dataset = data.Dataset('districts', 'city_id', 'districts/districts.jsonl')
+        self.assertIsNone(dataset._index)
+        self.assertEqual(dataset.get(1)['names']['uz'], 'Amudaryo tuman')
+        self.assertEqual(len(dataset), 200)
+        karakalpakstan = dataset.filter(region_id=2)
+        self.assertTrue(karakalpakstan)
+        self.assertTrue(all(row['region_id'] == 2 for row in karakalpakstan))
+        self.assertEqual(data.regions.get(2)['names']['uz'], 'Qoraqalpog‘iston Respublikasi')
+
+
+class SyncReferenceDataTest(TestCase):
+    """sync_reference_data o'zgarmagan to'plamlarni o'tkazib yuboradi"""
+
+    def sync(self, *args):
+        out = StringIO()
+        call_command('sync_reference_data', *args, stdout=out)
+        return out.getvalue()
+
+    def test_skips_unchanged_datasets(self):
+        output = self.sync()
+        self.assertIn('regions: 14 created', output)
+        self.assertIn('districts: 200 created', output)
+        self.assertEqual(ReferenceDataset.objects.count(), 2)
+
+        with self.assertNumQueries(1):
+            output = self.sync()
+        self.assertIn('regions: unchanged, skipped', output)
+        self.assertIn('districts: unchanged, skipped', output)
+
+        self.assertIn('districts: 0 created, 0 updated, 200 unchanged', self.sync('--force'))
+
+    def test_region_change_rechecks_districts(self):
+        self.sync()
+        ReferenceDataset.objects.filter(name='regions').update(checksum='old')
+        with mock.patch.object(data.Dataset, 'checksum', side_effect=['changed', data.districts.checksum()]):
+            output = self.sync()
+        self.assertIn('regions: 0 created, 0 updated, 14 unchanged', output)
+        self.assertIn('districts: 0 created, 0 updated, 200 unchanged', output)
+
+    def test_inactive_rows_are_deactivated(self):
+        self.sync()
+        inactive = dict(data.districts.get(1), active=False)
+        rows = [inactive if row['city_id'] == 1 else row for row in data.districts]
+        with mock.patch.object(data.Dataset, '__iter__', side_effect=[iter(data.regions.index.values()), iter(rows)]), \
+                mock.patch.object(data.Dataset, 'checksum', side_effect=['regions', 'districts']):
+            self.assertIn('districts: 0 created, 1 updated', self.sync())
+        self.assertFalse(District.objects.get(pk=1).is_active)
+        self.assertTrue(District.objects.filter(pk=1).exists())
+
+
+class NamePrefixIndexTest(TestCase):
+    """name__istartswith indekslari (Meta.indexes) SQLite'da jadval qayta qurilganda ham saqlanadi"""
+
+    def index_names(self, table):
+        # Ifoda indekslari introspection.get_constraints() da SQLite uchun ko'rinmaydi
+        if connection.vendor == 'postgresql':
+            sql = 'SELECT indexname FROM pg_indexes WHERE tablename = %s'
+        else:
+            sql = "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = %s"
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [table])
+            return {row[0] for row in cursor.fetchall()}
+
+    def test_indexes_exist(self):
+        for table, name in [
+            ('core_region', 'region_prefix'), ('core_district', 'district_prefix'), ('core_nation', 'nation_prefix'),
+        ]:
+            self.assertIn(name, self.index_names(table))
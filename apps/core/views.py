@@ -1,3 +1,72 @@
-from django.shortcuts import render
+from functools import reduce
+from operator import or_
 
-# Create your views here.
+from django.contrib.admin.views.autocomplete import AutocompleteJsonView
+from django.core.exceptions import PermissionDenied
+from django.db.models import Q
+from django.http import JsonResponse
+from django.utils.cache import patch_cache_control
+
+from . import reference
+from .models import ReferenceModel
+
+
+class PrefixAutocompleteJsonView(AutocompleteJsonView):
+    """
+    Admin autocomplete_fields uchun javob.
+
+    ModelAdmin.autocomplete_prefix_fields berilgan bo'lsa qidiruv search_fields bo'yicha
+    icontains o'rniga indekslangan prefiks (istartswith) bilan bajariladi. Sahifa COUNT(*)
+    so'rovisiz, bitta ortiqcha qator olish orqali aniqlanadi, javob esa brauzerda qisqa
+    muddat keshlanadi.
+    """
+    paginate_by = 20
+    cache_timeout = 60
+
+    def get(self, request, *args, **kwargs):
+        self.term, self.model_admin, self.source_field, to_field_name = self.process_request(request)
+        if not self.has_perm(request):
+            raise PermissionDenied
+
+        try:
+            page = max(int(request.GET.get('page', 1)), 1)
+        except ValueError:
+            page = 1
+        offset = (page - 1) * self.paginate_by
+        objects = list(self.get_queryset()[offset:offset + self.paginate_by + 1])
+
+        response = JsonResponse({
+            'results': [self.serialize_result(obj, to_field_name) for obj in objects[:self.paginate_by]],
+            'pagination': {'more': len(objects) > self.paginate_by},
+        })
+        patch_cache_control(response, private=True, max_age=self.cache_timeout)
+        return response
+
+    def get_queryset(self):
+        queryset = self.get_search_queryset()
+        # Faolsizlantirilgan ma'lumotnomalar yangi tanlov sifatida taklif qilinmaydi
+        if issubclass(queryset.model, ReferenceModel):
+            queryset = queryset.model.limit_to_active(queryset)
+        return queryset
+
+    def get_search_queryset(self):
+        prefix_fields = getattr(self.model_admin, 'autocomplete_prefix_fields', ())
+        if not prefix_fields:
+            return super().get_queryset()
+
+        queryset = self.model_admin.get_queryset(self.request)
+        queryset = queryset.complex_filter(self.source_field.get_limit_choices_to())
+        term = self.term.strip()
+        if term:
+            queryset = queryset.filter(reduce(or_, (
+                Q(**{f'{field}__istartswith': term}) for field in prefix_fields
+            )))
+        return queryset
+
+    def serialize_result(self, obj, to_field_name):
+        # Ma'lumotnomalar nomi keshdan olinadi (masalan, tuman nomi uchun viloyat so'rovisiz)
+        if isinstance(obj, ReferenceModel) and to_field_name == obj._meta.pk.attname:
+            label = reference.get_table(type(obj)).get(obj.pk)
+            if label is not None:
+                return {'id': str(obj.pk), 'text': label}
+        return super().serialize_result(obj, to_field_name)
@@ -0,0 +1,70 @@
+from django import forms
+from django.forms.utils import flatatt
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+from . import reference
+from .models import District
+
+# (til, versiya) -> tayyor <optgroup> HTML
+_rendered = {}
+
+
+def render_district_options():
+    """Faol tumanlarni viloyatlar bo'yicha guruhlab bitta JOIN so'rovi bilan chiqarish"""
+    groups = {}
+    rows = District.limit_to_active(District.objects).order_by('region__name', 'name').values_list(
+        'pk', 'name', 'region__name'
+    )
+    for pk, name, region in rows:
+        groups.setdefault(region, []).append((pk, name))
+    return format_html_join(
+        '', '<optgroup label="{}">{}</optgroup>',
+        (
+            (region, format_html_join('', '<option value="{}">{}</option>', districts))
+            for region, districts in groups.items()
+        )
+    )
+
+
+def get_district_options():
+    """Til va District versiyasi bo'yicha keshlangan HTML (Region o'zgarsa District versiyasi ham oshadi)"""
+    key = (get_language(), reference.get_version(District))
+    options = _rendered.get(key)
+    if options is None:
+        options = render_district_options()
+        # Eski versiyalarni saqlab o'tirmaslik uchun
+        for stale in [cached for cached in _rendered if cached[0] == key[0]]:
+            del _rendered[stale]
+        _rendered[key] = options
+    return options
+
+
+class GroupedDistrictSelect(forms.Select):
+    """
+    Tumanlarni viloyatlar bo'yicha <optgroup> ko'rinishida chiqaradigan select.
+    Variantlar har safar shablon orqali emas, keshdagi tayyor HTML dan olinadi,
+    tanlangan qiymat esa faqat belgilab qo'yiladi. Faolsizlantirilgan tuman ro'yxatda
+    yo'q, lekin obyektga bog'langan bo'lsa alohida variant sifatida qo'shiladi.
+    """
+
+    def render(self, name, value, attrs=None, renderer=None):
+        final_attrs = self.build_attrs(self.attrs, attrs)
+        selected = [str(v) for v in self.format_value(value) if v != '']
+        options = get_district_options()
+        for pk in selected:
+            option = f'<option value="{pk}">'
+            if option in options:
+                options = options.replace(option, f'<option value="{pk}" selected>', 1)
+            elif pk.isdigit():
+                label = reference.get_label(District, int(pk), pk)
+                options = format_html('<option value="{}" selected>{}</option>', pk, label) + options
+
+        empty_label = getattr(getattr(self.choices, 'field', None), 'empty_label', None)
+        if empty_label is not None:
+            empty = format_html(
+                '<option value=""{}>{}</option>', mark_safe(' selected') if not selected else '', empty_label
+            )
+            options = empty + options
+        return format_html('<select name="{}"{}>{}</select>', name, flatatt(final_attrs), mark_safe(options))
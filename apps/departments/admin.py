@@ -1,7 +1,10 @@
 from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
-from django.db.models import Count, Sum
+from django.db.models import Count, F, Sum, IntegerField, ExpressionWrapper
+from django.db.models.functions import Coalesce, NullIf
 from .models import DepartmentType, Department, Position
+from .filters import DepartmentListFilter, FillRateListFilter
+from apps.core.filters import ReferenceListFilter
 
 @admin.register(DepartmentType)
 class DepartmentTypeAdmin(admin.ModelAdmin):
@@ -9,9 +12,13 @@ class DepartmentTypeAdmin(admin.ModelAdmin):
     search_fields = ('name',)
     ordering = ('name',)
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(departments_count=Count('departments'))
+
     def get_departments_count(self, obj):
-        return obj.departments.count()
+        return obj.departments_count
     get_departments_count.short_description = _("Bo‘limlar soni")
+    get_departments_count.admin_order_field = 'departments_count'
 
 class PositionInline(admin.TabularInline):
     model = Position
@@ -23,25 +30,36 @@ class PositionInline(admin.TabularInline):
 @admin.register(Department)
 class DepartmentAdmin(admin.ModelAdmin):
     list_display = ('name', 'type', 'get_positions_count', 'get_total_jobs')
-    list_filter = ('type',)
+    list_filter = (('type', ReferenceListFilter),)
     search_fields = ('name', 'type__name')
     ordering = ('type', 'name')
     inlines = [PositionInline]
     autocomplete_fields = ['type']
+    list_select_related = ('type',)
+
+    def get_queryset(self, request):
+        # Ikkala agregat ham bitta positions JOIN ustida, qatorlar ko'payib ketmaydi
+        return super().get_queryset(request).annotate(
+            positions_count=Count('positions'),
+            total_jobs=Coalesce(Sum('positions__number_of_jobs'), 0)
+        )
 
     def get_positions_count(self, obj):
-        return obj.positions.count()
+        return obj.positions_count
     get_positions_count.short_description = _("Lavozimlar soni")
+    get_positions_count.admin_order_field = 'positions_count'
 
     def get_total_jobs(self, obj):
-        return obj.positions.aggregate(total=Sum('number_of_jobs'))['total'] or 0
+        return obj.total_jobs
     get_total_jobs.short_description = _("Jami shtat birliklari")
+    get_total_jobs.admin_order_field = 'total_jobs'
 
 @admin.register(Position)
 class PositionAdmin(admin.ModelAdmin):
-    list_display = ('name', 'department', 'number_of_jobs', 'get_employees_count')
-    list_filter = ('department', 'department__type')
+    list_display = ('name', 'department', 'number_of_jobs', 'get_employees_count', 'candidate_count')
+    list_filter = (FillRateListFilter, ('department', DepartmentListFilter), ('department__type', ReferenceListFilter))
     search_fields = ('name', 'department__name')
+    autocomplete_prefix_fields = ('name',)
     ordering = ('department', 'name')
     autocomplete_fields = ['department']
 
@@ -60,15 +78,20 @@ class PositionAdmin(admin.ModelAdmin):
             'department', 
             'department__type'
         ).annotate(
-            employees_count=Count('personnel')
+            # Band o'rinlar foizi, hisoblagichlardan qator ichida hisoblanadi
+            fill_rate=ExpressionWrapper(
+                (F('working_count') + F('vacation_count')) * 100 / NullIf(F('number_of_jobs'), 0),
+                output_field=IntegerField()
+            )
         )
 
     def get_employees_count(self, obj):
-        count = getattr(obj, 'employees_count', 0)
+        count = obj.occupied_count
         if count > obj.number_of_jobs:
             return f"{count} / {obj.number_of_jobs} ⚠️"
         return f"{count} / {obj.number_of_jobs}"
     get_employees_count.short_description = _("Band/Jami")
+    get_employees_count.admin_order_field = 'fill_rate'
 
     class Media:
         css = {
@@ -0,0 +1,40 @@
+from django.contrib import admin
+from django.db.models import F
+from django.utils.translation import gettext_lazy as _
+
+
+class DepartmentListFilter(admin.RelatedFieldListFilter):
+    """Bo'lim filtri: Department.__str__ type.name ni o'qiydi, shuning uchun bitta JOIN bilan yuklaymiz"""
+
+    def field_choices(self, field, request, model_admin):
+        ordering = self.field_admin_ordering(field, request, model_admin)
+        queryset = field.related_model._default_manager.select_related('type')
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+        return [(obj.pk, str(obj)) for obj in queryset]
+
+
+class FillRateListFilter(admin.SimpleListFilter):
+    """Lavozimlarni band shtat birliklari bo'yicha filtrlash (hisoblagichlar orqali, agregatsiyasiz)"""
+    title = _('Bandlik')
+    parameter_name = 'fill'
+
+    def lookups(self, request, model_admin):
+        return (
+            ('empty', _('Bo‘sh')),
+            ('vacant', _('Bo‘sh o‘rin bor')),
+            ('full', _('To‘lgan')),
+            ('over', _('Shtatdan ortiq')),
+        )
+
+    def queryset(self, request, queryset):
+        occupied = F('working_count') + F('vacation_count')
+        if self.value() == 'empty':
+            return queryset.filter(working_count=0, vacation_count=0)
+        if self.value() == 'vacant':
+            return queryset.alias(occupied=occupied).filter(occupied__lt=F('number_of_jobs'))
+        if self.value() == 'full':
+            return queryset.alias(occupied=occupied).filter(occupied=F('number_of_jobs'))
+        if self.value() == 'over':
+            return queryset.alias(occupied=occupied).filter(occupied__gt=F('number_of_jobs'))
+        return queryset
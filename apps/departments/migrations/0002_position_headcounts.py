@@ -0,0 +1,57 @@
+# Generated by Django 5.1.6 on 2026-10-17 18:59
+
+from django.db import migrations, models
+from django.db.models import Count
+
+COUNTER_FIELDS = {
+    ('EMPLOYEE', 'working'): 'working_count',
+    ('EMPLOYEE', 'vacation'): 'vacation_count',
+    ('CANDIDATE', 'submitted'): 'candidate_count',
+    ('CANDIDATE', 'accepted'): 'candidate_count',
+}
+
+
+def fill_headcounts(apps, schema_editor):
+    Personnel = apps.get_model('personnel', 'Personnel')
+    Position = apps.get_model('departments', 'Position')
+
+    counts = {}
+    rows = (
+        Personnel.objects.order_by()
+        .values_list('position_id', 'type', 'status')
+        .annotate(count=Count('pk'))
+    )
+    for position_id, type, status, count in rows:
+        field = COUNTER_FIELDS.get((type, status))
+        if field:
+            position_counts = counts.setdefault(position_id, {})
+            position_counts[field] = position_counts.get(field, 0) + count
+    for position_id, values in counts.items():
+        Position.objects.filter(pk=position_id).update(**values)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0001_initial'),
+        ('personnel', '0005_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='position',
+            name='candidate_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Faol nomzodlar'),
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='vacation_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Ta’tildagi xodimlar'),
+        ),
+        migrations.AddField(
+            model_name='position',
+            name='working_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Ishlayotgan xodimlar'),
+        ),
+        migrations.RunPython(fill_headcounts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-17 19:20
+
+import apps.core.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0002_position_headcounts'),
+    ]
+
+    operations = [
+        # Lavozimlar autocomplete'i uchun name__istartswith indeksi (core 0003 bilan bir xil)
+        migrations.AddIndex(
+            model_name='position',
+            index=models.Index(apps.core.indexes.PrefixSearchKey('name'), name='position_prefix'),
+        ),
+    ]
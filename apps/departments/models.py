@@ -1,8 +1,10 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
+from apps.core.indexes import PrefixSearchKey
+from apps.core.models import ReferenceModel
 
-class DepartmentType(models.Model):
+class DepartmentType(ReferenceModel):
     name = models.CharField(_("Bo‘lim turi"), max_length=255)
 
     def __str__(self):
@@ -44,6 +46,11 @@ class Position(models.Model):
         help_text=_("Ushbu lavozimdagi mavjud shtat birliklari soni")
     )
 
+    # Personnel saqlanganda yangilanadigan hisoblagichlar (apps.personnel.headcount)
+    working_count = models.PositiveIntegerField(_("Ishlayotgan xodimlar"), default=0, editable=False)
+    vacation_count = models.PositiveIntegerField(_("Ta’tildagi xodimlar"), default=0, editable=False)
+    candidate_count = models.PositiveIntegerField(_("Faol nomzodlar"), default=0, editable=False)
+
     def __str__(self):
         return f"{self.name} ({self.department.name})"
 
@@ -52,6 +59,13 @@ class Position(models.Model):
         verbose_name_plural = _("Lavozimlar")
         ordering = ['department', 'name']
         unique_together = ['department', 'name']
+        # Admin autocomplete'i uchun (name__istartswith)
+        indexes = [models.Index(PrefixSearchKey('name'), name='position_prefix')]
+
+    @property
+    def occupied_count(self):
+        """Band shtat birliklari (ishlayotgan va ta'tildagi xodimlar)"""
+        return self.working_count + self.vacation_count
 
     def clean(self):
         if self.number_of_jobs < 1:
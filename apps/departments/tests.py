@@ -1,3 +1,82 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
 
-# Create your tests here.
+from apps.core.testing import TEST_CACHES, TEST_STORAGES, ChangelistQueryCountMixin
+from .admin import DepartmentAdmin, PositionAdmin
+from .models import DepartmentType, Department, Position
+
+User = get_user_model()
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class PositionAdminTest(TestCase):
+    """Lavozimlar ro'yxati hisoblagichlar bo'yicha saralanadi va filtrlanadi"""
+
+    @classmethod
+    def setUpTestData(cls):
+        department = Department.objects.create(
+            type=DepartmentType.objects.create(name='Markaziy apparat'), name='Kadrlar bo‘limi'
+        )
+        cls.empty = Position.objects.create(department=department, name='Bo‘sh', number_of_jobs=2)
+        cls.vacant = Position.objects.create(
+            department=department, name='Yarim', number_of_jobs=4, working_count=1, vacation_count=1
+        )
+        cls.over = Position.objects.create(department=department, name='Ortiq', number_of_jobs=1, working_count=2)
+        cls.superuser = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+
+    def setUp(self):
+        self.client.force_login(self.superuser)
+
+    def get_positions(self, query_string):
+        response = self.client.get(reverse('admin:departments_position_changelist') + query_string)
+        self.assertEqual(response.status_code, 200)
+        return list(response.context['cl'].result_list)
+
+    def test_order_by_fill_rate(self):
+        column = PositionAdmin.list_display.index('get_employees_count') + 1
+        self.assertEqual(self.get_positions(f'?o={column}'), [self.empty, self.vacant, self.over])
+
+    def test_fill_filter(self):
+        self.assertEqual(self.get_positions('?fill=empty'), [self.empty])
+        self.assertEqual(self.get_positions('?fill=vacant'), [self.empty, self.vacant])
+        self.assertEqual(self.get_positions('?fill=over'), [self.over])
+
+
+@override_settings(STORAGES=TEST_STORAGES, CACHES=TEST_CACHES)
+class ChangelistQueryCountTest(ChangelistQueryCountMixin, TestCase):
+    """Bo'limlar ro'yxatlari qatorlar soniga bog'liq bo'lmagan so'rovlar sonida qolishi kerak"""
+
+    def setUp(self):
+        super().setUp()
+        self.created = 0
+
+    def create_rows(self, count):
+        self.create_departments(count)
+
+    def create_departments(self, count):
+        for _ in range(count):
+            self.created += 1
+            department_type = DepartmentType.objects.create(name=f'Tur {self.created}')
+            department = Department.objects.create(type=department_type, name=f'Bo‘lim {self.created}')
+            for number in range(2):
+                Position.objects.create(department=department, name=f'Lavozim {number}', number_of_jobs=3)
+
+    def test_department_type_changelist(self):
+        self.assertQueriesPerPage(reverse('admin:departments_departmenttype_changelist'), 5)
+
+    def test_department_changelist(self):
+        self.assertQueriesPerPage(reverse('admin:departments_department_changelist'), 6)
+
+    def test_position_changelist(self):
+        self.assertQueriesPerPage(reverse('admin:departments_position_changelist'), 7)
+
+    def test_department_annotations_are_sortable(self):
+        self.create_departments(1)
+        Position.objects.create(department=Department.objects.get(), name='Qo‘shimcha', number_of_jobs=4)
+        self.create_departments(1)
+        column = DepartmentAdmin.list_display.index('get_total_jobs') + 1
+        response = self.client.get(reverse('admin:departments_department_changelist') + f'?o=-{column}')
+        departments = response.context['cl'].result_list
+        self.assertEqual([d.total_jobs for d in departments], [10, 6])
+        self.assertEqual([d.positions_count for d in departments], [3, 2])
@@ -0,0 +1,43 @@
+from django.contrib import admin, messages
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ('__str__', 'status', 'get_progress', 'attempts', 'created_by', 'created_at', 'updated_at')
+    list_filter = ('status', 'name')
+    search_fields = ('name',)
+    list_select_related = ('created_by',)
+    date_hierarchy = 'created_at'
+    actions = ['retry']
+    readonly_fields = (
+        'name', 'payload', 'status', 'run_at', 'attempts', 'max_attempts', 'progress', 'progress_total',
+        'result', 'error', 'locked_by', 'locked_at', 'created_by', 'created_at', 'updated_at',
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        # Faqat ko'rish (o'zgartirish sahifasi readonly ko'rinishda ochiladi)
+        return False
+
+    def get_progress(self, obj):
+        return obj.progress_display
+    get_progress.short_description = _("Bajarilishi")
+
+    def retry(self, request, queryset):
+        """Xatolik bilan tugagan vazifalarni qayta navbatga qo'yish"""
+        count = queryset.filter(status=Job.FAILED).update(
+            status=Job.QUEUED, attempts=0, run_at=timezone.now(), error='', updated_at=timezone.now()
+        )
+        messages.success(request, _("%(count)d ta vazifa qayta navbatga qo'yildi.") % {'count': count})
+    retry.short_description = _("Qayta navbatga qo'yish")
+    # Qayta navbatga qo'yish import/o'tkazish kabi vazifalarni qayta bajaradi: ko'rish huquqi yetmaydi
+    retry.allowed_permissions = ('retry',)
+
+    def has_retry_permission(self, request):
+        return request.user.has_perm(f'{self.opts.app_label}.retry_job')
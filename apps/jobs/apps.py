@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+from django.utils.translation import gettext_lazy as _
+
+
+class JobsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.jobs'
+    verbose_name = _('Fon vazifalari')
+
+    def ready(self):
+        # Har bir ilovadagi jobs.py modulida @task bilan ro'yxatga olingan vazifalar
+        autodiscover_modules('jobs')
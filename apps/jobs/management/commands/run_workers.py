@@ -0,0 +1,92 @@
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from apps.jobs.queue import requeue_stale, work
+
+
+def run_process(worker_id, names, once, poll_interval):
+    """Alohida jarayondagi ishchi (spawn rejimida Django qayta sozlanadi)"""
+    import django
+    django.setup()
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *args: stop.set())
+    work(worker_id, names=names, once=once, stop=stop, poll_interval=poll_interval)
+
+
+class Command(BaseCommand):
+    help = "Run background job workers in a thread or process pool"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=2)
+        parser.add_argument('--mode', choices=['thread', 'process'], default='thread')
+        parser.add_argument('--job', action='append', dest='names', help='Only run jobs with this name')
+        parser.add_argument('--once', action='store_true', help='Exit when the queue is empty')
+        parser.add_argument('--poll-interval', type=float, default=1.0)
+        parser.add_argument(
+            '--stale-minutes',
+            type=int,
+            default=10,
+            help='Requeue running jobs without a heartbeat for this long (crashed workers)',
+        )
+
+    def handle(self, *args, **options):
+        requeued = requeue_stale(timedelta(minutes=options['stale_minutes']))
+        if requeued:
+            self.stdout.write(self.style.WARNING(f'Requeued {requeued} stale jobs'))
+
+        prefix = f'{socket.gethostname()}:{os.getpid()}'
+        worker_ids = [f'{prefix}:{number}' for number in range(options['concurrency'])]
+        if options['mode'] == 'process':
+            self.run_processes(worker_ids, options)
+        else:
+            self.run_threads(worker_ids, options)
+        self.stdout.write(self.style.SUCCESS('Workers stopped'))
+
+    def run_threads(self, worker_ids, options):
+        stop = threading.Event()
+        processed = []
+
+        def target(worker_id):
+            processed.append(work(
+                worker_id, names=options['names'], once=options['once'],
+                stop=stop, poll_interval=options['poll_interval'],
+            ))
+
+        threads = [threading.Thread(target=target, args=(worker_id,)) for worker_id in worker_ids]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        except KeyboardInterrupt:
+            stop.set()
+            for thread in threads:
+                thread.join()
+        self.stdout.write(f'Processed {sum(processed)} jobs')
+
+    def run_processes(self, worker_ids, options):
+        # Ochiq ulanishlar fork qilingan jarayonlarga o'tmasligi uchun
+        connections.close_all()
+        processes = [
+            multiprocessing.Process(
+                target=run_process,
+                args=(worker_id, options['names'], options['once'], options['poll_interval']),
+            )
+            for worker_id in worker_ids
+        ]
+        for process in processes:
+            process.start()
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            for process in processes:
+                process.terminate()
+                process.join()
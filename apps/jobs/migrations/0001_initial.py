@@ -0,0 +1,45 @@
+# Generated by Django 5.1.6 on 2026-10-17 19:19
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Yaratilgan vaqti')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Yangilangan vaqti')),
+                ('name', models.CharField(max_length=100, verbose_name='Vazifa')),
+                ('payload', models.JSONField(blank=True, default=dict, verbose_name='Parametrlar')),
+                ('status', models.CharField(choices=[('queued', 'Navbatda'), ('running', 'Bajarilmoqda'), ('done', 'Bajarildi'), ('failed', 'Xatolik')], default='queued', max_length=10, verbose_name='Holati')),
+                ('run_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Bajarish vaqti')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Urinishlar')),
+                ('max_attempts', models.PositiveIntegerField(default=3, verbose_name='Urinishlar chegarasi')),
+                ('progress', models.PositiveIntegerField(default=0, verbose_name='Bajarilgan')),
+                ('progress_total', models.PositiveIntegerField(blank=True, null=True, verbose_name='Jami')),
+                ('result', models.JSONField(blank=True, null=True, verbose_name='Natija')),
+                ('error', models.TextField(blank=True, verbose_name='Xatolik')),
+                ('locked_by', models.CharField(blank=True, max_length=100, verbose_name='Ishchi')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='Egallangan vaqti')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Yaratgan foydalanuvchi')),
+            ],
+            options={
+                'verbose_name': 'Fon vazifasi',
+                'verbose_name_plural': 'Fon vazifalari',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'run_at'], name='jobs_job_claim_idx')],
+            },
+        ),
+    ]
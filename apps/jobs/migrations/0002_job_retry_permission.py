@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-17 20:24
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='job',
+            options={'ordering': ['-created_at'], 'permissions': [('retry_job', "Xatolik bilan tugagan vazifani qayta navbatga qo'yish")], 'verbose_name': 'Fon vazifasi', 'verbose_name_plural': 'Fon vazifalari'},
+        ),
+    ]
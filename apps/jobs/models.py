@@ -0,0 +1,73 @@
+from django.contrib.auth import get_user_model
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.models import BaseModel
+
+User = get_user_model()
+
+
+class Job(BaseModel):
+    """
+    Navbatdagi fon vazifasi. Ishchilar (run_workers) qatorni shartli UPDATE bilan egallaydi,
+    shuning uchun tashqi broker kerak emas va SQLite/PostgreSQL da bir xil ishlaydi.
+    """
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (QUEUED, _('Navbatda')),
+        (RUNNING, _('Bajarilmoqda')),
+        (DONE, _('Bajarildi')),
+        (FAILED, _('Xatolik')),
+    ]
+
+    name = models.CharField(_("Vazifa"), max_length=100)
+    payload = models.JSONField(_("Parametrlar"), default=dict, blank=True)
+    status = models.CharField(_("Holati"), max_length=10, choices=STATUS_CHOICES, default=QUEUED)
+    run_at = models.DateTimeField(_("Bajarish vaqti"), default=timezone.now)
+    attempts = models.PositiveIntegerField(_("Urinishlar"), default=0)
+    max_attempts = models.PositiveIntegerField(_("Urinishlar chegarasi"), default=3)
+    progress = models.PositiveIntegerField(_("Bajarilgan"), default=0)
+    progress_total = models.PositiveIntegerField(_("Jami"), null=True, blank=True)
+    result = models.JSONField(_("Natija"), null=True, blank=True)
+    error = models.TextField(_("Xatolik"), blank=True)
+    locked_by = models.CharField(_("Ishchi"), max_length=100, blank=True)
+    locked_at = models.DateTimeField(_("Egallangan vaqti"), null=True, blank=True)
+    created_by = models.ForeignKey(
+        User,
+        verbose_name=_("Yaratgan foydalanuvchi"),
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True
+    )
+
+    class Meta:
+        verbose_name = _("Fon vazifasi")
+        verbose_name_plural = _("Fon vazifalari")
+        ordering = ['-created_at']
+        permissions = [
+            ('retry_job', _("Xatolik bilan tugagan vazifani qayta navbatga qo'yish")),
+        ]
+        indexes = [
+            models.Index(fields=['status', 'run_at'], name='jobs_job_claim_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk}"
+
+    def set_progress(self, done, total=None):
+        """Vazifa ichidan chaqiriladi, bitta UPDATE bilan yoziladi"""
+        self.progress = done
+        fields = {'progress': done, 'updated_at': timezone.now()}
+        if total is not None:
+            self.progress_total = fields['progress_total'] = total
+        Job.objects.filter(pk=self.pk).update(**fields)
+
+    @property
+    def progress_display(self):
+        if self.progress_total:
+            return f"{self.progress} / {self.progress_total}"
+        return str(self.progress)
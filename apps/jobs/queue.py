@@ -0,0 +1,170 @@
+"""
+Ma'lumotlar bazasidagi vazifalar navbati.
+
+    from apps.jobs.queue import task, enqueue
+
+    @task('personnel.convert_to_employee')
+    def convert(job, ids):
+        ...
+        job.set_progress(done, total)
+
+    enqueue('personnel.convert_to_employee', {'ids': [1, 2]}, created_by=request.user)
+
+Vazifalar ilovalarning jobs.py modullarida e'lon qilinadi (JobsConfig.ready() ularni yuklaydi),
+payload JSON ko'rinishida saqlanadi. Ishchi qatorni "status='queued' bo'lsa" shartli UPDATE
+bilan egallaydi: ikki ishchi bitta vazifani ololmaydi, qulflar (SELECT ... FOR UPDATE) esa
+kerak emas, shuning uchun SQLite'da ham ishlaydi.
+"""
+import logging
+import threading
+import traceback
+from datetime import timedelta
+
+from django.db import close_old_connections, connection
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+# nom -> funksiya
+registry = {}
+
+# Qayta urinishlar orasidagi kutish: RETRY_DELAY * 2 ** (urinish - 1)
+RETRY_DELAY = timedelta(seconds=30)
+# Bajarilayotgan vazifaning tiriklik belgisi (updated_at) shu oraliqda yangilanadi
+HEARTBEAT_INTERVAL = timedelta(minutes=1)
+
+
+def task(name):
+    """Funksiyani fon vazifasi sifatida ro'yxatga olish"""
+    def decorator(func):
+        registry[name] = func
+        return func
+    return decorator
+
+
+def enqueue(name, payload=None, *, created_by=None, max_attempts=3, run_at=None, unique=False):
+    """
+    Vazifani navbatga qo'yish. unique=True bo'lsa va shu nomdagi vazifa hali navbatda
+    turgan bo'lsa, yangisi yaratilmaydi (mavjudi qaytariladi).
+    """
+    if name not in registry:
+        raise KeyError(f'Unknown job: {name}')
+    if unique:
+        existing = Job.objects.filter(name=name, status=Job.QUEUED).first()
+        if existing:
+            return existing
+    return Job.objects.create(
+        name=name,
+        payload=payload or {},
+        created_by=created_by,
+        max_attempts=max_attempts,
+        run_at=run_at or timezone.now(),
+    )
+
+
+def claim(worker_id, names=None, candidates=10):
+    """Navbatdagi bitta vazifani egallash (yo'q bo'lsa None)"""
+    now = timezone.now()
+    queued = Job.objects.filter(status=Job.QUEUED, run_at__lte=now)
+    if names:
+        queued = queued.filter(name__in=names)
+    for pk in queued.order_by('run_at', 'pk').values_list('pk', flat=True)[:candidates]:
+        claimed = Job.objects.filter(pk=pk, status=Job.QUEUED).update(
+            status=Job.RUNNING,
+            locked_by=worker_id,
+            locked_at=now,
+            attempts=F('attempts') + 1,
+            updated_at=now,
+        )
+        if claimed:
+            return Job.objects.get(pk=pk)
+    return None
+
+
+def heartbeat(job, stop):
+    """
+    Vazifa bajarilayotgan paytda updated_at ni vaqti-vaqti bilan yangilash (alohida oqimda).
+    requeue_stale() shunga qaraydi: uzoq, lekin tirik vazifa qayta navbatga qo'yilmaydi.
+    """
+    try:
+        while not stop.wait(HEARTBEAT_INTERVAL.total_seconds()):
+            Job.objects.filter(pk=job.pk, status=Job.RUNNING, locked_by=job.locked_by).update(
+                updated_at=timezone.now()
+            )
+    finally:
+        connection.close()
+
+
+def run_job(job):
+    """Egallangan vazifani bajarish va natijani yozish"""
+    func = registry.get(job.name)
+    now = timezone.now()
+    stop = threading.Event()
+    threading.Thread(target=heartbeat, args=(job, stop), daemon=True).start()
+    try:
+        if func is None:
+            raise KeyError(f'Unknown job: {job.name}')
+        result = func(job, **job.payload)
+    except Exception:
+        stop.set()
+        logger.exception('Job %s failed', job)
+        error = traceback.format_exc()
+        if job.attempts < job.max_attempts and func is not None:
+            Job.objects.filter(pk=job.pk).update(
+                status=Job.QUEUED,
+                error=error,
+                run_at=now + RETRY_DELAY * 2 ** (job.attempts - 1),
+                locked_by='',
+                locked_at=None,
+                updated_at=now,
+            )
+        else:
+            Job.objects.filter(pk=job.pk).update(status=Job.FAILED, error=error, updated_at=now)
+        return False
+    stop.set()
+    Job.objects.filter(pk=job.pk).update(status=Job.DONE, result=result, error='', updated_at=now)
+    return True
+
+
+def requeue_stale(timeout=timedelta(hours=1)):
+    """
+    Ishchisi to'xtab qolgan vazifalarni navbatga qaytarish: 'running' holatida, lekin timeout
+    davomida na heartbeat(), na set_progress() updated_at ni yangilagan
+    """
+    return Job.objects.filter(status=Job.RUNNING, updated_at__lt=timezone.now() - timeout).update(
+        status=Job.QUEUED, locked_by='', locked_at=None, updated_at=timezone.now()
+    )
+
+
+def release_connections():
+    """
+    Eskirgan ulanishlarni yopish. Tranzaksiya ichida (work() testda yoki so'rov ichida
+    chaqirilganda) ulanish yopilmaydi: aks holda PostgreSQL'da tashqi atomic blok buziladi.
+    """
+    if not connection.in_atomic_block:
+        close_old_connections()
+
+
+def work(worker_id, names=None, once=False, stop=None, poll_interval=1.0):
+    """
+    Ishchi sikli: vazifalarni birma-bir egallab bajaradi.
+    once=True bo'lsa navbat bo'shaganda qaytadi, aks holda stop (threading.Event) kutiladi.
+    Bajarilgan vazifalar sonini qaytaradi.
+    """
+    processed = 0
+    while not (stop and stop.is_set()):
+        release_connections()
+        job = claim(worker_id, names)
+        if job is None:
+            if once:
+                break
+            if stop:
+                stop.wait(poll_interval)
+            continue
+        run_job(job)
+        processed += 1
+    release_connections()
+    return processed
@@ -0,0 +1,156 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.core.testing import TEST_STORAGES
+from .models import Job
+from .queue import claim, enqueue, heartbeat, registry, requeue_stale, run_job, task, work
+
+User = get_user_model()
+
+calls = []
+
+
+@task('tests.add')
+def add(job, a, b):
+    job.set_progress(1, 1)
+    calls.append((a, b))
+    return a + b
+
+
+@task('tests.fail')
+def fail(job):
+    raise ValueError('boom')
+
+
+class JobQueueTest(TestCase):
+    """Navbatga qo'yish, egallash, qayta urinish"""
+
+    def setUp(self):
+        calls.clear()
+
+    def test_enqueue_unknown_job(self):
+        with self.assertRaises(KeyError):
+            enqueue('tests.missing')
+
+    def test_unique_enqueue_reuses_queued_job(self):
+        first = enqueue('tests.add', {'a': 1, 'b': 2}, unique=True)
+        self.assertEqual(enqueue('tests.add', {'a': 1, 'b': 2}, unique=True), first)
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_claim_is_exclusive(self):
+        job = enqueue('tests.add', {'a': 1, 'b': 2})
+        enqueue('tests.add', {'a': 3, 'b': 4}, run_at=timezone.now() + timedelta(hours=1))
+
+        claimed = claim('worker-1')
+        self.assertEqual(claimed, job)
+        self.assertEqual((claimed.status, claimed.attempts, claimed.locked_by), (Job.RUNNING, 1, 'worker-1'))
+        # Qolgan vazifa hali vaqti kelmagan
+        self.assertIsNone(claim('worker-2'))
+
+    def test_work_runs_jobs(self):
+        job = enqueue('tests.add', {'a': 1, 'b': 2})
+        self.assertEqual(work('worker-1', once=True), 1)
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.result, job.progress_display), (Job.DONE, 3, '1 / 1'))
+        self.assertEqual(calls, [(1, 2)])
+
+    def test_failed_job_is_retried_then_failed(self):
+        job = enqueue('tests.fail', max_attempts=2)
+
+        with self.assertLogs('apps.jobs.queue', 'ERROR'):
+            self.assertFalse(run_job(claim('worker-1')))
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.QUEUED)
+        self.assertGreater(job.run_at, timezone.now())
+        self.assertIn('ValueError: boom', job.error)
+
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        with self.assertLogs('apps.jobs.queue', 'ERROR'):
+            self.assertFalse(run_job(claim('worker-1')))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.FAILED, 2))
+
+    def test_requeue_stale(self):
+        job = enqueue('tests.add', {'a': 1, 'b': 2})
+        claim('worker-1')
+        # Uzoq bajarilayotgan, lekin heartbeat yangilab turgan vazifa tegilmaydi
+        Job.objects.filter(pk=job.pk).update(locked_at=timezone.now() - timedelta(hours=2))
+        self.assertEqual(requeue_stale(timedelta(hours=1)), 0)
+
+        Job.objects.filter(pk=job.pk).update(updated_at=timezone.now() - timedelta(hours=2))
+        self.assertEqual(requeue_stale(timedelta(hours=1)), 1)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.locked_by), (Job.QUEUED, ''))
+
+    def test_admin_retry_action(self):
+        superuser = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        job = enqueue('tests.add', {'a': 1, 'b': 2})
+        Job.objects.filter(pk=job.pk).update(status=Job.FAILED, attempts=3, error='boom')
+
+        self.client.force_login(superuser)
+        response = self.client.post(reverse('admin:jobs_job_changelist'), {
+            'action': 'retry',
+            '_selected_action': [job.pk],
+        })
+        self.assertEqual(response.status_code, 302)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts, job.error), (Job.QUEUED, 0, ''))
+
+    @override_settings(STORAGES=TEST_STORAGES)
+    def test_retry_requires_retry_permission(self):
+        staff = User.objects.create_user('viewer', 'viewer@example.com', 'password', is_staff=True)
+        staff.user_permissions.add(Permission.objects.get(codename='view_job'))
+        job = enqueue('tests.add', {'a': 1, 'b': 2})
+        Job.objects.filter(pk=job.pk).update(status=Job.FAILED, attempts=3, error='boom')
+
+        self.client.force_login(staff)
+        url = reverse('admin:jobs_job_changelist')
+        # Boshqa amal yo'q, shuning uchun amallar formasi umuman chiqmaydi
+        self.assertIsNone(self.client.get(url).context['action_form'])
+        self.client.post(url, {'action': 'retry', '_selected_action': [job.pk]})
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+
+
+class RunWorkersCommandTest(TransactionTestCase):
+    """run_workers buyrug'i navbatni bo'shatib chiqadi"""
+
+    def setUp(self):
+        calls.clear()
+
+    def test_thread_pool(self):
+        for number in range(4):
+            enqueue('tests.add', {'a': number, 'b': 1})
+
+        out = StringIO()
+        call_command('run_workers', concurrency=2, once=True, stdout=out)
+
+        self.assertIn('Processed 4 jobs', out.getvalue())
+        self.assertEqual(Job.objects.filter(status=Job.DONE).count(), 4)
+        self.assertEqual(sorted(calls), [(number, 1) for number in range(4)])
+
+    def test_heartbeat_refreshes_running_job(self):
+        job = enqueue('tests.add', {'a': 1, 'b': 2})
+        job = claim('worker-1')
+        stale = timezone.now() - timedelta(hours=2)
+        Job.objects.filter(pk=job.pk).update(updated_at=stale)
+
+        stop = mock.Mock()
+        stop.wait.side_effect = [False, True]
+        heartbeat(job, stop)
+
+        job.refresh_from_db()
+        self.assertGreater(job.updated_at, stale)
+        self.assertEqual(requeue_stale(timedelta(hours=1)), 0)
+
+    def test_registry_is_autodiscovered(self):
+        self.assertIn('personnel.convert_to_employee', registry)
@@ -1,14 +1,33 @@
 import json
+from datetime import timedelta
 
 from django import forms
+from django.conf import settings
 from django.contrib import admin, messages
-from django.core.exceptions import ValidationError
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.db import transaction
+from django.template.response import TemplateResponse
+from django.utils import timezone
 from django.utils.html import format_html
-from django.urls import reverse
+from django.urls import path, reverse
 from django.utils.translation import gettext_lazy as _
-from .models import Personnel, PersonnelStatusHistory, Employee, Candidate
-from .forms import EmployeeForm, CandidateForm
-from apps.core.models import LanguageProficiency, StateAward, WorkExperience
+from .models import Personnel, PersonnelStatusHistory, Employee, Candidate, ResumeBlob, ResumeText
+from .forms import EmployeeForm, CandidateForm, PersonnelImportForm, CelebrationsForm
+from .importers import PersonnelImporter, read_rows, format_errors
+from .exporters import csv_response, xlsx_response
+from .search import search_personnel
+from .pagination import KeysetChangeList
+from .filters import AgeListFilter, TenureListFilter
+from .dates import next_occurrence
+from .counts import CachedCountPaginator, invalidate_counts, invalidate_date_buckets
+from .hierarchy import DateBucketsMixin
+from .headcount import HeadcountDelta
+from apps.core.models import LanguageProficiency, StateAward, WorkExperience, ReferenceModel, District
+from apps.core.filters import ReferenceListFilter, AutocompleteListFilter, AutocompleteFilterMixin
+from apps.core.forms import ReferenceChoiceField
+from apps.core.widgets import GroupedDistrictSelect
+from apps.departments.filters import DepartmentListFilter
+from apps.jobs.queue import enqueue
 
 
 class LanguageProficiencyInline(admin.TabularInline):
@@ -36,6 +55,20 @@ class PersonnelStatusHistoryInline(admin.TabularInline):
         return False
 
 
+class HistoryChangeList(DateBucketsMixin, KeysetChangeList):
+    """Holat tarixi ro'yxati: date_hierarchy keshlangan kunlik sonlardan quriladi"""
+
+
+class PersonnelChangeList(DateBucketsMixin, KeysetChangeList):
+    """Ro'yxat sahifasida faqat list_display uchun kerakli ustunlarni yuklash"""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        if self.model_admin.list_only_fields:
+            queryset = queryset.only(*self.model_admin.list_only_fields)
+        return queryset
+
+
 class BasePersonnelAdmin(admin.ModelAdmin):
     """Asosiy PersonnelAdmin klassi"""
     inlines = [
@@ -78,10 +111,11 @@ class BasePersonnelAdmin(admin.ModelAdmin):
 
     list_filter = (
         'status',
-        'position__department',
+        ('position__department', DepartmentListFilter),
         'gender',
-        'education_level',
-        'nationality',
+        AgeListFilter,
+        ('education_level', ReferenceListFilter),
+        ('nationality', ReferenceListFilter),
     )
     search_fields = (
         'fullname',
@@ -94,6 +128,107 @@ class BasePersonnelAdmin(admin.ModelAdmin):
     )
     date_hierarchy = 'created_at'
     save_on_top = False
+    # Katta ma'lumotnomalar to'liq <select> o'rniga AJAX orqali prefiks bo'yicha qidiriladi
+    # (tumanlar esa viloyatlar bo'yicha guruhlangan, keshlangan <select> da, formfield_for_foreignkey)
+    autocomplete_fields = [
+        'position', 'nationality', 'education_level',
+        'academic_degree', 'academic_specialization', 'academic_title',
+    ]
+
+    # position_with_link -> Position.__str__ -> department.name
+    list_select_related = ('position__department',)
+    # Ro'yxat ustunlari uchun yetarli maydonlar (get_education universitetlarni o'qiydi)
+    list_only_fields = (
+        'fullname', 'status', 'phone_number',
+        'bachelor_university', 'master_university',
+        'position__name', 'position__department__name',
+    )
+
+    # OFFSET o'rniga (fullname, id) bo'yicha seek qilish
+    keyset_pagination = settings.ADMIN_KEYSET_PAGINATION
+    keyset_ordering = ('fullname', 'pk')
+    paginator = CachedCountPaginator
+
+    # Fayldan import qilinganda qatorlarga beriladigan tur (None bo'lsa import sahifasi yo'q)
+    import_type = None
+    # Import sahifasida ko'rsatiladigan rad etilgan qatorlar soni
+    import_error_limit = 1000
+
+    def get_changelist(self, request, **kwargs):
+        return PersonnelChangeList
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_age()
+
+    def get_urls(self):
+        urls = super().get_urls()
+        if not self.import_type:
+            return urls
+        info = self.opts.app_label, self.opts.model_name
+        return [
+            path('import/', self.admin_site.admin_view(self.import_view), name='%s_%s_import' % info),
+        ] + urls
+
+    def changelist_view(self, request, extra_context=None):
+        extra_context = extra_context or {}
+        if self.import_type and self.has_add_permission(request):
+            extra_context['import_url'] = reverse(
+                'admin:%s_%s_import' % (self.opts.app_label, self.opts.model_name)
+            )
+        return super().changelist_view(request, extra_context=extra_context)
+
+    def import_view(self, request):
+        """CSV/XLSX fayldan xodimlarni import qilish sahifasi"""
+        if not self.has_add_permission(request):
+            raise PermissionDenied
+
+        errors = []
+        result = None
+        form = PersonnelImportForm(request.POST or None, request.FILES or None)
+        if request.method == 'POST' and form.is_valid():
+            upload = form.cleaned_data['file']
+
+            def on_error(line, message):
+                if len(errors) < self.import_error_limit:
+                    errors.append((line, message))
+
+            importer = PersonnelImporter(
+                default_type=self.import_type,
+                chunk_size=form.cleaned_data['chunk_size'],
+                on_error=on_error,
+            )
+            try:
+                result = importer.run(read_rows(upload, upload.name))
+            except ValidationError as e:
+                form.add_error('file', format_errors(e))
+            else:
+                messages.success(request, _("%(created)d ta yozuv import qilindi, %(rejected)d ta qator rad etildi.") % {
+                    'created': result[0],
+                    'rejected': result[1],
+                })
+
+        context = {
+            **self.admin_site.each_context(request),
+            'title': _('Fayldan import qilish'),
+            'opts': self.opts,
+            'form': form,
+            'errors': errors,
+            'rejected': result[1] if result else 0,
+        }
+        return TemplateResponse(request, 'admin/personnel/import.html', context)
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        # Ma'lumotnomalar (tuman, millat va h.k.) nomlari keshdan olinadi
+        if issubclass(db_field.related_model, ReferenceModel):
+            kwargs.setdefault('form_class', ReferenceChoiceField)
+        # Tug'ilgan va yashash joyi: viloyatlar bo'yicha guruhlangan, keshlangan ro'yxat
+        if db_field.related_model is District:
+            kwargs.setdefault('widget', GroupedDistrictSelect)
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+    def get_search_results(self, request, queryset, search_term):
+        # search_fields ustunlari bo'yicha icontains o'rniga qidiruv indeksidan foydalanish
+        return search_personnel(queryset, search_term), False
 
     def position_with_link(self, obj):
         url = reverse('admin:departments_position_change', args=[obj.position.id])
@@ -111,10 +246,16 @@ class BasePersonnelAdmin(admin.ModelAdmin):
 
     get_education.short_description = _('Ta’lim')
 
+    def get_age(self, obj):
+        return obj.age_years
+
+    get_age.short_description = _('Yoshi')
+    # Yosh bo'yicha saralash - tug'ilgan sana bo'yicha teskari saralash (indeks bilan)
+    get_age.admin_order_field = '-birthdate'
+
     def save_model(self, request, obj, form, change):
         if change:
-            old_obj = self.model.objects.get(pk=obj.pk)
-            if old_obj.status != obj.status and obj.status == 'left':
+            if 'status' in obj.get_changed_fields() and obj.status == 'left':
                 # Faqat xodim ishdan ketganda sabab so'rash
                 reason = request.POST.get('status_change_reason')
                 if not reason:
@@ -130,6 +271,40 @@ class BasePersonnelAdmin(admin.ModelAdmin):
         else:
             obj.save(changed_by=request.user)
 
+    def export_csv(self, request, queryset):
+        """Tanlangan (yoki filtrlangan barcha) yozuvlarni CSV ga eksport qilish"""
+        return csv_response(queryset, self.opts.model_name)
+
+    export_csv.short_description = _("CSV ga eksport qilish")
+
+    def export_xlsx(self, request, queryset):
+        """Tanlangan (yoki filtrlangan barcha) yozuvlarni XLSX ga eksport qilish"""
+        return xlsx_response(queryset, self.opts.model_name)
+
+    export_xlsx.short_description = _("XLSX ga eksport qilish")
+
+    def extract_resume_texts(self, request, queryset):
+        """Tanlanganlarning rezyume matnini qayta ajratishni fon vazifasiga topshirish"""
+        personnel = list(queryset.exclude(resume='').only('pk', 'resume'))
+        ResumeText.schedule(personnel)
+        job = enqueue('personnel.extract_resume_texts', created_by=request.user, unique=True)
+        messages.info(
+            request,
+            _("%(count)d ta rezyume navbatga qo'yildi (%(job)s).") % {'count': len(personnel), 'job': job}
+        )
+
+    extract_resume_texts.short_description = _("Rezyume matnini qayta ajratish")
+
+    def delete_queryset(self, request, queryset):
+        with transaction.atomic():
+            headcount = HeadcountDelta()
+            headcount.add_rows(queryset, sign=-1)
+            ResumeBlob.release_rows(queryset)
+            super().delete_queryset(request, queryset)
+            headcount.apply()
+        invalidate_counts(Personnel, PersonnelStatusHistory)
+        invalidate_date_buckets(Personnel, PersonnelStatusHistory)
+
     def get_form(self, request, obj=None, **kwargs):
         form = super().get_form(request, obj, **kwargs)
         # Status tanlovlarini to'g'ridan-to'g'ri berish
@@ -160,7 +335,14 @@ class BasePersonnelAdmin(admin.ModelAdmin):
 class EmployeeAdmin(BasePersonnelAdmin):
     """Xodimlar uchun admin"""
     form = EmployeeForm
-    list_display = ('fullname', 'status', 'position_with_link', 'phone_number', 'get_education')
+    import_type = 'EMPLOYEE'
+    list_display = (
+        'fullname', 'status', 'position_with_link', 'phone_number', 'get_education', 'get_age', 'get_tenure'
+    )
+    list_filter = BasePersonnelAdmin.list_filter + (TenureListFilter,)
+    actions = ['export_csv', 'export_xlsx', 'extract_resume_texts']
+    # Tug'ilgan kunlar/yubileylar sahifasida ko'rsatiladigan qatorlar soni
+    celebrations_limit = 500
 
     fieldsets = BasePersonnelAdmin.fieldsets + (
         (_('Ishlash davri'), {
@@ -169,32 +351,96 @@ class EmployeeAdmin(BasePersonnelAdmin):
     )
 
     def get_queryset(self, request):
-        return super().get_queryset(request).filter(type='EMPLOYEE')
+        return super().get_queryset(request).filter(type='EMPLOYEE').with_tenure()
+
+    def get_tenure(self, obj):
+        return obj.tenure_years
+
+    get_tenure.short_description = _('Ish staji')
+    get_tenure.admin_order_field = 'tenure_years'
+
+    def get_urls(self):
+        info = self.opts.app_label, self.opts.model_name
+        return [
+            path(
+                'celebrations/',
+                self.admin_site.admin_view(self.celebrations_view),
+                name='%s_%s_celebrations' % info
+            ),
+        ] + super().get_urls()
+
+    def changelist_view(self, request, extra_context=None):
+        extra_context = extra_context or {}
+        extra_context['celebrations_url'] = reverse(
+            'admin:%s_%s_celebrations' % (self.opts.app_label, self.opts.model_name)
+        )
+        return super().changelist_view(request, extra_context=extra_context)
+
+    def celebrations_view(self, request):
+        """Berilgan oynadagi tug'ilgan kunlar va ish yubileylari (yil almashishi bilan)"""
+        if not self.has_view_or_change_permission(request):
+            raise PermissionDenied
+
+        today = timezone.localdate()
+        form = CelebrationsForm(request.GET or {
+            'kind': 'birthday', 'start': today, 'end': today + timedelta(days=6)
+        })
+        rows = None
+        if form.is_valid():
+            start, end = form.cleaned_data['start'], form.cleaned_data['end']
+            queryset = self.get_queryset(request).exclude(status='left').select_related('position__department')
+            if form.cleaned_data['kind'] == 'birthday':
+                field, queryset = 'birthdate', queryset.birthdays_between(start, end)
+            else:
+                field, queryset = 'hired_date', queryset.anniversaries_between(start, end)
+            rows = []
+            for personnel in queryset[:self.celebrations_limit]:
+                day = next_occurrence(getattr(personnel, field), start)
+                rows.append((personnel, day, day.year - getattr(personnel, field).year))
+
+        context = {
+            **self.admin_site.each_context(request),
+            'title': _('Tug‘ilgan kunlar va yubileylar'),
+            'opts': self.opts,
+            'form': form,
+            'rows': rows,
+        }
+        return TemplateResponse(request, 'admin/personnel/celebrations.html', context)
 
 
 @admin.register(Candidate)
 class CandidateAdmin(BasePersonnelAdmin):
     """Nomzodlar uchun admin"""
     form = CandidateForm
-    list_display = ('fullname', 'status', 'position_with_link', 'phone_number', 'get_education')
+    import_type = 'CANDIDATE'
+    list_display = ('fullname', 'status', 'position_with_link', 'phone_number', 'get_education', 'get_age')
 
     def get_queryset(self, request):
         return super().get_queryset(request).filter(type='CANDIDATE')
 
-    actions = ['convert_to_employee']
+    actions = ['convert_to_employee', 'export_csv', 'export_xlsx', 'extract_resume_texts']
 
     def convert_to_employee(self, request, queryset):
-        """Tanlangan nomzodlarni xodimga o'tkazish"""
-        success_count = 0
-        error_count = 0
+        """Tanlangan nomzodlarni xodimga o'tkazish (ko'p bo'lsa fon vazifasi sifatida)"""
+        ids = list(queryset.values_list('pk', flat=True))
+        if len(ids) > settings.ADMIN_BACKGROUND_THRESHOLD:
+            job = enqueue(
+                'personnel.convert_to_employee',
+                {'ids': ids, 'user_id': request.user.pk},
+                created_by=request.user,
+            )
+            messages.info(
+                request,
+                _("%(count)d ta nomzodni o'tkazish fon vazifasiga topshirildi (%(job)s).") % {
+                    'count': len(ids), 'job': job
+                }
+            )
+            return
 
-        for candidate in queryset:
-            try:
-                candidate.convert_to_employee()
-                success_count += 1
-            except ValidationError as e:
-                messages.error(request, f"{candidate}: {e}")
-                error_count += 1
+        success_count, errors = Personnel.bulk_convert_to_employee(queryset, changed_by=request.user)
+        error_count = len(errors)
+        for candidate, e in errors:
+            messages.error(request, f"{candidate}: {e}")
 
         if success_count:
             messages.success(
@@ -215,7 +461,7 @@ class CandidateAdmin(BasePersonnelAdmin):
 
 
 @admin.register(PersonnelStatusHistory)
-class PersonnelStatusHistoryAdmin(admin.ModelAdmin):
+class PersonnelStatusHistoryAdmin(AutocompleteFilterMixin, admin.ModelAdmin):
     list_display = (
         'personnel',
         'old_status',
@@ -224,10 +470,10 @@ class PersonnelStatusHistoryAdmin(admin.ModelAdmin):
         'created_at'
     )
     list_filter = (
-        'personnel',
+        ('personnel', AutocompleteListFilter),
         'old_status',
         'new_status',
-        'changed_by',
+        ('changed_by', AutocompleteListFilter),
         'created_at'
     )
     search_fields = (
@@ -244,6 +490,14 @@ class PersonnelStatusHistoryAdmin(admin.ModelAdmin):
     )
     date_hierarchy = 'created_at'
 
+    # Tarix faqat qo'shib boriladi, chuqur sahifalar uchun (created_at, id) bo'yicha seek qilish
+    keyset_pagination = settings.ADMIN_KEYSET_PAGINATION
+    keyset_ordering = ('-created_at', '-pk')
+    paginator = CachedCountPaginator
+
+    def get_changelist(self, request, **kwargs):
+        return HistoryChangeList
+
     def has_add_permission(self, request):
         return False
 
@@ -0,0 +1,132 @@
+"""
+Admin ro'yxatlari uchun keshlangan COUNT(*) natijalari.
+
+Har bir filtr (SQL so'rovi) uchun natija keshda saqlanadi. Kesh kaliti modelning versiyasini o'z
+ichiga oladi, versiya esa Personnel.save()/delete() orqali oshiriladi, shuning uchun eski
+natijalar avtomatik eskiradi. Kichik jadvallar (ADMIN_EXACT_COUNT_THRESHOLD dan kam) har doim
+aniq sanaladi. date_hierarchy paneli uchun kunlik sonlar ham shu yerda (daily_counts).
+"""
+import hashlib
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Count, Max
+from django.db.models.functions import TruncDate
+from django.utils.functional import cached_property
+
+from apps.core.reference import bump_key_version, get_key_version
+
+VERSION_KEY = 'admin-count-version:%s'
+DATE_BUCKETS_VERSION_KEY = 'date-buckets-version:%s'
+# Hali commit bo'lmagan tranzaksiyalarga tegishli bo'lishi mumkin bo'lgan oxirgi id lar soni
+DATE_BUCKETS_RECOUNT = 1000
+
+
+def _model_label(model):
+    return model._meta.concrete_model._meta.label_lower
+
+
+def _count_key(queryset):
+    version = get_key_version(VERSION_KEY % _model_label(queryset.model))
+    sql, params = queryset.order_by().query.sql_with_params()
+    digest = hashlib.md5(f'{sql}{params!r}'.encode()).hexdigest()
+    return f'admin-count:{_model_label(queryset.model)}:{version}:{digest}'
+
+
+def invalidate_counts(*models):
+    """Berilgan modellar bo'yicha keshlangan barcha sonlarni eskirgan deb belgilash"""
+    for model in models:
+        bump_key_version(VERSION_KEY % _model_label(model))
+
+
+def invalidate_date_buckets(*models):
+    """Berilgan modellar bo'yicha keshlangan kunlik sonlarni eskirgan deb belgilash"""
+    for model in models:
+        bump_key_version(DATE_BUCKETS_VERSION_KEY % _model_label(model))
+
+
+def _count_days(queryset, field, after, upto):
+    """after < id <= upto oralig'idagi qatorlarning {kun: son} lug'ati"""
+    counts = Counter()
+    if upto > after:
+        rows = (
+            queryset.filter(pk__gt=after, pk__lte=upto)
+            .order_by()
+            .values_list(TruncDate(field))
+            .annotate(count=Count('pk'))
+        )
+        for day, count in rows:
+            if day is not None:
+                counts[day] += count
+    return counts
+
+
+def daily_counts(queryset, field, key):
+    """
+    queryset ning field sanasi bo'yicha {kun: son} lug'ati (admin date_hierarchy uchun).
+    Lug'at oxirgi sanalgan id (watermark) bilan keshlanadi: keyingi chaqiruvlar MAX(id) ni
+    o'qiydi va faqat yangi qo'shilgan qatorlarni sanab qo'shadi. Id tranzaksiya boshida
+    olinadi, shuning uchun kichikroq id li qator keyinroq commit bo'lishi mumkin: oxirgi
+    DATE_BUCKETS_RECOUNT ta id asosiy lug'atga kirmaydi va qisqa muddatli
+    (ADMIN_DATE_HIERARCHY_RECENT_TIMEOUT) keshdan o'tib qayta sanaladi. Qator o'chirilganda,
+    ro'yxatga tegishliligi o'zgarganda yoki ommaviy import/o'tkazish commit bo'lganda
+    invalidate_date_buckets() lug'atni eskirtiradi.
+    key - ro'yxat (admin) kaliti.
+    """
+    version = get_key_version(DATE_BUCKETS_VERSION_KEY % _model_label(queryset.model))
+    key = f'date-buckets:{key}:{version}'
+    latest = queryset.model._default_manager.aggregate(last=Max('pk'))['last'] or 0
+
+    watermark, counts = cache.get(key) or (0, Counter())
+    settled = latest - DATE_BUCKETS_RECOUNT
+    if settled > watermark:
+        counts += _count_days(queryset, field, watermark, settled)
+        watermark = settled
+        cache.set(key, (watermark, counts), settings.ADMIN_DATE_HIERARCHY_CACHE_TIMEOUT)
+
+    recent_key = f'{key}:recent:{watermark}:{latest}'
+    recent = cache.get(recent_key)
+    if recent is None:
+        recent = _count_days(queryset, field, watermark, latest)
+        cache.set(recent_key, recent, settings.ADMIN_DATE_HIERARCHY_RECENT_TIMEOUT)
+    return counts + recent
+
+
+def estimated_count(queryset):
+    """Filtrsiz so'rov uchun PostgreSQL statistikasidan taxminiy qatorlar soni"""
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql' or queryset.query.where:
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+            [queryset.model._meta.db_table]
+        )
+        row = cursor.fetchone()
+    return row[0] if row and row[0] > 0 else None
+
+
+def cached_count(queryset):
+    key = _count_key(queryset)
+    count = cache.get(key)
+    if count is not None:
+        return count
+
+    threshold = settings.ADMIN_EXACT_COUNT_THRESHOLD
+    count = estimated_count(queryset)
+    if count is None or count < threshold:
+        count = queryset.count()
+    if count >= threshold:
+        cache.set(key, count, settings.ADMIN_COUNT_CACHE_TIMEOUT)
+    return count
+
+
+class CachedCountPaginator(Paginator):
+    """Sonini cached_count orqali oladigan Paginator"""
+
+    @cached_property
+    def count(self):
+        return cached_count(self.object_list)
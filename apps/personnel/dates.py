@@ -0,0 +1,77 @@
+"""
+Yosh va ish staji uchun sana yordamchilari.
+
+Yosh/staj oralig'i bo'yicha filtrlar hisoblangan ifoda bilan emas, sana oralig'i bilan
+quriladi: "yoshi >= 30" -> "birthdate <= bugun - 30 yil". Shunday shart birthdate
+indeksidan foydalanadi, annotatsiyalar esa faqat ko'rsatish va saralash uchun kerak.
+
+Tug'ilgan kun va ish yubileylari esa saqlanadigan MMDD kalitlari (Personnel.birth_month_day,
+hired_month_day) bo'yicha qidiriladi: 28-dekabr - 3-yanvar kabi yil almashadigan oyna
+month_day_ranges() da ikkita indeks oralig'iga bo'linadi.
+"""
+import calendar
+from datetime import date, timedelta
+
+from django.db.models import Case, DateField, IntegerField, Value, When
+from django.db.models.functions import Coalesce, ExtractDay, ExtractMonth, ExtractYear
+from django.db.models.lookups import GreaterThan
+
+
+def years_before(day, years):
+    """day dan years yil oldingi sana (29-fevral kabisa bo'lmagan yilda 28-fevralga tushadi)"""
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        return day.replace(year=day.year - years, day=28)
+
+
+def month_day_key(day):
+    """Sananing MMDD kaliti: 28-dekabr -> 1228"""
+    return day.month * 100 + day.day
+
+
+def month_day_ranges(start, end):
+    """
+    [start, end] sanalar oynasini MMDD kalitlari oraliqlari ro'yxatiga aylantirish.
+    Kabisa bo'lmagan yilda 29-fevralda tug'ilganlar 28-fevral bilan birga olinadi.
+    """
+    if end < start:
+        raise ValueError('end must not be earlier than start')
+    if end - start >= timedelta(days=365):
+        return [(101, 1231)]
+    first, last = month_day_key(start), month_day_key(end)
+    ranges = [(first, last)] if first <= last else [(first, 1231), (101, last)]
+    for year in {start.year, end.year}:
+        if not calendar.isleap(year) and start <= date(year, 2, 28) <= end:
+            ranges.append((229, 229))
+    return ranges
+
+
+def next_occurrence(day, start):
+    """day sanasining start dan keyingi (yoki shu kuni) yillik takrorlanishi"""
+    for year in (start.year, start.year + 1):
+        occurrence = years_before(day, day.year - year)
+        if occurrence >= start:
+            return occurrence
+
+
+def month_day(expression):
+    """Sananing MMDD ko'rinishidagi butun son kaliti (yil e'tiborga olinmaydi)"""
+    if isinstance(expression, date):
+        return Value(expression.month * 100 + expression.day)
+    return ExtractMonth(expression) * 100 + ExtractDay(expression)
+
+
+def whole_years(start, end):
+    """start dan end gacha to'liq yillar soni (SQL ifodasi), end - maydon nomi, ifoda yoki sana"""
+    end_year = Value(end.year) if isinstance(end, date) else ExtractYear(end)
+    return end_year - ExtractYear(start) - Case(
+        When(GreaterThan(month_day(start), month_day(end)), then=Value(1)),
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+
+
+def date_or(field, day):
+    """Maydon qiymati, NULL bo'lsa day"""
+    return Coalesce(field, Value(day), output_field=DateField())
@@ -0,0 +1,111 @@
+"""
+Xodimlar ro'yxatini CSV/XLSX ga oqim (streaming) ko'rinishida eksport qilish.
+
+Qatorlar values_list() proyeksiyasi va .iterator(chunk_size=...) orqali o'qiladi, shuning uchun
+na butun queryset, na model obyektlari xotirada saqlanadi.
+"""
+import csv
+import tempfile
+
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils.translation import gettext_lazy as _
+
+from apps.core import reference
+from apps.core.models import District, Nation, EducationLevel
+from .models import Personnel
+
+CHUNK_SIZE = 2000
+
+# (values_list ifodasi, sarlavha)
+EXPORT_COLUMNS = (
+    ('fullname', _("To‘liq ismi")),
+    ('status', _("Holati")),
+    ('position__name', _("Lavozimi")),
+    ('position__department__name', _("Bo‘lim")),
+    ('birthdate', _("Tug‘ilgan sanasi")),
+    ('birthplace_id', _("Tug‘ilgan joyi")),
+    ('nationality_id', _("Millati")),
+    ('gender', _("Jinsi")),
+    ('pinfl', _("PINFL")),
+    ('passport', _("Passport")),
+    ('place_of_residence_id', _("Yashash joyi")),
+    ('address_of_residence', _("Manzili")),
+    ('phone_number', _("Telefon raqami")),
+    ('additional_phone', _("Qo‘shimcha telefon")),
+    ('education_level_id', _("Ta’lim darajasi")),
+    ('bachelor_university', _("Bakalavr universiteti")),
+    ('master_university', _("Magistratura universiteti")),
+    ('hired_date', _("Ishga qabul qilingan sana")),
+    ('left_date', _("Ishdan ketgan sana")),
+)
+
+# Ma'lumotnoma ustunlari JOIN o'rniga keshdan nomlanadi
+REFERENCE_COLUMNS = {
+    'birthplace_id': District,
+    'nationality_id': Nation,
+    'place_of_residence_id': District,
+    'education_level_id': EducationLevel,
+}
+
+STATUS_LABELS = dict(Personnel.EMPLOYEE_STATUS_CHOICES + Personnel.CANDIDATE_STATUS_CHOICES)
+GENDER_LABELS = dict(Personnel.GENDER_CHOICES)
+
+
+def export_rows(queryset):
+    """Sarlavha va ma'lumot qatorlarini birma-bir qaytarish"""
+    lookups = [lookup for lookup, header in EXPORT_COLUMNS]
+    status_index = lookups.index('status')
+    gender_index = lookups.index('gender')
+    references = [
+        (lookups.index(lookup), reference.get_table(model))
+        for lookup, model in REFERENCE_COLUMNS.items()
+    ]
+
+    yield [str(header) for lookup, header in EXPORT_COLUMNS]
+    for row in queryset.values_list(*lookups).iterator(chunk_size=CHUNK_SIZE):
+        row = ['' if value is None else value for value in row]
+        row[status_index] = str(STATUS_LABELS.get(row[status_index], row[status_index]))
+        row[gender_index] = str(GENDER_LABELS.get(row[gender_index], row[gender_index]))
+        for index, table in references:
+            row[index] = table.get(row[index], '')
+        yield row
+
+
+class Echo:
+    """csv.writer uchun yozilgan qatorni qaytaradigan psevdo-bufer"""
+
+    def write(self, value):
+        return value
+
+
+def csv_response(queryset, filename):
+    writer = csv.writer(Echo())
+
+    def stream():
+        # Excel UTF-8 ni to'g'ri ochishi uchun BOM
+        yield '\ufeff'
+        for row in export_rows(queryset):
+            yield writer.writerow(row)
+
+    response = StreamingHttpResponse(stream(), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{filename}.csv"'
+    return response
+
+
+def xlsx_response(queryset, filename):
+    from openpyxl import Workbook
+
+    # write_only rejimida qatorlar diskka yoziladi, fayl esa vaqtinchalik fayldan oqim bilan beriladi
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for row in export_rows(queryset):
+        sheet.append(row)
+    file = tempfile.TemporaryFile()
+    workbook.save(file)
+    file.seek(0)
+    return FileResponse(
+        file,
+        as_attachment=True,
+        filename=f'{filename}.xlsx',
+        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    )
@@ -0,0 +1,58 @@
+from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
+
+
+class AgeListFilter(admin.SimpleListFilter):
+    """Yosh guruhlari (birthdate oralig'i orqali, indeks bilan)"""
+    title = _('Yoshi')
+    parameter_name = 'age'
+
+    def lookups(self, request, model_admin):
+        return (
+            ('under30', _('30 yoshgacha')),
+            ('30-39', _('30–39 yosh')),
+            ('40-49', _('40–49 yosh')),
+            ('50+', _('50 yosh va undan katta')),
+            ('retiring', _('2 yil ichida pensiya yoshiga yetadi')),
+            ('retired', _('Pensiya yoshida')),
+        )
+
+    def queryset(self, request, queryset):
+        if self.value() == 'under30':
+            return queryset.age_between(max_age=29)
+        if self.value() == '30-39':
+            return queryset.age_between(30, 39)
+        if self.value() == '40-49':
+            return queryset.age_between(40, 49)
+        if self.value() == '50+':
+            return queryset.age_between(min_age=50)
+        if self.value() == 'retiring':
+            return queryset.retiring_within(2)
+        if self.value() == 'retired':
+            return queryset.retired()
+        return queryset
+
+
+class TenureListFilter(admin.SimpleListFilter):
+    """Ish staji guruhlari"""
+    title = _('Ish staji')
+    parameter_name = 'tenure'
+
+    def lookups(self, request, model_admin):
+        return (
+            ('under1', _('1 yilgacha')),
+            ('1-4', _('1–4 yil')),
+            ('5-9', _('5–9 yil')),
+            ('10+', _('10 yil va undan ko‘p')),
+        )
+
+    def queryset(self, request, queryset):
+        if self.value() == 'under1':
+            return queryset.tenure_between(max_years=0)
+        if self.value() == '1-4':
+            return queryset.tenure_between(1, 4)
+        if self.value() == '5-9':
+            return queryset.tenure_between(5, 9)
+        if self.value() == '10+':
+            return queryset.tenure_between(min_years=10)
+        return queryset
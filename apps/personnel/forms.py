@@ -1,9 +1,10 @@
 from django import forms
 from django.utils.translation import gettext_lazy as _
+from apps.core.forms import ReferenceFormMixin
 from .models import Personnel
 
 
-class BasePersonnelForm(forms.ModelForm):
+class BasePersonnelForm(ReferenceFormMixin, forms.ModelForm):
     """Asosiy Personnel form"""
     status = forms.ChoiceField(
         widget=forms.Select(attrs={'class': 'form-control'}),
@@ -34,4 +35,37 @@ class CandidateForm(BasePersonnelForm):
         super().__init__(*args, **kwargs)
         self.instance.type = 'CANDIDATE'
         self.fields['status'].choices = Personnel.CANDIDATE_STATUS_CHOICES
-        self.fields['status'].initial = 'submitted'
\ No newline at end of file
+        self.fields['status'].initial = 'submitted'
+
+
+class PersonnelImportForm(forms.Form):
+    """Xodimlarni fayldan import qilish formasi"""
+    file = forms.FileField(
+        label=_('Fayl'),
+        help_text=_("CSV yoki XLSX. Birinchi qatorda maydon nomlari: fullname, pinfl, passport, position, ...")
+    )
+    chunk_size = forms.IntegerField(
+        label=_('Bo‘lak hajmi'),
+        initial=500,
+        min_value=1,
+        max_value=10000
+    )
+
+
+class CelebrationsForm(forms.Form):
+    """Tug'ilgan kunlar va ish yubileylari ro'yxati uchun oyna"""
+    KIND_CHOICES = [
+        ('birthday', _('Tug‘ilgan kunlar')),
+        ('anniversary', _('Ish yubileylari')),
+    ]
+
+    kind = forms.ChoiceField(label=_('Turi'), choices=KIND_CHOICES, initial='birthday')
+    start = forms.DateField(label=_('Boshlanish sanasi'), widget=forms.DateInput(attrs={'type': 'date'}))
+    end = forms.DateField(label=_('Tugash sanasi'), widget=forms.DateInput(attrs={'type': 'date'}))
+
+    def clean(self):
+        cleaned_data = super().clean()
+        start, end = cleaned_data.get('start'), cleaned_data.get('end')
+        if start and end and end < start:
+            raise forms.ValidationError(_("Tugash sanasi boshlanish sanasidan oldin bo‘lishi mumkin emas"))
+        return cleaned_data
@@ -0,0 +1,71 @@
+"""
+Lavozimlar bo'yicha band o'rinlar hisoblagichlari (Position.working_count va h.k.).
+
+Hisoblagichlar Personnel saqlash/o'chirish/o'tkazish yo'llarida shu modul orqali tranzaksiya
+ichida yangilanadi. Nomuvofiqliklar reconcile_headcounts buyrug'i bilan tuzatiladi.
+"""
+from collections import Counter
+
+from django.db.models import Count, F, Value
+from django.db.models.functions import Greatest
+
+from apps.departments.models import Position
+
+# (tur, holat) -> Position hisoblagichi
+COUNTER_FIELDS = {
+    ('EMPLOYEE', 'working'): 'working_count',
+    ('EMPLOYEE', 'vacation'): 'vacation_count',
+    ('CANDIDATE', 'submitted'): 'candidate_count',
+    ('CANDIDATE', 'accepted'): 'candidate_count',
+}
+
+
+class HeadcountDelta(Counter):
+    """{(position_id, hisoblagich): o'zgarish} to'plami"""
+
+    def add(self, position_id, type, status, count=1):
+        field = COUNTER_FIELDS.get((type, status))
+        if position_id and field:
+            self[(position_id, field)] += count
+
+    def add_rows(self, queryset, sign=1):
+        """Queryset qatorlarini (position, type, status) bo'yicha guruhlab qo'shish"""
+        rows = (
+            queryset.order_by()
+            .values_list('position_id', 'type', 'status')
+            .annotate(count=Count('pk'))
+        )
+        for position_id, type, status, count in rows:
+            self.add(position_id, type, status, sign * count)
+
+    def apply(self):
+        """Har bir lavozim uchun bitta UPDATE bajarish"""
+        by_position = {}
+        for (position_id, field), delta in self.items():
+            if delta:
+                by_position.setdefault(position_id, {})[field] = delta
+        for position_id, deltas in by_position.items():
+            Position.objects.filter(pk=position_id).update(**{
+                field: Greatest(F(field) + delta, Value(0))
+                for field, delta in deltas.items()
+            })
+
+
+def reconcile_headcounts(personnel_queryset):
+    """Hisoblagichlarni haqiqiy qiymatlar bilan solishtirib tuzatish, tuzatilgan lavozimlar sonini qaytaradi"""
+    expected = HeadcountDelta()
+    expected.add_rows(personnel_queryset)
+    fields = sorted(set(COUNTER_FIELDS.values()))
+
+    changed = []
+    for position in Position.objects.only(*fields):
+        stale = False
+        for field in fields:
+            value = expected[(position.pk, field)]
+            if getattr(position, field) != value:
+                setattr(position, field, value)
+                stale = True
+        if stale:
+            changed.append(position)
+    Position.objects.bulk_update(changed, fields, batch_size=500)
+    return len(changed)
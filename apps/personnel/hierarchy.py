@@ -0,0 +1,35 @@
+"""
+Admin date_hierarchy paneli uchun keshlangan kunlik sonlar.
+
+Standart panel har bir sahifada butun jadval bo'yicha DISTINCT yil/oy/kun so'rovlarini
+bajaradi. Bu yerda filtrsiz ro'yxat uchun counts.daily_counts() dagi keshlangan {kun: son}
+lug'ati ishlatiladi, yil/oy/kun darajalari undan yig'iladi (templatetags/personnel_admin.py).
+Filtr yoki qidiruv tanlangan bo'lsa standart hisoblashdan foydalaniladi.
+"""
+from django.contrib.admin.views.main import ORDER_VAR, PAGE_VAR
+
+from .counts import daily_counts
+from .pagination import AFTER_VAR, BEFORE_VAR
+
+# Ro'yxat tarkibiga ta'sir qilmaydigan parametrlar
+IGNORED_PARAMS = {PAGE_VAR, ORDER_VAR, AFTER_VAR, BEFORE_VAR, '_facets'}
+
+
+class DateBucketsMixin:
+    """ChangeList uchun: filtrsiz ro'yxatning kunlik sonlari (date_buckets())"""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        self.date_buckets_request = request
+        return super().get_queryset(request, exclude_parameters)
+
+    def date_buckets(self):
+        """{kun: son}, filtr yoki qidiruv tanlangan bo'lsa None"""
+        prefix = f'{self.date_hierarchy}__'
+        if any(
+            name not in IGNORED_PARAMS and not name.startswith(prefix)
+            for name in self.filter_params
+        ):
+            return None
+        queryset = self.model_admin.get_queryset(self.date_buckets_request)
+        key = f'{self.model_admin.admin_site.name}:{self.opts.label_lower}:{self.date_hierarchy}'
+        return daily_counts(queryset, self.date_hierarchy, key)
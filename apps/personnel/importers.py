@@ -0,0 +1,247 @@
+"""
+Xodimlarni CSV/XLSX fayldan ommaviy import qilish.
+
+Fayl qatorma-qator o'qiladi, bog'langan jadvallar (tuman, millat, lavozim va h.k.) nomlari
+oldindan yuklangan lug'atlar orqali id ga aylantiriladi, qatorlar Personnel.clean() qoidalari
+bilan tekshiriladi va chunk_size dan bo'laklab bulk_create qilinadi. Xotira sarfi fayl
+hajmiga bog'liq emas: bir vaqtda faqat bitta bo'lak saqlanadi.
+
+Faylda rezyume berib bo'lmaydi, shuning uchun import qilingan yozuvlar rezyumesiz yaratiladi:
+admin'da bunday yozuvni saqlash uchun avval rezyume yuklanishi kerak.
+"""
+import csv
+import io
+import os
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.utils.translation import gettext as _
+
+from apps.core.models import (
+    District, Nation, EducationLevel, AcademicDegree, AcademicSpecialization, AcademicTitle
+)
+from apps.departments.models import Position
+from .counts import invalidate_counts, invalidate_date_buckets
+from .headcount import HeadcountDelta
+from .models import Personnel, PersonnelSearchDocument
+
+# Fayldagi ustun -> bog'langan model
+RELATED_FIELDS = {
+    'position': Position,
+    'birthplace': District,
+    'place_of_residence': District,
+    'nationality': Nation,
+    'education_level': EducationLevel,
+    'academic_degree': AcademicDegree,
+    'academic_specialization': AcademicSpecialization,
+    'academic_title': AcademicTitle,
+}
+
+VALUE_FIELDS = (
+    'type', 'status', 'fullname', 'birthdate', 'gender', 'pinfl', 'passport',
+    'address_of_residence', 'phone_number', 'additional_phone',
+    'bachelor_university', 'bachelor_graduation_year',
+    'master_university', 'master_graduation_year',
+    'academic_title_date', 'hired_date', 'left_date',
+)
+
+DEFAULT_STATUS = {'EMPLOYEE': 'working', 'CANDIDATE': 'submitted'}
+
+
+def build_lookup(model):
+    """Nom (kichik harflarda) -> id lug'ati. Lavozim va tumanlar uchun __str__ ko'rinishi ham qabul qilinadi"""
+    lookup = {}
+    if model is Position:
+        rows = Position.objects.values_list('id', 'name', 'department__name')
+        labels = [(pk, name, f'{name} ({department})') for pk, name, department in rows]
+    elif model is District:
+        rows = District.objects.values_list('id', 'name', 'region__name')
+        labels = [(pk, name, f'{name}, {region}') for pk, name, region in rows]
+    else:
+        labels = [(pk, name, name) for pk, name in model.objects.values_list('id', 'name')]
+
+    names = {}
+    for pk, name, label in labels:
+        lookup[label.lower()] = pk
+        names.setdefault(name.lower(), set()).add(pk)
+    # Bir nechta bo'lim/viloyatda uchraydigan nomlar faqat to'liq ko'rinishda qabul qilinadi
+    for name, pks in names.items():
+        if len(pks) == 1:
+            lookup.setdefault(name, pks.pop())
+    return lookup
+
+
+def read_csv(file):
+    stream = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+    for row in csv.DictReader(stream):
+        yield {(key or '').strip().lower(): value for key, value in row.items()}
+
+
+def read_xlsx(file):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [str(cell or '').strip().lower() for cell in next(rows, ())]
+        for values in rows:
+            yield dict(zip(header, values))
+    finally:
+        workbook.close()
+
+
+def read_rows(file, filename):
+    """Fayl kengaytmasiga qarab qatorlarni o'qish"""
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == '.csv':
+        return read_csv(file)
+    if extension == '.xlsx':
+        return read_xlsx(file)
+    raise ValidationError(_("Faqat CSV yoki XLSX fayllarni import qilish mumkin"))
+
+
+def format_errors(error):
+    if hasattr(error, 'error_dict'):
+        return '; '.join(
+            f"{field}: {' '.join(messages)}" for field, messages in error.message_dict.items()
+        )
+    return ' '.join(error.messages)
+
+
+class PersonnelImporter:
+    """
+    Qatorlarni tekshirib bo'laklab saqlaydi.
+    default_type berilsa barcha qatorlar shu turda yaratiladi (fayldagi 'type' ustuni e'tiborsiz
+    qoldiriladi), aks holda 'type' ustuni, u ham bo'lmasa EMPLOYEE ishlatiladi.
+    Rad etilgan har bir qator uchun on_error(qator_raqami, xabar) chaqiriladi.
+    """
+
+    def __init__(self, default_type=None, chunk_size=500, on_error=None):
+        self.default_type = default_type
+        self.chunk_size = chunk_size
+        self.on_error = on_error or (lambda line, message: None)
+        self.lookups = {model: build_lookup(model) for model in set(RELATED_FIELDS.values())}
+        self.created = 0
+        self.rejected = 0
+
+    def reject(self, line, message):
+        self.rejected += 1
+        self.on_error(line, message)
+
+    def build_instance(self, row):
+        values = {}
+        errors = {}
+        for name in VALUE_FIELDS:
+            raw = row.get(name)
+            if isinstance(raw, str):
+                raw = raw.strip()
+            if raw in (None, ''):
+                continue
+            try:
+                values[name] = Personnel._meta.get_field(name).to_python(raw)
+            except ValidationError as e:
+                errors[name] = e.messages
+        for name, model in RELATED_FIELDS.items():
+            raw = row.get(name)
+            if raw in (None, ''):
+                field = Personnel._meta.get_field(name)
+                if not field.null:
+                    errors[name] = [field.error_messages['required']]
+                continue
+            pk = self.lookups[model].get(str(raw).strip().lower())
+            if pk is None:
+                errors[name] = [_("“%(value)s” topilmadi") % {'value': raw}]
+            else:
+                values[f'{name}_id'] = pk
+        if errors:
+            raise ValidationError(errors)
+
+        if self.default_type:
+            values['type'] = self.default_type
+        else:
+            values.setdefault('type', 'EMPLOYEE')
+        values.setdefault('status', DEFAULT_STATUS.get(values['type'], 'working'))
+        instance = Personnel(**values)
+        # Bog'langan maydonlar lug'at orqali tekshirilgan, unikallik esa bo'lak bo'yicha tekshiriladi,
+        # rezyume esa importdan keyin yuklanadi (modul izohiga qarang)
+        instance.full_clean(
+            exclude=['resume', *RELATED_FIELDS],
+            validate_unique=False,
+            validate_constraints=False,
+        )
+        return instance
+
+    def run(self, rows):
+        chunk = []
+        # Sarlavha 1-qator, ma'lumotlar 2-qatordan boshlanadi
+        for line, row in enumerate(rows, start=2):
+            try:
+                chunk.append((line, self.build_instance(row)))
+            except ValidationError as e:
+                self.reject(line, format_errors(e))
+            if len(chunk) >= self.chunk_size:
+                self.save_chunk(chunk)
+                chunk = []
+        if chunk:
+            self.save_chunk(chunk)
+        if self.created:
+            invalidate_counts(Personnel)
+        return self.created, self.rejected
+
+    def taken_keys(self, chunk):
+        """Bazada band bo'lgan PINFL va passportlar (bitta so'rov bilan)"""
+        pinfls = {instance.pinfl for line, instance in chunk}
+        passports = {instance.passport for line, instance in chunk}
+        existing = Personnel.objects.filter(pinfl__in=pinfls) | Personnel.objects.filter(passport__in=passports)
+        taken_pinfls = set()
+        taken_passports = set()
+        for pinfl, passport in existing.order_by().values_list('pinfl', 'passport'):
+            taken_pinfls.add(pinfl)
+            taken_passports.add(passport)
+        return taken_pinfls, taken_passports
+
+    def save_chunk(self, chunk):
+        # Bazada va bo'lak ichida takrorlangan PINFL/passportlar oldindan rad etiladi
+        taken_pinfls, taken_passports = self.taken_keys(chunk)
+        accepted = []
+        for line, instance in chunk:
+            if instance.pinfl in taken_pinfls:
+                self.reject(line, _("pinfl: %(value)s allaqachon mavjud") % {'value': instance.pinfl})
+            elif instance.passport in taken_passports:
+                self.reject(line, _("passport: %(value)s allaqachon mavjud") % {'value': instance.passport})
+            else:
+                taken_pinfls.add(instance.pinfl)
+                taken_passports.add(instance.passport)
+                accepted.append((line, instance))
+
+        try:
+            self.create([instance for line, instance in accepted])
+        except IntegrityError:
+            # Tekshiruvdan keyin boshqa so'rov bir xil PINFL/passport qo'shgan (yoki bog'langan yozuv
+            # o'chirilgan): bo'lak qatorma-qator saqlanadi, saqlanmaganlari sababi bilan rad etiladi
+            for line, instance in accepted:
+                try:
+                    self.create([instance])
+                except IntegrityError as e:
+                    self.reject(line, self.integrity_error_message(instance, e))
+
+    def integrity_error_message(self, instance, error):
+        """Saqlanmagan qator sababi: takrorlangan PINFL/passport bazadan qayta tekshiriladi"""
+        taken_pinfls, taken_passports = self.taken_keys([(None, instance)])
+        if instance.pinfl in taken_pinfls:
+            return _("pinfl: %(value)s allaqachon mavjud") % {'value': instance.pinfl}
+        if instance.passport in taken_passports:
+            return _("passport: %(value)s allaqachon mavjud") % {'value': instance.passport}
+        return _("saqlab bo‘lmadi: %(error)s") % {'error': error}
+
+    def create(self, instances):
+        with transaction.atomic():
+            created = Personnel.objects.bulk_create(instances)
+            PersonnelSearchDocument.update_for(created)
+            headcount = HeadcountDelta()
+            for instance in created:
+                headcount.add(instance.position_id, instance.type, instance.status)
+            headcount.apply()
+            # Bo'lak katta va uzoq commit bo'ladi: kunlik sonlar commit'dan keyin qayta sanaladi
+            transaction.on_commit(lambda: invalidate_date_buckets(Personnel))
+        self.created += len(created)
@@ -0,0 +1,43 @@
+"""
+Xodimlar bo'yicha fon vazifalari (apps.jobs). Admin amallari katta hajmdagi ishlarni shu
+yerga topshiradi, run_workers buyrug'i esa ularni so'rovdan tashqarida bajaradi.
+"""
+from django.contrib.auth import get_user_model
+
+from apps.jobs.queue import task
+from .models import Personnel
+from .resume_text import extract_pending
+from .snapshots import build_snapshots
+
+CONVERT_BATCH_SIZE = 500
+
+
+@task('personnel.convert_to_employee')
+def convert_to_employee(job, ids, user_id=None):
+    """Nomzodlarni bo'laklab xodimga o'tkazish, har bo'lakdan keyin bajarilishi yoziladi"""
+    changed_by = get_user_model().objects.filter(pk=user_id).first() if user_id else None
+    converted = 0
+    errors = []
+    job.set_progress(0, len(ids))
+    for start in range(0, len(ids), CONVERT_BATCH_SIZE):
+        batch = ids[start:start + CONVERT_BATCH_SIZE]
+        count, batch_errors = Personnel.bulk_convert_to_employee(
+            Personnel.objects.filter(pk__in=batch), changed_by=changed_by
+        )
+        converted += count
+        errors.extend(f"{candidate}: {' '.join(e.messages)}" for candidate, e in batch_errors)
+        job.set_progress(start + len(batch))
+    return {'converted': converted, 'errors': errors}
+
+
+@task('personnel.extract_resume_texts')
+def extract_resume_texts(job, batch_size=50, workers=0):
+    """Navbatdagi (pending) rezyume matnlarini ajratish"""
+    processed = extract_pending(batch_size=batch_size, workers=workers, on_batch=job.set_progress)
+    return {'processed': processed}
+
+
+@task('personnel.build_headcount_snapshots')
+def build_headcount_snapshots(job):
+    """Oxirgi snapshotdan kechagacha bo'lgan kunlar snapshotlarini qurish"""
+    return {'days': build_snapshots()}
@@ -0,0 +1,25 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from apps.personnel.snapshots import build_snapshots
+
+
+class Command(BaseCommand):
+    help = "Build daily headcount snapshots from personnel status history (run daily; --since to backfill)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--since',
+            type=date.fromisoformat,
+            help='First day to rebuild, YYYY-MM-DD (default: the day after the last snapshot)',
+        )
+        parser.add_argument(
+            '--until',
+            type=date.fromisoformat,
+            help='Last day to rebuild, YYYY-MM-DD (default: yesterday)',
+        )
+
+    def handle(self, *args, **options):
+        days = build_snapshots(start=options['since'], end=options['until'])
+        self.stdout.write(self.style.SUCCESS(f'Successfully built headcount snapshots for {days} days'))
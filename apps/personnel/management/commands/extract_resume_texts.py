@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from apps.personnel.resume_text import extract_pending, schedule_missing
+
+
+class Command(BaseCommand):
+    help = "Extract text from queued resume PDFs in a process pool"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Backfill: queue every personnel whose resume text is missing, stale or failed',
+        )
+        parser.add_argument('--batch-size', type=int, default=50)
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Number of worker processes (default: CPU count, 0: run in this process)',
+        )
+
+    def handle(self, *args, **options):
+        if options['all']:
+            scheduled = schedule_missing()
+            self.stdout.write(f'Queued {scheduled} resumes')
+
+        processed = extract_pending(
+            batch_size=options['batch_size'],
+            workers=options['workers'],
+            on_batch=lambda count: self.stdout.write(f'Processed {count} files'),
+        )
+        self.stdout.write(self.style.SUCCESS(f'Successfully extracted {processed} resume files'))
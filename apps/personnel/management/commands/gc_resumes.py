@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from apps.personnel.storage import collect_garbage
+
+
+class Command(BaseCommand):
+    help = "Delete resume files that are no longer referenced by any personnel"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument(
+            '--grace-minutes',
+            type=int,
+            default=60,
+            help='Keep unreferenced files younger than this (uploads that are not saved yet)',
+        )
+
+    def handle(self, *args, **options):
+        deleted = collect_garbage(
+            batch_size=options['batch_size'],
+            grace=timedelta(minutes=options['grace_minutes']),
+        )
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} orphaned resume files'))
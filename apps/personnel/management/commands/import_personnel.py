@@ -0,0 +1,42 @@
+import csv
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.personnel.importers import PersonnelImporter, read_rows
+
+
+class Command(BaseCommand):
+    help = "Import personnel from a CSV or XLSX file"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV or XLSX file with a header row of Personnel field names")
+        parser.add_argument('--type', choices=['EMPLOYEE', 'CANDIDATE'],
+                            help="Type for all rows (default: the 'type' column, else EMPLOYEE)")
+        parser.add_argument('--chunk-size', type=int, default=500)
+        parser.add_argument('--errors', help="Write rejected rows to this CSV file instead of stderr")
+
+    def handle(self, *args, **options):
+        error_file = open(options['errors'], 'w', newline='', encoding='utf-8') if options['errors'] else None
+        error_writer = csv.writer(error_file or self.stderr)
+        error_writer.writerow(['line', 'error'])
+
+        importer = PersonnelImporter(
+            default_type=options['type'],
+            chunk_size=options['chunk_size'],
+            on_error=lambda line, message: error_writer.writerow([line, message]),
+        )
+        try:
+            with open(options['path'], 'rb') as file:
+                created, rejected = importer.run(read_rows(file, options['path']))
+        except OSError as e:
+            raise CommandError(e)
+        except ValidationError as e:
+            raise CommandError(' '.join(e.messages))
+        finally:
+            if error_file:
+                error_file.close()
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Imported {created} personnel, rejected {rejected} rows')
+        )
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.personnel.headcount import reconcile_headcounts
+from apps.personnel.models import Personnel
+
+
+class Command(BaseCommand):
+    help = "Recompute position headcount counters from personnel rows"
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            fixed = reconcile_headcounts(Personnel.objects.all())
+
+        if fixed:
+            self.stdout.write(self.style.WARNING(f'Fixed headcounts of {fixed} positions'))
+        self.stdout.write(self.style.SUCCESS('Successfully reconciled position headcounts'))
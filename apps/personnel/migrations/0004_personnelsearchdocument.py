@@ -0,0 +1,121 @@
+# Generated by Django 5.1.6 on 2026-10-17 18:51
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+SOURCE_FIELDS = (
+    'fullname', 'pinfl', 'passport', 'phone_number', 'additional_phone',
+    'bachelor_university', 'master_university',
+)
+
+SQLITE_CREATE = [
+    """
+    CREATE VIRTUAL TABLE personnel_search_fts USING fts5(
+        document,
+        content='personnel_personnelsearchdocument',
+        content_rowid='personnel_id',
+        tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER personnel_search_fts_ai AFTER INSERT ON personnel_personnelsearchdocument BEGIN
+        INSERT INTO personnel_search_fts(rowid, document) VALUES (new.personnel_id, new.document);
+    END
+    """,
+    """
+    CREATE TRIGGER personnel_search_fts_ad AFTER DELETE ON personnel_personnelsearchdocument BEGIN
+        INSERT INTO personnel_search_fts(personnel_search_fts, rowid, document)
+        VALUES ('delete', old.personnel_id, old.document);
+    END
+    """,
+    """
+    CREATE TRIGGER personnel_search_fts_au AFTER UPDATE ON personnel_personnelsearchdocument BEGIN
+        INSERT INTO personnel_search_fts(personnel_search_fts, rowid, document)
+        VALUES ('delete', old.personnel_id, old.document);
+        INSERT INTO personnel_search_fts(rowid, document) VALUES (new.personnel_id, new.document);
+    END
+    """,
+]
+
+SQLITE_DROP = [
+    'DROP TRIGGER IF EXISTS personnel_search_fts_ai',
+    'DROP TRIGGER IF EXISTS personnel_search_fts_ad',
+    'DROP TRIGGER IF EXISTS personnel_search_fts_au',
+    'DROP TABLE IF EXISTS personnel_search_fts',
+]
+
+POSTGRESQL_CREATE = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    'CREATE INDEX personnel_search_trgm ON personnel_personnelsearchdocument '
+    'USING gin (document gin_trgm_ops)',
+]
+
+POSTGRESQL_DROP = [
+    'DROP INDEX IF EXISTS personnel_search_trgm',
+]
+
+BATCH_SIZE = 1000
+
+
+def run_statements(schema_editor, statements):
+    for statement in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    run_statements(schema_editor, {'sqlite': SQLITE_CREATE, 'postgresql': POSTGRESQL_CREATE})
+
+    # Mavjud xodimlar uchun indeksni to'ldirish
+    Personnel = apps.get_model('personnel', 'Personnel')
+    PersonnelSearchDocument = apps.get_model('personnel', 'PersonnelSearchDocument')
+    documents = []
+    for row in Personnel.objects.values_list('pk', *SOURCE_FIELDS).iterator(chunk_size=BATCH_SIZE):
+        pk, values = row[0], row[1:]
+        documents.append(PersonnelSearchDocument(
+            personnel_id=pk,
+            document=' '.join(value for value in values if value).lower()
+        ))
+        # Xotira jadval hajmiga qarab o'smasligi uchun bo'laklab yoziladi
+        if len(documents) >= BATCH_SIZE:
+            PersonnelSearchDocument.objects.bulk_create(documents)
+            documents = []
+    if documents:
+        PersonnelSearchDocument.objects.bulk_create(documents)
+
+
+def drop_search_index(apps, schema_editor):
+    run_statements(schema_editor, {'sqlite': SQLITE_DROP, 'postgresql': POSTGRESQL_DROP})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('personnel', '0003_personnel_birthdate'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PersonnelSearchDocument',
+            fields=[
+                ('personnel', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='personnel.personnel', verbose_name='Xodim')),
+                ('document', models.TextField(verbose_name='Qidiruv matni')),
+            ],
+            options={
+                'verbose_name': 'Qidiruv indeksi',
+                'verbose_name_plural': 'Qidiruv indekslari',
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.AlterField(
+            model_name='personnelstatushistory',
+            name='changed_by',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='O‘zgartirgan foydalanuvchi'),
+        ),
+        migrations.AlterField(
+            model_name='personnelstatushistory',
+            name='reason',
+            field=models.TextField(verbose_name='O‘zgartirish sababi'),
+        ),
+    ]
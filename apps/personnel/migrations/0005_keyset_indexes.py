@@ -0,0 +1,25 @@
+# Generated by Django 5.1.6 on 2026-10-17 18:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_initial'),
+        ('departments', '0001_initial'),
+        ('personnel', '0004_personnelsearchdocument'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='personnel',
+            index=models.Index(fields=['fullname', 'id'], name='personnel_p_fullnam_ec5a9c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='personnelstatushistory',
+            index=models.Index(fields=['created_at', 'id'], name='personnel_p_created_bde392_idx'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.1.6 on 2026-10-17 19:13
+
+import apps.personnel.storage
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def register_existing_resumes(apps, schema_editor):
+    # Avvalgi nomlash bilan saqlangan fayllar ham havolalar soni bilan ro'yxatga olinadi
+    Personnel = apps.get_model('personnel', 'Personnel')
+    ResumeBlob = apps.get_model('personnel', 'ResumeBlob')
+    rows = (
+        Personnel.objects.order_by().exclude(resume='')
+        .values_list('resume').annotate(count=Count('pk'))
+    )
+    ResumeBlob.objects.bulk_create(
+        [ResumeBlob(name=name, ref_count=count) for name, count in rows.iterator()],
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('personnel', '0005_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='personnel',
+            name='resume',
+            field=models.FileField(help_text='PDF formatida', storage=apps.personnel.storage.get_resume_storage, upload_to='resumes/', verbose_name='Rezyume'),
+        ),
+        migrations.CreateModel(
+            name='ResumeBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Yaratilgan vaqti')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Yangilangan vaqti')),
+                ('name', models.CharField(max_length=255, unique=True, verbose_name='Fayl yo‘li')),
+                ('digest', models.CharField(blank=True, db_index=True, max_length=64, verbose_name='SHA-256')),
+                ('size', models.PositiveBigIntegerField(default=0, verbose_name='Hajmi')),
+                ('ref_count', models.PositiveIntegerField(default=0, verbose_name='Havolalar soni')),
+            ],
+            options={
+                'verbose_name': 'Rezyume fayli',
+                'verbose_name_plural': 'Rezyume fayllari',
+                'indexes': [models.Index(fields=['ref_count', 'updated_at'], name='personnel_resumeblob_gc_idx')],
+            },
+        ),
+        migrations.RunPython(register_existing_resumes, migrations.RunPython.noop),
+    ]
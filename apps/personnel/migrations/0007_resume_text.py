@@ -0,0 +1,97 @@
+# Generated by Django 5.1.6 on 2026-10-17 19:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+SQLITE_CREATE = [
+    """
+    CREATE VIRTUAL TABLE personnel_resume_fts USING fts5(
+        text,
+        content='personnel_resumetext',
+        content_rowid='personnel_id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER personnel_resume_fts_ai AFTER INSERT ON personnel_resumetext BEGIN
+        INSERT INTO personnel_resume_fts(rowid, text) VALUES (new.personnel_id, new.text);
+    END
+    """,
+    """
+    CREATE TRIGGER personnel_resume_fts_ad AFTER DELETE ON personnel_resumetext BEGIN
+        INSERT INTO personnel_resume_fts(personnel_resume_fts, rowid, text)
+        VALUES ('delete', old.personnel_id, old.text);
+    END
+    """,
+    """
+    CREATE TRIGGER personnel_resume_fts_au AFTER UPDATE OF text ON personnel_resumetext BEGIN
+        INSERT INTO personnel_resume_fts(personnel_resume_fts, rowid, text)
+        VALUES ('delete', old.personnel_id, old.text);
+        INSERT INTO personnel_resume_fts(rowid, text) VALUES (new.personnel_id, new.text);
+    END
+    """,
+]
+
+SQLITE_DROP = [
+    'DROP TRIGGER IF EXISTS personnel_resume_fts_ai',
+    'DROP TRIGGER IF EXISTS personnel_resume_fts_ad',
+    'DROP TRIGGER IF EXISTS personnel_resume_fts_au',
+    'DROP TABLE IF EXISTS personnel_resume_fts',
+]
+
+POSTGRESQL_CREATE = [
+    "CREATE INDEX personnel_resume_tsv ON personnel_resumetext USING gin (to_tsvector('simple', text))",
+]
+
+POSTGRESQL_DROP = [
+    'DROP INDEX IF EXISTS personnel_resume_tsv',
+]
+
+
+def run_statements(schema_editor, statements):
+    for statement in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+def create_resume_index(apps, schema_editor):
+    run_statements(schema_editor, {'sqlite': SQLITE_CREATE, 'postgresql': POSTGRESQL_CREATE})
+
+    # Mavjud rezyumelar navbatga qo'yiladi (extract_resume_texts buyrug'i ajratadi)
+    Personnel = apps.get_model('personnel', 'Personnel')
+    ResumeText = apps.get_model('personnel', 'ResumeText')
+    ResumeText.objects.bulk_create(
+        (ResumeText(personnel_id=pk, source=resume, status='pending')
+         for pk, resume in Personnel.objects.exclude(resume='').values_list('pk', 'resume').iterator()),
+        batch_size=1000
+    )
+
+
+def drop_resume_index(apps, schema_editor):
+    run_statements(schema_editor, {'sqlite': SQLITE_DROP, 'postgresql': POSTGRESQL_DROP})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('personnel', '0006_resume_blobs'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeText',
+            fields=[
+                ('personnel', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='resume_text', serialize=False, to='personnel.personnel', verbose_name='Xodim')),
+                ('source', models.CharField(max_length=255, verbose_name='Fayl')),
+                ('text', models.TextField(blank=True, verbose_name='Matn')),
+                ('status', models.CharField(choices=[('pending', 'Navbatda'), ('done', 'Tayyor'), ('failed', 'Xatolik')], default='pending', max_length=10, verbose_name='Holati')),
+                ('error', models.TextField(blank=True, verbose_name='Xatolik')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Yangilangan vaqti')),
+            ],
+            options={
+                'verbose_name': 'Rezyume matni',
+                'verbose_name_plural': 'Rezyume matnlari',
+                'indexes': [models.Index(fields=['status', 'source'], name='personnel_resumetext_status')],
+            },
+        ),
+        migrations.RunPython(create_resume_index, drop_resume_index),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.6 on 2026-10-17 19:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0003_position_name_prefix_index'),
+        ('personnel', '0007_resume_text'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HeadcountSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Sana')),
+                ('type', models.CharField(choices=[('CANDIDATE', 'Nomzod'), ('EMPLOYEE', 'Xodim')], max_length=255, verbose_name='Turi')),
+                ('status', models.CharField(max_length=255, verbose_name='Holati')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='Soni')),
+                ('department', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='headcount_snapshots', to='departments.department', verbose_name='Bo‘lim')),
+                ('position', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='headcount_snapshots', to='departments.position', verbose_name='Lavozimi')),
+            ],
+            options={
+                'verbose_name': 'Band o‘rinlar snapshoti',
+                'verbose_name_plural': 'Band o‘rinlar snapshotlari',
+                'ordering': ['-date'],
+                'indexes': [models.Index(fields=['department', 'date'], name='personnel_headcount_dept_idx')],
+                'constraints': [models.UniqueConstraint(fields=('date', 'position', 'type', 'status'), name='personnel_headcountsnapshot_unique')],
+            },
+        ),
+    ]
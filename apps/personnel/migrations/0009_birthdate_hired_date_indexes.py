@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-17 19:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_reference_datasets'),
+        ('departments', '0003_position_name_prefix_index'),
+        ('personnel', '0008_headcount_snapshots'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='personnel',
+            index=models.Index(fields=['birthdate'], name='personnel_p_birthda_cb5bf7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='personnel',
+            index=models.Index(fields=['hired_date'], name='personnel_p_hired_d_3ac111_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.6 on 2026-10-17 19:25
+
+from django.db import migrations, models
+from django.db.models.functions import ExtractDay, ExtractMonth
+
+
+def fill_month_day_keys(apps, schema_editor):
+    # Mavjud qatorlar bitta UPDATE bilan to'ldiriladi (hired_date NULL bo'lsa kalit ham NULL)
+    Personnel = apps.get_model('personnel', 'Personnel')
+    Personnel.objects.update(
+        birth_month_day=ExtractMonth('birthdate') * 100 + ExtractDay('birthdate'),
+        hired_month_day=ExtractMonth('hired_date') * 100 + ExtractDay('hired_date'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('personnel', '0009_birthdate_hired_date_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='personnel',
+            name='birth_month_day',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True, verbose_name='Tug‘ilgan kuni (OOKK)'),
+        ),
+        migrations.AddField(
+            model_name='personnel',
+            name='hired_month_day',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True, verbose_name='Ishga kirgan kuni (OOKK)'),
+        ),
+        migrations.AddIndex(
+            model_name='personnel',
+            index=models.Index(fields=['birth_month_day'], name='personnel_p_birth_m_e5ea3d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='personnel',
+            index=models.Index(fields=['hired_month_day'], name='personnel_p_hired_m_70eee5_idx'),
+        ),
+        migrations.RunPython(fill_month_day_keys, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,20 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Case, Count, F, Q, Value, When
+from django.db.models.fields.files import FieldFile
+from django.db.models.functions import Greatest
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 from apps.core.models import BaseModel, phone_validator
+from apps.jobs.queue import enqueue
 from datetime import date
 from django.core.validators import RegexValidator
+from .counts import invalidate_counts, invalidate_date_buckets
+from .dates import date_or, month_day_key, month_day_ranges, whole_years, years_before
+from .headcount import HeadcountDelta
+from .storage import get_resume_storage
+from django_cleanup import cleanup
 
 User = get_user_model()
 
@@ -33,8 +43,105 @@ class PersonnelStatusHistory(BaseModel):
         verbose_name = _("Holat tarixi")
         verbose_name_plural = _("Holat tarixlari")
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+        ]
+
+
+class PersonnelQuerySet(models.QuerySet):
+    """
+    Yosh va ish stajini SQL da hisoblash. with_*() ko'rsatish/saralash uchun annotatsiya
+    qo'shadi, *_between() va retiring_within() esa indekslangan sana oralig'i bilan filtrlaydi.
+    on - hisoblash sanasi (standart: bugun).
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.set_month_day_keys()
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        fields = list(fields)
+        keys = [key for source, key in self.model.MONTH_DAY_KEYS.items() if source in fields]
+        if keys:
+            for obj in objs:
+                obj.set_month_day_keys()
+        return super().bulk_update(objs, fields + keys, *args, **kwargs)
+
+    def birthdays_between(self, start, end):
+        """start..end oynasida tug'ilgan kuni bo'ladiganlar, kelish tartibida"""
+        return self._month_day_window('birth_month_day', start, end)
+
+    def anniversaries_between(self, start, end):
+        """start..end oynasida ishga kirganiga to'liq yil bo'ladiganlar, kelish tartibida"""
+        return self._month_day_window('hired_month_day', start, end).filter(hired_date__lt=start)
+
+    def _month_day_window(self, field, start, end):
+        condition = Q()
+        for first, last in month_day_ranges(start, end):
+            condition |= Q(**{f'{field}__range': (first, last)})
+        # Yil almashadigan oynada dekabr kunlari yanvardan oldin keladi
+        occurrence = Case(
+            When(**{f'{field}__gte': month_day_key(start)}, then=Value(0)),
+            default=Value(1),
+            output_field=models.IntegerField(),
+        )
+        return self.filter(condition).order_by(occurrence, field, 'fullname')
+
+    def with_age(self, on=None):
+        return self.annotate(age_years=whole_years('birthdate', on or timezone.localdate()))
+
+    def with_tenure(self, on=None):
+        on = on or timezone.localdate()
+        return self.annotate(tenure_years=whole_years('hired_date', date_or('left_date', on)))
+
+    def age_between(self, min_age=None, max_age=None, on=None):
+        on = on or timezone.localdate()
+        queryset = self
+        if min_age is not None:
+            queryset = queryset.filter(birthdate__lte=years_before(on, min_age))
+        if max_age is not None:
+            queryset = queryset.filter(birthdate__gt=years_before(on, max_age + 1))
+        return queryset
+
+    def tenure_between(self, min_years=None, max_years=None, on=None):
+        """Ishlayotganlar hired_date oralig'i bo'yicha, ishdan ketganlar hisoblangan staj bo'yicha"""
+        on = on or timezone.localdate()
+        current = Q(left_date__isnull=True)
+        former = Q(left_date__isnull=False)
+        if min_years is not None:
+            current &= Q(hired_date__lte=years_before(on, min_years))
+            former &= Q(former_tenure__gte=min_years)
+        if max_years is not None:
+            current &= Q(hired_date__gt=years_before(on, max_years + 1))
+            former &= Q(former_tenure__lte=max_years)
+        return self.filter(hired_date__isnull=False).alias(
+            former_tenure=whole_years('hired_date', date_or('left_date', on))
+        ).filter(current | former)
+
+    def retiring_within(self, years, on=None):
+        """Pensiya yoshiga (jinsi bo'yicha) years yil ichida yetadiganlar"""
+        on = on or timezone.localdate()
+        condition = Q(pk__in=[])
+        for gender, age in self.model.RETIREMENT_AGES.items():
+            condition |= Q(
+                gender=gender,
+                birthdate__lte=years_before(on, age - years),
+                birthdate__gt=years_before(on, age),
+            )
+        return self.filter(condition)
 
+    def retired(self, on=None):
+        """Pensiya yoshiga yetganlar"""
+        on = on or timezone.localdate()
+        condition = Q(pk__in=[])
+        for gender, age in self.model.RETIREMENT_AGES.items():
+            condition |= Q(gender=gender, birthdate__lte=years_before(on, age))
+        return self.filter(condition)
 
+
+@cleanup.ignore
 class Personnel(BaseModel):
     TYPE_CHOICES = [
         ('CANDIDATE', _('Nomzod')),
@@ -58,6 +165,18 @@ class Personnel(BaseModel):
         ('female', _('Ayol')),
     ]
 
+    # Jinsi bo'yicha pensiya yoshi
+    RETIREMENT_AGES = {
+        'male': 60,
+        'female': 55,
+    }
+
+    # Sana maydoni -> uning MMDD kaliti (save()/bulk_create()/bulk_update() da yangilanadi)
+    MONTH_DAY_KEYS = {
+        'birthdate': 'birth_month_day',
+        'hired_date': 'hired_month_day',
+    }
+
     # Asosiy ma’lumotlar
     type = models.CharField(
         _("Turi"),
@@ -196,9 +315,12 @@ class Personnel(BaseModel):
     )
 
     # Qo‘shimcha ma’lumotlar
+    # Fayllar xeshi bo'yicha bir marta saqlanadi va ResumeBlob orqali havolalari sanaladi,
+    # shuning uchun django_cleanup bu modelda o'chirilgan (quyidagi cleanup.ignore)
     resume = models.FileField(
         _("Rezyume"),
         upload_to='resumes/',
+        storage=get_resume_storage,
         help_text=_("PDF formatida")
     )
 
@@ -206,6 +328,19 @@ class Personnel(BaseModel):
     hired_date = models.DateField(_("Ishga qabul qilingan sana"), null=True, blank=True)
     left_date = models.DateField(_("Ishdan ketgan sana"), null=True, blank=True)
 
+    # Tug'ilgan kun va ish yubileyi qidiruvi uchun MMDD kalitlari (dates.py ga qarang)
+    birth_month_day = models.PositiveSmallIntegerField(
+        _("Tug‘ilgan kuni (OOKK)"), editable=False, null=True, blank=True
+    )
+    hired_month_day = models.PositiveSmallIntegerField(
+        _("Ishga kirgan kuni (OOKK)"), editable=False, null=True, blank=True
+    )
+
+    objects = PersonnelQuerySet.as_manager()
+
+    # Bazadan yuklangan qiymatlar, from_db() va save() orqali yangilanadi
+    _loaded_values = None
+
     def __str__(self):
         return f"{self.fullname}"
 
@@ -217,6 +352,11 @@ class Personnel(BaseModel):
             models.Index(fields=['type', 'status']),
             models.Index(fields=['pinfl']),
             models.Index(fields=['passport']),
+            models.Index(fields=['fullname', 'id']),
+            models.Index(fields=['birthdate']),
+            models.Index(fields=['hired_date']),
+            models.Index(fields=['birth_month_day']),
+            models.Index(fields=['hired_month_day']),
         ]
 
     def clean(self):
@@ -252,46 +392,168 @@ class Personnel(BaseModel):
                 'master_graduation_year': _("Magistratura tugatgan yili bakalavr tugatgan yilidan keyin bo‘lishi kerak")
             })
 
+    def get_search_document(self):
+        """Qidiruv indeksiga yoziladigan matn"""
+        values = (getattr(self, field) for field in PersonnelSearchDocument.SOURCE_FIELDS)
+        return ' '.join(value for value in values if value).lower()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Bazadagi qiymatlarni eslab qolish (o'zgargan maydonlarni aniqlash uchun)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using, fields, from_queryset)
+        if fields:
+            fields = [self._meta.get_field(name).attname for name in fields]
+        self._take_snapshot(fields)
+
+    def _take_snapshot(self, attnames=None):
+        deferred = self.get_deferred_fields()
+        if attnames is None:
+            attnames = [field.attname for field in self._meta.concrete_fields]
+        snapshot = dict(self._loaded_values or {})
+        snapshot.update({name: getattr(self, name) for name in attnames if name not in deferred})
+        # FieldFile joyida o'zgarishi mumkin (resume.save()), shuning uchun nomi saqlanadi
+        for name, value in snapshot.items():
+            if isinstance(value, FieldFile):
+                snapshot[name] = value.name
+        self._loaded_values = snapshot
+
+    def get_changed_fields(self):
+        """
+        Bazadan yuklangandan (yoki oxirgi saqlashdan) beri o'zgargan maydonlar: {attname: (eski, yangi)}.
+        Yuklanmagan (deferred) maydonlar hisobga olinmaydi.
+        """
+        return {
+            name: (old, getattr(self, name))
+            for name, old in (self._loaded_values or {}).items()
+            if getattr(self, name) != old
+        }
+
     def save(self, force_type=None, *args, **kwargs):
         # Status o'zgarishi uchun argumentlarni ajratib olish
         changed_by = kwargs.pop('changed_by', None)
         status_change_reason = kwargs.pop('status_change_reason', '')
 
-        if not self.pk:  # Yangi obyekt
-            old_status = self.status
-        else:
-            old_obj = Personnel.objects.get(pk=self.pk)
-            old_status = old_obj.status
-
         # Agar force_type berilgan bo'lsa, type'ni o'zgartirish
         if force_type:
             self.type = force_type
 
-        # Asosiy saqlash
-        super().save(*args, **kwargs)
+        self.set_month_day_keys()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, *(
+                key for source, key in self.MONTH_DAY_KEYS.items() if source in update_fields
+            )}
+
+        adding = not self.pk
+        changes = self.get_changed_fields()
+        old_state = None if adding else self._get_loaded_state()
+        old_resume = None if adding else self._get_loaded_resume()
+        old_status = old_state[2] if old_state else self.status
+
+        # update_fields berilganda faqat shu maydonlar yoziladi: qolganlari uchun bazadagi
+        # (eski) qiymatlar hisobga olinadi va ularning o'zgarishi saqlanmagan bo'lib qoladi
+        saved = None
+        if update_fields is not None:
+            saved = {self._meta.get_field(name).attname for name in kwargs['update_fields']}
+            changes = {name: change for name, change in changes.items() if name in saved}
+        new_state = (self.position_id, self.type, self.status)
+        if saved is not None and old_state:
+            new_state = tuple(
+                new if name in saved else old
+                for name, old, new in zip(('position_id', 'type', 'status'), old_state, new_state)
+            )
 
-        # Status o'zgargan bo'lsa
-        if old_status != self.status:
+        # Asosiy saqlash va lavozim hisoblagichlari bitta tranzaksiyada
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            # Fayl nomi saqlash paytida (FileField.pre_save) aniqlanadi
+            new_resume = self.resume.name if saved is None or 'resume' in saved else old_resume
+            headcount = HeadcountDelta()
+            if old_state:
+                headcount.add(*old_state, count=-1)
+            headcount.add(*new_state)
+            headcount.apply()
+            if old_resume != new_resume:
+                ResumeBlob.change_refs({new_resume: 1, old_resume: -1})
+                ResumeText.schedule([self])
+                if self.resume:
+                    # Matnni fon ishchisi ajratadi (navbatda turgan vazifa bo'lsa yangisi qo'yilmaydi)
+                    transaction.on_commit(lambda: enqueue('personnel.extract_resume_texts', unique=True))
+        if adding or self._loaded_values is None or changes.keys() & set(PersonnelSearchDocument.SOURCE_FIELDS):
+            PersonnelSearchDocument.update_for([self])
+        self._take_snapshot(saved)
+        invalidate_counts(Personnel)
+        if old_state and old_state[1] != new_state[1]:
+            # Xodimlar/nomzodlar ro'yxatlari tarkibi o'zgardi
+            invalidate_date_buckets(Personnel)
+
+        # Status o'zgargan (va saqlangan) bo'lsa
+        new_status = new_state[2]
+        if old_status != new_status:
             # Agar xodim ishdan ketgan bo'lsa va sabab ko'rsatilmagan bo'lsa
-            if self.status == 'left' and not status_change_reason:
+            if new_status == 'left' and not status_change_reason:
                 raise ValidationError(_("Xodim ishdan ketganda sababini ko'rsatish shart!"))
 
             PersonnelStatusHistory.objects.create(
                 personnel=self,
                 old_status=old_status,
-                new_status=self.status,
+                new_status=new_status,
                 changed_by=changed_by,
                 reason=status_change_reason if status_change_reason else _("Status o'zgartirildi")
             )
-
-    def convert_to_employee(self, initial_status='working'):
-        """Nomzodni xodimga o'tkazish"""
+            invalidate_counts(PersonnelStatusHistory)
+
+    def delete(self, *args, **kwargs):
+        old_state = self._get_loaded_state()
+        old_resume = self._get_loaded_resume()
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            if old_state:
+                headcount = HeadcountDelta()
+                headcount.add(*old_state, count=-1)
+                headcount.apply()
+            ResumeBlob.change_refs({old_resume: -1})
+        invalidate_counts(Personnel, PersonnelStatusHistory)
+        invalidate_date_buckets(Personnel, PersonnelStatusHistory)
+        return result
+
+    def set_month_day_keys(self):
+        deferred = self.get_deferred_fields()
+        for source, key in self.MONTH_DAY_KEYS.items():
+            if source not in deferred:
+                value = getattr(self, source)
+                setattr(self, key, month_day_key(value) if value else None)
+
+    def _get_loaded_state(self):
+        """Bazadagi (position_id, type, status), obyekt bazadan yuklanmagan bo'lsa alohida o'qiladi"""
+        loaded = self._loaded_values or {}
+        if all(name in loaded for name in ('position_id', 'type', 'status')):
+            return loaded['position_id'], loaded['type'], loaded['status']
+        return Personnel.objects.filter(pk=self.pk).values_list('position_id', 'type', 'status').first()
+
+    def _get_loaded_resume(self):
+        loaded = self._loaded_values or {}
+        if 'resume' in loaded:
+            return loaded['resume']
+        return Personnel.objects.filter(pk=self.pk).values_list('resume', flat=True).first()
+
+    def check_convertible(self):
+        """Nomzodni xodimga o'tkazish mumkinligini tekshirish"""
         if self.type == 'EMPLOYEE':
             raise ValidationError(_("Bu foydalanuvchi allaqachon xodim!"))
 
         if self.status != 'accepted':
             raise ValidationError(_("Faqat qabul qilingan nomzodlarni xodimga o'tkazish mumkin!"))
 
+    def convert_to_employee(self, initial_status='working'):
+        """Nomzodni xodimga o'tkazish"""
+        self.check_convertible()
+
         # Status o'zgarishini saqlash
         old_status = self.status
         self.status = initial_status
@@ -300,6 +562,67 @@ class Personnel(BaseModel):
         # O'zgarishlarni saqlash (force_type bilan)
         self.save(force_type='EMPLOYEE', status_change_reason=_("Nomzod xodimga o‘tkazildi"))
 
+    @classmethod
+    def bulk_convert_to_employee(cls, queryset, initial_status='working', changed_by=None):
+        """
+        Nomzodlarni bitta UPDATE va bitta bulk_create bilan xodimga o'tkazish.
+        O'tkazilganlar soni va o'tkazib bo'lmaganlar ro'yxatini [(nomzod, xato), ...] qaytaradi.
+        """
+        if initial_status not in dict(cls.EMPLOYEE_STATUS_CHOICES) or initial_status == 'left':
+            raise ValidationError(_("Xodim uchun noto‘g‘ri holat tanlangan"))
+
+        candidates = {}
+        errors = []
+        for candidate in queryset.select_related(None).only('fullname', 'type', 'status').order_by():
+            try:
+                candidate.check_convertible()
+            except ValidationError as e:
+                errors.append((candidate, e))
+            else:
+                candidates[candidate.pk] = candidate
+
+        with transaction.atomic():
+            # Tekshiruvdan keyin holati o'zgargan qatorlarni chiqarib tashlash
+            converted = list(
+                cls.objects.select_for_update()
+                .filter(pk__in=candidates, type='CANDIDATE', status='accepted')
+                .order_by()
+                .values_list('pk', 'position_id')
+            )
+            converted_ids = [pk for pk, position_id in converted]
+            cls.objects.filter(pk__in=converted_ids).update(
+                type='EMPLOYEE',
+                status=initial_status,
+                updated_at=timezone.now()
+            )
+            PersonnelStatusHistory.objects.bulk_create([
+                PersonnelStatusHistory(
+                    personnel_id=pk,
+                    old_status='accepted',
+                    new_status=initial_status,
+                    changed_by=changed_by,
+                    reason=_("Nomzod xodimga o‘tkazildi")
+                )
+                for pk in converted_ids
+            ])
+            headcount = HeadcountDelta()
+            for pk, position_id in converted:
+                headcount.add(position_id, 'CANDIDATE', 'accepted', -1)
+                headcount.add(position_id, 'EMPLOYEE', initial_status)
+            headcount.apply()
+
+        for pk in candidates.keys() - set(converted_ids):
+            errors.append((
+                candidates[pk],
+                ValidationError(_("Faqat qabul qilingan nomzodlarni xodimga o'tkazish mumkin!"))
+            ))
+        if converted_ids:
+            invalidate_counts(Personnel, PersonnelStatusHistory)
+            # Tashqi tranzaksiya (admin amali, fon vazifasi) yakunlangach: aks holda kunlik sonlar
+            # commit bo'lmagan tarix qatorlarisiz qayta sanalib keshlanishi mumkin
+            transaction.on_commit(lambda: invalidate_date_buckets(Personnel, PersonnelStatusHistory))
+        return len(converted_ids), errors
+
     @property
     def age(self):
         """Xodimning yoshini hisoblash"""
@@ -326,7 +649,180 @@ class Personnel(BaseModel):
         return 0
 
 
+class PersonnelSearchDocument(models.Model):
+    """
+    Xodimlar bo'yicha qidiruv indeksi.
+    SQLite'da FTS5 (trigram), PostgreSQL'da pg_trgm GIN indeksi shu jadval ustiga quriladi
+    (migratsiyaga qarang), qidiruvning o'zi search.py da.
+    """
+    SOURCE_FIELDS = (
+        'fullname',
+        'pinfl',
+        'passport',
+        'phone_number',
+        'additional_phone',
+        'bachelor_university',
+        'master_university',
+    )
+
+    personnel = models.OneToOneField(
+        Personnel,
+        verbose_name=_("Xodim"),
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='search_document'
+    )
+    document = models.TextField(_("Qidiruv matni"))
+
+    class Meta:
+        verbose_name = _("Qidiruv indeksi")
+        verbose_name_plural = _("Qidiruv indekslari")
+
+    @classmethod
+    def update_for(cls, personnel_list):
+        """Berilgan xodimlar uchun indeksni bitta UPSERT bilan yangilash"""
+        cls.objects.bulk_create(
+            [cls(personnel_id=personnel.pk, document=personnel.get_search_document())
+             for personnel in personnel_list],
+            update_conflicts=True,
+            unique_fields=['personnel'],
+            update_fields=['document'],
+        )
+
+
+class ResumeBlob(BaseModel):
+    """Rezyume fayli (xeshi bo'yicha bir marta saqlanadi) va unga havola qilayotgan xodimlar soni"""
+    name = models.CharField(_("Fayl yo‘li"), max_length=255, unique=True)
+    # Eski (xeshsiz nomlangan) fayllar uchun bo'sh
+    digest = models.CharField(_("SHA-256"), max_length=64, blank=True, db_index=True)
+    size = models.PositiveBigIntegerField(_("Hajmi"), default=0)
+    ref_count = models.PositiveIntegerField(_("Havolalar soni"), default=0)
+
+    class Meta:
+        verbose_name = _("Rezyume fayli")
+        verbose_name_plural = _("Rezyume fayllari")
+        indexes = [
+            models.Index(fields=['ref_count', 'updated_at'], name='personnel_resumeblob_gc_idx'),
+        ]
+
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def change_refs(cls, deltas):
+        """{fayl nomi: o'zgarish} bo'yicha havolalar sonini yangilash (bo'sh nomlar e'tiborsiz)"""
+        for name, delta in deltas.items():
+            if name and delta:
+                cls.objects.filter(name=name).update(
+                    ref_count=Greatest(F('ref_count') + delta, Value(0)),
+                    updated_at=timezone.now()
+                )
+
+    @classmethod
+    def release_rows(cls, personnel_queryset):
+        """O'chirilayotgan xodimlar fayllari havolalarini kamaytirish"""
+        rows = (
+            personnel_queryset.order_by().exclude(resume='')
+            .values_list('resume').annotate(count=Count('pk'))
+        )
+        cls.change_refs({name: -count for name, count in rows})
+
+    @classmethod
+    def find(cls, digest):
+        """Bir xil mazmunli fayl allaqachon saqlanganmi"""
+        return cls.objects.filter(digest=digest).first()
+
+
+class ResumeText(models.Model):
+    """
+    Rezyumedan ajratib olingan (normallashtirilgan) matn.
+    Rezyume almashtirilganda qator 'pending' holatiga qaytadi, matnni esa resume_text.py dagi
+    fon jarayoni ajratadi. Qidiruv indeksi migratsiyada quriladi (SQLite FTS5, PostgreSQL GIN).
+    """
+    STATUS_CHOICES = [
+        ('pending', _('Navbatda')),
+        ('done', _('Tayyor')),
+        ('failed', _('Xatolik')),
+    ]
+
+    personnel = models.OneToOneField(
+        Personnel,
+        verbose_name=_("Xodim"),
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='resume_text'
+    )
+    # Matn qaysi fayldan olingani (Personnel.resume nomi)
+    source = models.CharField(_("Fayl"), max_length=255)
+    text = models.TextField(_("Matn"), blank=True)
+    status = models.CharField(_("Holati"), max_length=10, choices=STATUS_CHOICES, default='pending')
+    error = models.TextField(_("Xatolik"), blank=True)
+    updated_at = models.DateTimeField(_("Yangilangan vaqti"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("Rezyume matni")
+        verbose_name_plural = _("Rezyume matnlari")
+        indexes = [
+            models.Index(fields=['status', 'source'], name='personnel_resumetext_status'),
+        ]
+
+    @classmethod
+    def schedule(cls, personnel_list):
+        """Berilgan xodimlar rezyumesini qayta ajratish uchun navbatga qo'yish"""
+        empty = [personnel.pk for personnel in personnel_list if not personnel.resume]
+        if empty:
+            cls.objects.filter(personnel_id__in=empty).delete()
+        cls.objects.bulk_create(
+            [cls(personnel_id=personnel.pk, source=personnel.resume.name, text='', status='pending', error='')
+             for personnel in personnel_list if personnel.resume],
+            update_conflicts=True,
+            unique_fields=['personnel'],
+            update_fields=['source', 'text', 'status', 'error', 'updated_at'],
+        )
+
+
+class HeadcountSnapshot(models.Model):
+    """
+    Kun oxiridagi band o'rinlar soni (lavozim, tur, holat bo'yicha).
+    Qatorlar faqat holat o'zgargan kunlar uchun yoziladi va o'sha kunning to'liq holatini
+    saqlaydi: ixtiyoriy sanadagi holat - shu sanagacha bo'lgan oxirgi snapshot (snapshots.py).
+    """
+    date = models.DateField(_("Sana"))
+    position = models.ForeignKey(
+        'departments.Position',
+        verbose_name=_("Lavozimi"),
+        on_delete=models.CASCADE,
+        related_name='headcount_snapshots'
+    )
+    department = models.ForeignKey(
+        'departments.Department',
+        verbose_name=_("Bo‘lim"),
+        on_delete=models.CASCADE,
+        related_name='headcount_snapshots'
+    )
+    type = models.CharField(_("Turi"), max_length=255, choices=Personnel.TYPE_CHOICES)
+    status = models.CharField(_("Holati"), max_length=255)
+    count = models.PositiveIntegerField(_("Soni"), default=0)
+
+    class Meta:
+        verbose_name = _("Band o‘rinlar snapshoti")
+        verbose_name_plural = _("Band o‘rinlar snapshotlari")
+        ordering = ['-date']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['date', 'position', 'type', 'status'], name='personnel_headcountsnapshot_unique'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['department', 'date'], name='personnel_headcount_dept_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.position_id} {self.status}: {self.count}"
+
+
 # Proxy modellar
+@cleanup.ignore
 class Employee(Personnel):
     class Meta:
         proxy = True
@@ -338,6 +834,7 @@ class Employee(Personnel):
             self.type = 'EMPLOYEE'
         super().save(*args, **kwargs)
 
+@cleanup.ignore
 class Candidate(Personnel):
     class Meta:
         proxy = True
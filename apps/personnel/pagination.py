@@ -0,0 +1,152 @@
+"""
+Admin ro'yxatlari uchun keyset (seek) sahifalash.
+
+OFFSET/LIMIT o'rniga oxirgi ko'rsatilgan qatorning kalitidan keyingi qatorlar olinadi,
+shuning uchun chuqur sahifalar ham birinchi sahifa kabi tez ochiladi.
+Admin klassida keyset_pagination = True va keyset_ordering belgilanadi.
+"""
+import base64
+import binascii
+import json
+
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList, ORDER_VAR
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage
+from django.db.models import Q
+
+AFTER_VAR = 'after'
+BEFORE_VAR = 'before'
+
+
+def encode_cursor(values):
+    # DjangoJSONEncoder mikrosekundlarni qisqartiradi, kursor esa aniq bo'lishi kerak
+    values = [value.isoformat() if hasattr(value, 'isoformat') else value for value in values]
+    data = json.dumps(values, separators=(',', ':'))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, fields):
+    """Kursorni model maydonlari turlariga o'tkazib qaytarish"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(fields):
+            raise ValueError(cursor)
+        return [field.to_python(value) for field, value in zip(fields, values)]
+    except (ValueError, TypeError, binascii.Error, ValidationError) as e:
+        raise IncorrectLookupParameters(e)
+
+
+def seek_filter(ordering, values, backwards=False):
+    """(a, b) > (x, y) shartini a > x OR (a = x AND b > y) ko'rinishida qurish"""
+    condition = Q()
+    equal = {}
+    for field, value in zip(ordering, values):
+        name = field.lstrip('-')
+        descending = field.startswith('-')
+        lookup = 'lt' if descending != backwards else 'gt'
+        condition |= Q(**equal, **{f'{name}__{lookup}': value})
+        equal[name] = value
+    return condition
+
+
+def reverse_ordering(ordering):
+    return [field[1:] if field.startswith('-') else f'-{field}' for field in ordering]
+
+
+class KeysetChangeList(ChangeList):
+    """
+    Admin ustun bo'yicha saralanmagan bo'lsa keyset sahifalashdan foydalanadigan ChangeList.
+    Filtrlangan va umumiy sonlarni admin paginatori orqali oladi.
+    """
+
+    keyset_previous_url = None
+    keyset_next_url = None
+
+    @property
+    def keyset_active(self):
+        return getattr(self.model_admin, 'keyset_pagination', False) and ORDER_VAR not in self.params
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        for var in (AFTER_VAR, BEFORE_VAR):
+            lookup_params.pop(var, None)
+        return lookup_params
+
+    def get_query_string(self, new_params=None, remove=None):
+        # Filtr va saralash havolalari har doim birinchi sahifadan boshlanadi
+        remove = [*(remove or []), AFTER_VAR, BEFORE_VAR]
+        return super().get_query_string(new_params, remove)
+
+    def get_ordering(self, request, queryset):
+        if self.keyset_active:
+            return list(self.model_admin.keyset_ordering)
+        return super().get_ordering(request, queryset)
+
+    def get_results(self, request):
+        # ChangeList.get_results bilan bir xil, faqat umumiy son ham admin paginatori orqali
+        # olinadi (CachedCountPaginator bo'lsa keshdan) va keyset sahifa qo'shiladi
+        paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        result_count = paginator.count
+        if self.model_admin.show_full_result_count:
+            full_result_count = self.model_admin.get_paginator(
+                request, self.root_queryset, self.list_per_page
+            ).count
+        else:
+            full_result_count = None
+        can_show_all = result_count <= self.list_max_show_all
+        multi_page = result_count > self.list_per_page
+
+        if (self.show_all and can_show_all) or not multi_page:
+            result_list = self.queryset._clone()
+        elif self.keyset_active:
+            result_list = self.get_keyset_page(request)
+        else:
+            try:
+                result_list = paginator.page(self.page_num).object_list
+            except InvalidPage:
+                raise IncorrectLookupParameters
+
+        self.result_count = result_count
+        self.show_full_result_count = self.model_admin.show_full_result_count
+        self.show_admin_actions = not self.show_full_result_count or bool(full_result_count)
+        self.full_result_count = full_result_count
+        self.result_list = result_list
+        self.can_show_all = can_show_all
+        self.multi_page = multi_page
+        self.paginator = paginator
+
+    def get_keyset_page(self, request):
+        ordering = list(self.model_admin.keyset_ordering)
+        names = [field.lstrip('-') for field in ordering]
+        fields = [
+            self.lookup_opts.pk if name == 'pk' else self.lookup_opts.get_field(name)
+            for name in names
+        ]
+        after = request.GET.get(AFTER_VAR)
+        before = request.GET.get(BEFORE_VAR)
+        queryset = self.queryset
+
+        if before:
+            values = decode_cursor(before, fields)
+            queryset = queryset.filter(seek_filter(ordering, values, backwards=True))
+            rows = list(queryset.order_by(*reverse_ordering(ordering))[:self.list_per_page + 1])
+            has_previous = len(rows) > self.list_per_page
+            rows = rows[:self.list_per_page][::-1]
+            has_next = True
+        else:
+            if after:
+                queryset = queryset.filter(seek_filter(ordering, decode_cursor(after, fields)))
+            rows = list(queryset[:self.list_per_page + 1])
+            has_next = len(rows) > self.list_per_page
+            rows = rows[:self.list_per_page]
+            has_previous = bool(after)
+
+        if rows and has_previous:
+            cursor = encode_cursor([getattr(rows[0], name) for name in names])
+            self.keyset_previous_url = self.get_query_string({BEFORE_VAR: cursor})
+        if rows and has_next:
+            cursor = encode_cursor([getattr(rows[-1], name) for name in names])
+            self.keyset_next_url = self.get_query_string({AFTER_VAR: cursor})
+        return rows
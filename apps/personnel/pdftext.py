@@ -0,0 +1,29 @@
+"""
+PDF dan matn ajratish. Modul Django'ni import qilmaydi, shuning uchun ProcessPoolExecutor
+ishchi jarayonlarida (spawn rejimida ham) sozlamalarsiz ishlaydi.
+"""
+import io
+import re
+import unicodedata
+
+# Juda katta hujjatlar indeksni shishirib yubormasligi uchun
+MAX_TEXT_LENGTH = 200000
+
+WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_text(text):
+    text = unicodedata.normalize('NFKC', text).lower()
+    return WHITESPACE.sub(' ', text).strip()[:MAX_TEXT_LENGTH]
+
+
+def extract_pdf_text(data):
+    """Ishchi jarayonda bajariladi: (matn, xatolik) qaytaradi"""
+    try:
+        from pypdf import PdfReader
+
+        reader = PdfReader(io.BytesIO(data))
+        text = ' '.join(page.extract_text() or '' for page in reader.pages)
+        return normalize_text(text), ''
+    except Exception as e:
+        return '', f'{type(e).__name__}: {e}'
@@ -0,0 +1,108 @@
+"""
+Rezyume PDF fayllaridan matn ajratish.
+
+Personnel.save() rezyume o'zgarganda ResumeText qatorini 'pending' holatiga qo'yadi, so'rov
+ichida esa hech qanday PDF o'qilmaydi. extract_pending() navbatdagi qatorlarni bo'laklab oladi,
+fayl baytlarini o'qiydi va ajratishni ProcessPoolExecutor ga beradi (pdftext.py, ishchi
+jarayonlarga Django kerak emas). Bir xil fayl (mazmuni bo'yicha bitta nom, storage.py ga
+qarang) bir marta ajratiladi va unga havola qilayotgan barcha xodimlarga yoziladi.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.db.models.expressions import RawSQL
+
+from .models import Personnel, ResumeText
+from .pdftext import extract_pdf_text
+from .storage import resume_storage
+
+FTS_TABLE = 'personnel_resume_fts'
+
+
+def read_resume(name):
+    try:
+        with resume_storage.open(name) as file:
+            return file.read()
+    except OSError:
+        return None
+
+
+def extract_pending(batch_size=50, workers=None, on_batch=None):
+    """
+    Navbatdagi barcha rezyumelarni ajratish, qayta ishlangan fayllar sonini qaytaradi.
+    workers=0 bo'lsa joriy jarayonda ishlaydi (testlar va kichik hajmlar uchun).
+    """
+    executor = ProcessPoolExecutor(max_workers=workers) if workers != 0 else None
+    processed = 0
+    try:
+        while True:
+            sources = list(
+                ResumeText.objects.filter(status='pending')
+                .order_by('source').values_list('source', flat=True).distinct()[:batch_size]
+            )
+            if not sources:
+                return processed
+
+            contents = {name: read_resume(name) for name in sources}
+            readable = [name for name in sources if contents[name] is not None]
+            payloads = [contents[name] for name in readable]
+            if executor:
+                results = list(executor.map(extract_pdf_text, payloads))
+            else:
+                results = [extract_pdf_text(data) for data in payloads]
+            results = dict(zip(readable, results))
+
+            with transaction.atomic():
+                for name in sources:
+                    text, error = results.get(name, ('', 'Fayl topilmadi'))
+                    # Shu orada rezyumesi almashtirilgan qatorlar source bo'yicha chetda qoladi
+                    ResumeText.objects.filter(source=name, status='pending').update(
+                        text=text, error=error, status='failed' if error else 'done'
+                    )
+            processed += len(sources)
+            if on_batch:
+                on_batch(processed)
+    finally:
+        if executor:
+            executor.shutdown()
+
+
+def schedule_missing(batch_size=1000):
+    """Matni hali ajratilmagan, xatolik bilan tugagan yoki eskirgan xodimlarni navbatga qo'yish"""
+    stale = Personnel.objects.exclude(resume='').filter(
+        Q(resume_text__isnull=True) | Q(resume_text__status='failed') | ~Q(resume_text__source=F('resume'))
+    )
+    scheduled = 0
+    batch = []
+    for personnel in stale.only('pk', 'resume').iterator(chunk_size=batch_size):
+        batch.append(personnel)
+        if len(batch) >= batch_size:
+            ResumeText.schedule(batch)
+            scheduled += len(batch)
+            batch = []
+    if batch:
+        ResumeText.schedule(batch)
+        scheduled += len(batch)
+    return scheduled
+
+
+def search_resumes(terms):
+    """Barcha so'zlar uchragan rezyumelar egalari (personnel_id) uchun subquery"""
+    if connection.vendor == 'sqlite':
+        return RawSQL(
+            f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s',
+            # So'z boshi bo'yicha (prefix) qidiruv: "pyth" * -> python
+            [' '.join('"%s" *' % term.replace('"', '""') for term in terms)]
+        )
+    if connection.vendor == 'postgresql':
+        return RawSQL(
+            "SELECT personnel_id FROM personnel_resumetext "
+            "WHERE to_tsvector('simple', text) @@ to_tsquery('simple', %s)",
+            # SQLite'dagi kabi so'z boshi bo'yicha: 'pyth':* & 'uzcard':*
+            [' & '.join("'%s':*" % term.replace('\\', '\\\\').replace("'", "''") for term in terms)]
+        )
+    documents = ResumeText.objects.all()
+    for term in terms:
+        documents = documents.filter(text__contains=term)
+    return documents.values('personnel_id')
@@ -0,0 +1,70 @@
+"""
+Xodimlar bo'yicha to'liq matnli qidiruv.
+
+Indeks PersonnelSearchDocument jadvalida saqlanadi va Personnel.save() orqali yangilanadi.
+SQLite'da uning ustiga FTS5 (trigram) virtual jadvali, PostgreSQL'da pg_trgm GIN indeksi quriladi.
+"""
+from django.db import connection, transaction
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from .models import Personnel, PersonnelSearchDocument
+from .resume_text import search_resumes
+
+FTS_TABLE = 'personnel_search_fts'
+
+# Trigram tokenizer 3 belgidan qisqa so'zlarni topa olmaydi
+MIN_FTS_TERM_LENGTH = 3
+
+
+def _fts_phrase(term):
+    return '"%s"' % term.replace('"', '""')
+
+
+def search_personnel(queryset, search_term):
+    """Qidiruv so'zlarining barchasi asosiy maydonlarda yoki rezyume matnida uchragan xodimlar"""
+    terms = search_term.lower().split()
+    if not terms:
+        return queryset
+
+    documents = PersonnelSearchDocument.objects.all()
+    fts_terms = []
+    for term in terms:
+        if connection.vendor == 'sqlite' and len(term) >= MIN_FTS_TERM_LENGTH:
+            fts_terms.append(_fts_phrase(term))
+        else:
+            # PostgreSQL'da LIKE '%...%' pg_trgm GIN indeksidan foydalanadi
+            documents = documents.filter(document__contains=term)
+
+    if fts_terms:
+        documents = documents.filter(personnel_id__in=RawSQL(
+            f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s',
+            [' '.join(fts_terms)]
+        ))
+    return queryset.filter(Q(pk__in=documents.values('personnel_id')) | Q(pk__in=search_resumes(terms)))
+
+
+def rebuild_search_index(batch_size=1000):
+    """Indeksni noldan qayta qurish, yozilgan hujjatlar sonini qaytaradi"""
+    count = 0
+    with transaction.atomic():
+        PersonnelSearchDocument.objects.all().delete()
+        batch = []
+        queryset = Personnel.objects.only(*PersonnelSearchDocument.SOURCE_FIELDS)
+        for personnel in queryset.iterator(chunk_size=batch_size):
+            batch.append(PersonnelSearchDocument(
+                personnel_id=personnel.pk,
+                document=personnel.get_search_document()
+            ))
+            if len(batch) >= batch_size:
+                PersonnelSearchDocument.objects.bulk_create(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            PersonnelSearchDocument.objects.bulk_create(batch)
+            count += len(batch)
+
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    return count
@@ -0,0 +1,157 @@
+"""
+Band o'rinlarning kunlik snapshotlari (HeadcountSnapshot).
+
+Holat jadvalning joriy ko'rinishidan boshlab orqaga qarab tiklanadi: kun oxiridagi holat =
+keyingi kun oxiridagi holat - o'sha kundagi PersonnelStatusHistory o'tishlari (teskari
+tartibda) - o'sha kuni qo'shilgan xodimlar. Shuning uchun faqat oynadagi (start..bugun) tarix
+qatorlari va ularga tegishli xodimlar o'qiladi; kunlik yangilash ham, o'tmishni tiklash ham
+bitta build_snapshots() bilan bajariladi.
+
+    build_snapshots()                                 # oxirgi snapshotdan kechagacha
+    count_as_of(date(2025, 6, 1), department=dept, type='EMPLOYEE', status='working')
+
+Cheklovlar: tarixda lavozim o'zgarishlari yozilmaydi, shuning uchun o'tgan kunlar xodimning
+joriy lavozimi bo'yicha hisoblanadi; o'chirilgan xodimlar tarixi bilan birga yo'qoladi.
+"""
+from collections import Counter, defaultdict
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import Count, Min, Q, Subquery, Sum
+from django.utils import timezone
+
+from apps.departments.models import Position
+from .models import HeadcountSnapshot, Personnel, PersonnelStatusHistory
+
+ONE_DAY = timedelta(days=1)
+
+# Holat -> tur (nomzod va xodim holatlari kesishmaydi)
+STATUS_TYPES = {
+    **{status: 'CANDIDATE' for status, label in Personnel.CANDIDATE_STATUS_CHOICES},
+    **{status: 'EMPLOYEE' for status, label in Personnel.EMPLOYEE_STATUS_CHOICES},
+}
+
+
+def start_of_day(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def headcount_as_of(day):
+    """day kuni oxiridagi holat: shu kungacha bo'lgan oxirgi snapshot qatorlari"""
+    latest = HeadcountSnapshot.objects.filter(date__lte=day).order_by('-date').values('date')[:1]
+    return HeadcountSnapshot.objects.filter(date=Subquery(latest))
+
+
+def count_as_of(day, **filters):
+    """Masalan: count_as_of(day, department=dept, type='EMPLOYEE', status='working')"""
+    return headcount_as_of(day).filter(**filters).aggregate(total=Sum('count'))['total'] or 0
+
+
+def stored_counts(day):
+    return Counter({
+        (position_id, type, status): count
+        for position_id, type, status, count in
+        headcount_as_of(day).values_list('position_id', 'type', 'status', 'count')
+        if count
+    })
+
+
+def default_start():
+    """Oxirgi snapshotdan keyingi kun, snapshot bo'lmasa birinchi xodim qo'shilgan kun"""
+    last = HeadcountSnapshot.objects.order_by('-date').values_list('date', flat=True).first()
+    if last:
+        return last + ONE_DAY
+    first = Personnel.objects.aggregate(first=Min('created_at'))['first']
+    return timezone.localdate(first) if first else None
+
+
+def build_snapshots(start=None, end=None):
+    """
+    start..end (standart: oxirgi snapshotdan keyin..kecha) kunlari snapshotlarini qayta qurish.
+    Yozilgan kunlar sonini qaytaradi.
+    """
+    today = timezone.localdate()
+    end = end or today - ONE_DAY
+    start = start or default_start()
+    if start is None or start > end:
+        return 0
+    since = start_of_day(start)
+
+    # Oynadagi o'tishlar: kun -> [(xodim, oldingi holat), ...] vaqt bo'yicha
+    transitions = defaultdict(list)
+    history = (
+        PersonnelStatusHistory.objects.filter(created_at__gte=since)
+        .order_by('created_at', 'pk')
+        .values_list('personnel_id', 'old_status', 'created_at')
+    )
+    for personnel_id, old_status, created_at in history.iterator(chunk_size=2000):
+        transitions[timezone.localdate(created_at)].append((personnel_id, old_status))
+
+    # Faqat oynada o'zgargan yoki qo'shilgan xodimlarning joriy holati
+    state = {}
+    added = defaultdict(list)
+    touched = Personnel.objects.filter(
+        Q(created_at__gte=since)
+        | Q(pk__in=PersonnelStatusHistory.objects.filter(created_at__gte=since).values('personnel_id'))
+    ).order_by().values_list('pk', 'position_id', 'type', 'status', 'created_at')
+    for pk, position_id, type, status, created_at in touched.iterator(chunk_size=2000):
+        state[pk] = (position_id, type, status)
+        created = timezone.localdate(created_at)
+        if created >= start:
+            added[created].append(pk)
+
+    counts = Counter({
+        (position_id, type, status): count
+        for position_id, type, status, count in
+        Personnel.objects.order_by().values_list('position_id', 'type', 'status').annotate(count=Count('pk'))
+    })
+
+    def undo(day):
+        """day kuni oxiridagi holatdan oldingi kun oxiridagi holatga o'tish"""
+        for personnel_id, old_status in reversed(transitions.pop(day, ())):
+            if personnel_id not in state:
+                continue
+            position_id, type, status = state[personnel_id]
+            counts[(position_id, type, status)] -= 1
+            state[personnel_id] = (position_id, STATUS_TYPES.get(old_status, type), old_status)
+            counts[state[personnel_id]] += 1
+        for pk in added.pop(day, ()):
+            counts[state[pk]] -= 1
+
+    day = today
+    while day > end:
+        undo(day)
+        day -= ONE_DAY
+
+    snapshots = {}
+    current = +counts
+    while day >= start:
+        undo(day)
+        previous = +counts
+        if day == start:
+            # Oynadan oldingi holat bazadagi snapshotlar bilan solishtiriladi
+            previous = stored_counts(start - ONE_DAY)
+        if current != previous:
+            snapshots[day] = (current, previous)
+        current = previous
+        day -= ONE_DAY
+
+    departments = dict(Position.objects.values_list('pk', 'department_id'))
+    rows = [
+        HeadcountSnapshot(
+            date=day,
+            position_id=position_id,
+            department_id=departments[position_id],
+            type=type,
+            status=status,
+            # Nolga tushgan kalitlar ham yoziladi, shunda kunning holati to'liq bo'ladi
+            count=current[(position_id, type, status)],
+        )
+        for day, (current, previous) in snapshots.items()
+        for position_id, type, status in current.keys() | previous.keys()
+        if position_id in departments
+    ]
+    with transaction.atomic():
+        HeadcountSnapshot.objects.filter(date__gte=start, date__lte=end).delete()
+        HeadcountSnapshot.objects.bulk_create(rows, batch_size=1000)
+    return len(snapshots)
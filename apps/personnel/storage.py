@@ -0,0 +1,153 @@
+"""
+Rezyumelar uchun mazmun bo'yicha manzillanadigan (content-addressed) saqlash.
+
+Fayl nomi uning SHA-256 xeshidan olinadi (resumes/ab/abcd....pdf), shuning uchun bir xil
+fayl necha marta yuklanmasin, diskda bitta nusxa saqlanadi. Har bir fayl uchun ResumeBlob
+qatori mavjud, unga havola qilayotgan xodimlar soni Personnel.save()/delete() da yuritiladi,
+havolasiz qolgan fayllar esa collect_garbage() (gc_resumes buyrug'i) bilan o'chiriladi.
+"""
+import hashlib
+import posixpath
+from datetime import timedelta
+
+from django.core.files.storage import Storage, storages
+from django.core.files.uploadhandler import MemoryFileUploadHandler, TemporaryFileUploadHandler
+from django.db import transaction
+from django.utils import timezone
+
+
+def file_digest(content):
+    digest = hashlib.sha256()
+    content.seek(0)
+    for chunk in content.chunks():
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ContentAddressedStorage(Storage):
+    """Asosiy (STORAGES['default']) saqlash ustidagi qatlam: nomlash va ResumeBlob yuritish"""
+
+    @property
+    def backend(self):
+        # storages o'zi keshlaydi, override_settings(STORAGES=...) ham hisobga olinadi
+        return storages['default']
+
+    def get_available_name(self, name, max_length=None):
+        # Yakuniy nom _save() da xeshdan olinadi
+        return name
+
+    def _save(self, name, content):
+        from .models import ResumeBlob
+
+        # Yuklash vaqtida hisoblangan xesh (HashingUploadMixin), bo'lmasa fayl qayta o'qiladi
+        digest = getattr(content, 'sha256', None) or file_digest(content)
+        directory, filename = posixpath.split(name)
+        extension = posixpath.splitext(filename)[1].lower()
+        name = posixpath.join(directory, digest[:2], digest + extension)
+
+        with transaction.atomic():
+            # Avval qator qulflanadi: collect_garbage() shu qatorni o'chirayotgan bo'lsa uning
+            # tranzaksiyasi tugashi kutiladi va qator qaytadan yaratiladi. updated_at yangilanadi,
+            # shunda bo'sh turgan fayl shu paytda o'chirib yuborilmaydi
+            blob, created = ResumeBlob.objects.select_for_update().get_or_create(
+                name=name, defaults={'digest': digest, 'size': content.size}
+            )
+            if not created:
+                blob.save(update_fields=['updated_at'])
+            # Fayl mavjudligi qulf ostida tekshiriladi (tozalash uni o'chirgan bo'lishi mumkin)
+            if not self.backend.exists(name):
+                content.seek(0)
+                self.backend.save(name, content)
+        return name
+
+    def _open(self, name, mode='rb'):
+        return self.backend.open(name, mode)
+
+    def delete(self, name):
+        self.backend.delete(name)
+
+    def exists(self, name):
+        return self.backend.exists(name)
+
+    def listdir(self, path):
+        return self.backend.listdir(path)
+
+    def size(self, name):
+        return self.backend.size(name)
+
+    def url(self, name):
+        return self.backend.url(name)
+
+    def path(self, name):
+        return self.backend.path(name)
+
+    def get_modified_time(self, name):
+        return self.backend.get_modified_time(name)
+
+
+resume_storage = ContentAddressedStorage()
+
+
+def get_resume_storage():
+    return resume_storage
+
+
+def collect_garbage(batch_size=500, grace=timedelta(hours=1)):
+    """
+    Havolasi qolmagan fayllarni bo'laklab o'chirish, o'chirilganlar sonini qaytaradi.
+    grace - yangi yuklangan (hali Personnel bilan bog'lanmagan) fayllarni himoya qilish uchun.
+    """
+    from .models import ResumeBlob
+
+    cutoff = timezone.now() - grace
+    deleted = 0
+    last_pk = 0
+    while True:
+        pks = list(
+            ResumeBlob.objects.filter(ref_count=0, updated_at__lt=cutoff, pk__gt=last_pk)
+            .order_by('pk').values_list('pk', flat=True)[:batch_size]
+        )
+        if not pks:
+            return deleted
+        last_pk = pks[-1]
+        with transaction.atomic():
+            # Tanlangandan keyin havola olgan qatorlar qayta tekshiriladi
+            names = list(
+                ResumeBlob.objects.select_for_update()
+                .filter(pk__in=pks, ref_count=0, updated_at__lt=cutoff)
+                .values_list('name', flat=True)
+            )
+            ResumeBlob.objects.filter(name__in=names).delete()
+            # Fayllar qatorlar qulfi ostida o'chiriladi: bir xil fayl yuklayotgan _save() commit'gacha
+            # kutadi, keyin qatorni ham, faylni ham qaytadan yaratadi
+            for name in names:
+                resume_storage.delete(name)
+        deleted += len(names)
+
+
+class HashingUploadMixin:
+    """Yuklanayotgan faylning SHA-256 xeshini oqim davomida hisoblab, faylga sha256 sifatida biriktiradi"""
+
+    def new_file(self, *args, **kwargs):
+        # MemoryFileUploadHandler.new_file() StopFutureHandlers ko'tarishi mumkin
+        self.sha256 = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        if getattr(self, 'activated', True):
+            self.sha256.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        if file is not None:
+            file.sha256 = self.sha256.hexdigest()
+        return file
+
+
+class HashingMemoryFileUploadHandler(HashingUploadMixin, MemoryFileUploadHandler):
+    pass
+
+
+class HashingTemporaryFileUploadHandler(HashingUploadMixin, TemporaryFileUploadHandler):
+    pass
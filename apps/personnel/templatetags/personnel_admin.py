@@ -0,0 +1,115 @@
+import datetime
+
+from django import template
+from django.contrib.admin.templatetags.admin_list import date_hierarchy
+from django.contrib.admin.templatetags.base import InclusionAdminNode
+from django.utils import formats
+from django.utils.text import capfirst
+from django.utils.translation import gettext as _
+
+register = template.Library()
+
+
+def _sum_by(buckets, key):
+    counts = {}
+    for day, count in buckets.items():
+        counts[key(day)] = counts.get(key(day), 0) + count
+    return sorted(counts.items())
+
+
+def cached_date_hierarchy(cl):
+    """
+    Standart date_hierarchy bilan bir xil panel, yil/oy/kun ro'yxatlari esa
+    ChangeList.date_buckets() dagi keshlangan kunlik sonlardan olinadi.
+    """
+    buckets = cl.date_buckets() if hasattr(cl, 'date_buckets') else None
+    if buckets is None:
+        return date_hierarchy(cl)
+
+    field_name = cl.date_hierarchy
+    year_field = '%s__year' % field_name
+    month_field = '%s__month' % field_name
+    day_field = '%s__day' % field_name
+    year_lookup = cl.params.get(year_field)
+    month_lookup = cl.params.get(month_field)
+    day_lookup = cl.params.get(day_field)
+
+    def link(filters):
+        return cl.get_query_string(filters, ['%s__' % field_name])
+
+    def title(text, count):
+        return f'{text} ({count})'
+
+    if not (year_lookup or month_lookup or day_lookup) and buckets:
+        # Boshlang'ich daraja: hamma qatorlar bir yil/oyda bo'lsa shu daraja ochiladi
+        first, last = min(buckets), max(buckets)
+        if first.year == last.year:
+            year_lookup = first.year
+            if first.month == last.month:
+                month_lookup = first.month
+
+    if year_lookup and month_lookup and day_lookup:
+        day = datetime.date(int(year_lookup), int(month_lookup), int(day_lookup))
+        return {
+            'show': True,
+            'back': {
+                'link': link({year_field: year_lookup, month_field: month_lookup}),
+                'title': capfirst(formats.date_format(day, 'YEAR_MONTH_FORMAT')),
+            },
+            'choices': [
+                {'title': title(capfirst(formats.date_format(day, 'MONTH_DAY_FORMAT')), buckets.get(day, 0))}
+            ],
+        }
+    if year_lookup and month_lookup:
+        year, month = int(year_lookup), int(month_lookup)
+        days = _sum_by(
+            {day: count for day, count in buckets.items() if (day.year, day.month) == (year, month)},
+            lambda day: day,
+        )
+        return {
+            'show': True,
+            'back': {'link': link({year_field: year_lookup}), 'title': str(year_lookup)},
+            'choices': [
+                {
+                    'link': link({year_field: year_lookup, month_field: month_lookup, day_field: day.day}),
+                    'title': title(capfirst(formats.date_format(day, 'MONTH_DAY_FORMAT')), count),
+                }
+                for day, count in days
+            ],
+        }
+    if year_lookup:
+        year = int(year_lookup)
+        months = _sum_by(
+            {day: count for day, count in buckets.items() if day.year == year},
+            lambda day: day.replace(day=1),
+        )
+        return {
+            'show': True,
+            'back': {'link': link({}), 'title': _('All dates')},
+            'choices': [
+                {
+                    'link': link({year_field: year_lookup, month_field: month.month}),
+                    'title': title(capfirst(formats.date_format(month, 'YEAR_MONTH_FORMAT')), count),
+                }
+                for month, count in months
+            ],
+        }
+    return {
+        'show': True,
+        'back': None,
+        'choices': [
+            {'link': link({year_field: str(year)}), 'title': title(str(year), count)}
+            for year, count in _sum_by(buckets, lambda day: day.year)
+        ],
+    }
+
+
+@register.tag(name='cached_date_hierarchy')
+def cached_date_hierarchy_tag(parser, token):
+    return InclusionAdminNode(
+        parser,
+        token,
+        func=cached_date_hierarchy,
+        template_name='date_hierarchy.html',
+        takes_context=False,
+    )
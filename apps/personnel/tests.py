@@ -1,3 +1,1004 @@
-from django.test import TestCase
+import csv
+import os
+import tempfile
+from datetime import date, datetime, timedelta
+from io import BytesIO, StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.core.models import Region, District, Nation, EducationLevel
+from apps.core.testing import TEST_CACHES, TEST_STORAGES, ChangelistQueryCountMixin
+from apps.departments.models import DepartmentType, Department, Position
+from apps.jobs.models import Job
+from apps.jobs.queue import work
+from .admin import BasePersonnelAdmin, EmployeeAdmin, PersonnelStatusHistoryAdmin
+from .models import Personnel, PersonnelSearchDocument, PersonnelStatusHistory, ResumeBlob, ResumeText
+from .search import search_personnel
+from .counts import cached_count
+from .importers import PersonnelImporter
+from .resume_text import extract_pending
+from .snapshots import build_snapshots, count_as_of
+from .storage import resume_storage
+
+User = get_user_model()
+
+
+class PersonnelTestMixin:
+    """Testlar uchun umumiy ma'lumotlar"""
+
+    @classmethod
+    def setUpTestData(cls):
+        region = Region.objects.create(name='Toshkent shahri')
+        cls.district = District.objects.create(region=region, name='Chilonzor tumani')
+        cls.nation = Nation.objects.create(name='O‘zbek')
+        cls.education_level = EducationLevel.objects.create(name='Oliy')
+        department_type = DepartmentType.objects.create(name='Markaziy apparat')
+        cls.departments = [
+            Department.objects.create(type=department_type, name=f'Bo‘lim {i}')
+            for i in range(3)
+        ]
+        cls.positions = [
+            Position.objects.create(department=department, name='Mutaxassis', number_of_jobs=10)
+            for department in cls.departments
+        ]
+        cls.superuser = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+
+    @classmethod
+    def create_personnel(cls, number, **kwargs):
+        defaults = {
+            'type': 'EMPLOYEE',
+            'status': 'working',
+            'position': cls.positions[number % len(cls.positions)],
+            'fullname': f'Xodim {number:04d}',
+            'birthdate': date(1990, 1, 1),
+            'birthplace': cls.district,
+            'nationality': cls.nation,
+            'gender': 'male',
+            'pinfl': f'{number:014d}',
+            'passport': f'AA{number:07d}',
+            'place_of_residence': cls.district,
+            'address_of_residence': 'Bunyodkor ko‘chasi',
+            'phone_number': '+998901234567',
+            'education_level': cls.education_level,
+            'bachelor_university': 'TATU',
+            'resume': 'resumes/resume.pdf',
+        }
+        defaults.update(kwargs)
+        return Personnel.objects.create(**defaults)
+
+
+def make_pdf(text):
+    """Bitta sahifali, matnli eng oddiy PDF"""
+    stream = b'BT /F1 12 Tf 10 50 Td (%s) Tj ET' % text.encode()
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 300 100] /Contents 4 0 R '
+        b'/Resources << /Font << /F1 5 0 R >> >> >>',
+        b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream),
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    pdf = BytesIO()
+    pdf.write(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(pdf.tell())
+        pdf.write(b'%d 0 obj\n%s\nendobj\n' % (number, body))
+    xref = pdf.tell()
+    pdf.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+    for offset in offsets:
+        pdf.write(b'%010d 00000 n \n' % offset)
+    pdf.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref))
+    return pdf.getvalue()
+
+
+@override_settings(STORAGES=TEST_STORAGES, CACHES=TEST_CACHES)
+class ChangelistQueryBudgetTest(PersonnelTestMixin, ChangelistQueryCountMixin, TestCase):
+    """Ro'yxat sahifalari qatorlar soniga bog'liq bo'lmagan so'rovlar sonida qolishi kerak"""
+
+    # Sessiya, foydalanuvchi, sanash, natijalar, filtrlar va date_hierarchy (MAX(id)) uchun
+    QUERY_BUDGET = 8
+
+    def assertChangelistWithinBudget(self, url, **kwargs):
+        for number in range(5):
+            self.create_personnel(number, **kwargs)
+        # Ma'lumotnoma keshini to'ldirish
+        self.client.get(url)
+        few_rows = self.count_queries(url)
+        for number in range(5, 50):
+            self.create_personnel(number, **kwargs)
+        # date_hierarchy keshiga yangi qatorlarni qo'shish (bitta qo'shimcha so'rov)
+        self.client.get(url)
+        many_rows = self.count_queries(url)
+
+        self.assertEqual(few_rows, many_rows, 'Har bir qator uchun qo‘shimcha so‘rov bajarilmoqda')
+        self.assertLessEqual(many_rows, self.QUERY_BUDGET)
+
+    def test_employee_changelist(self):
+        self.assertChangelistWithinBudget(reverse('admin:personnel_employee_changelist'), type='EMPLOYEE')
+
+    def test_candidate_changelist(self):
+        self.assertChangelistWithinBudget(
+            reverse('admin:personnel_candidate_changelist'), type='CANDIDATE', status='submitted'
+        )
+
+
+class PersonnelSearchTest(PersonnelTestMixin, TestCase):
+    """Qidiruv indeksi Personnel.save/delete bilan sinxron bo'lishi kerak"""
+
+    def search(self, term):
+        return set(search_personnel(Personnel.objects.all(), term).values_list('fullname', flat=True))
+
+    def test_search_by_substring(self):
+        self.create_personnel(1, fullname='Aliyev Vali', master_university='O‘zMU')
+        self.create_personnel(2, fullname='Karimova Nodira', phone_number='+998971112233')
+
+        self.assertEqual(self.search('aliyev'), {'Aliyev Vali'})
+        self.assertEqual(self.search('1112233'), {'Karimova Nodira'})
+        self.assertEqual(self.search('vali o‘zmu'), {'Aliyev Vali'})
+        self.assertEqual(self.search('va'), {'Aliyev Vali', 'Karimova Nodira'})
+        self.assertEqual(self.search('yo‘q'), set())
+
+    def test_index_follows_save_and_delete(self):
+        personnel = self.create_personnel(1, fullname='Aliyev Vali')
+        personnel.fullname = 'Karimov Ali'
+        personnel.save()
+        self.assertEqual(self.search('aliyev'), set())
+        self.assertEqual(self.search('karimov'), {'Karimov Ali'})
+
+        personnel.delete()
+        self.assertEqual(self.search('karimov'), set())
+        self.assertFalse(PersonnelSearchDocument.objects.exists())
+
+    def test_rebuild_command(self):
+        self.create_personnel(1, fullname='Aliyev Vali')
+        PersonnelSearchDocument.objects.all().delete()
+        self.assertEqual(self.search('aliyev'), set())
+
+        call_command('rebuild_search_index', stdout=StringIO())
+        self.assertEqual(self.search('aliyev'), {'Aliyev Vali'})
+
+    def test_backend_indexes_exist(self):
+        # SQLite'da FTS5 jadvallari, PostgreSQL'da GIN indekslari (0004 va 0007 migratsiyalari)
+        introspection = connection.introspection
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                indexes = {
+                    *introspection.get_constraints(cursor, 'personnel_personnelsearchdocument'),
+                    *introspection.get_constraints(cursor, 'personnel_resumetext'),
+                }
+                self.assertLessEqual({'personnel_search_trgm', 'personnel_resume_tsv'}, indexes)
+            else:
+                tables = set(introspection.table_names(cursor))
+                self.assertLessEqual({'personnel_search_fts', 'personnel_resume_fts'}, tables)
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+@mock.patch.object(EmployeeAdmin, 'keyset_pagination', True)
+@mock.patch.object(EmployeeAdmin, 'list_per_page', 5)
+class KeysetPaginationTest(PersonnelTestMixin, TestCase):
+    """Keyset sahifalash barcha qatorlarni takrorlanmasdan va tartib bilan ko'rsatishi kerak"""
+
+    def setUp(self):
+        self.client.force_login(self.superuser)
+        self.url = reverse('admin:personnel_employee_changelist')
+        # Bir xil ismlar (fullname, id) kalitining ikkinchi qismini tekshiradi
+        for number in range(12):
+            self.create_personnel(number, fullname=f'Xodim {number // 2}')
+
+    def get_page(self, query_string=''):
+        response = self.client.get(self.url + query_string)
+        self.assertEqual(response.status_code, 200)
+        cl = response.context['cl']
+        return [obj.pk for obj in cl.result_list], cl
+
+    def test_next_and_previous(self):
+        expected = list(Personnel.objects.order_by('fullname', 'pk').values_list('pk', flat=True))
+
+        pages = []
+        page, cl = self.get_page()
+        self.assertIsNone(cl.keyset_previous_url)
+        pages.append(page)
+        while cl.keyset_next_url:
+            page, cl = self.get_page(cl.keyset_next_url)
+            pages.append(page)
+        self.assertEqual([pk for page in pages for pk in page], expected)
+        self.assertEqual([len(page) for page in pages], [5, 5, 2])
+
+        for page in reversed(pages[:-1]):
+            previous, cl = self.get_page(cl.keyset_previous_url)
+            self.assertEqual(previous, page)
+        self.assertIsNone(cl.keyset_previous_url)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url + '?after=buzilgan')
+        self.assertRedirects(response, self.url + '?e=1', fetch_redirect_response=False)
+
+    @mock.patch.object(PersonnelStatusHistoryAdmin, 'keyset_pagination', True)
+    @mock.patch.object(PersonnelStatusHistoryAdmin, 'list_per_page', 5)
+    def test_history_seeks_on_created_at(self):
+        personnel = Personnel.objects.first()
+        for number in range(8):
+            PersonnelStatusHistory.objects.create(
+                personnel=personnel, old_status='working', new_status='vacation', reason=str(number)
+            )
+        expected = list(PersonnelStatusHistory.objects.order_by('-created_at', '-pk').values_list('pk', flat=True))
+
+        self.url = reverse('admin:personnel_personnelstatushistory_changelist')
+        first, cl = self.get_page()
+        second, cl = self.get_page(cl.keyset_next_url)
+        self.assertEqual(first + second, expected)
+        self.assertIsNone(cl.keyset_next_url)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class CachedCountTest(PersonnelTestMixin, TestCase):
+    """Katta ro'yxatlar soni keshdan olinadi va saqlashda yangilanadi"""
+
+    def setUp(self):
+        cache.clear()
+        for number in range(5):
+            self.create_personnel(number)
+
+    @override_settings(ADMIN_EXACT_COUNT_THRESHOLD=3)
+    def test_count_is_cached_and_invalidated(self):
+        employees = Personnel.objects.filter(type='EMPLOYEE')
+        self.assertEqual(cached_count(employees), 5)
+        with self.assertNumQueries(0):
+            self.assertEqual(cached_count(employees), 5)
+
+        personnel = self.create_personnel(5)
+        self.assertEqual(cached_count(employees), 6)
+        personnel.delete()
+        self.assertEqual(cached_count(employees), 5)
+
+    @override_settings(ADMIN_EXACT_COUNT_THRESHOLD=100)
+    def test_small_counts_are_exact(self):
+        # PostgreSQL'da avval pg_class statistikasi o'qiladi
+        queries = 2 if connection.vendor == 'postgresql' else 1
+        for _ in range(2):
+            with self.assertNumQueries(queries):
+                self.assertEqual(cached_count(Personnel.objects.all()), 5)
+
+
+@override_settings(STORAGES=TEST_STORAGES, CACHES=TEST_CACHES)
+class BulkConvertToEmployeeTest(PersonnelTestMixin, TestCase):
+    """Nomzodlarni ommaviy xodimga o'tkazish"""
+
+    def setUp(self):
+        self.accepted = [
+            self.create_personnel(number, type='CANDIDATE', status='accepted') for number in range(5)
+        ]
+        self.submitted = self.create_personnel(5, type='CANDIDATE', status='submitted')
+
+    def test_converts_in_constant_queries(self):
+        # SELECT, SAVEPOINT, SELECT ... FOR UPDATE, UPDATE, INSERT, har bir lavozim hisoblagichi uchun
+        # bitta UPDATE va RELEASE SAVEPOINT
+        with self.assertNumQueries(6 + len(self.positions)):
+            converted, errors = Personnel.bulk_convert_to_employee(
+                Personnel.objects.filter(type='CANDIDATE'), changed_by=self.superuser
+            )
+
+        self.assertEqual(converted, 5)
+        self.assertEqual([candidate.pk for candidate, e in errors], [self.submitted.pk])
+        self.assertEqual(
+            Personnel.objects.filter(type='EMPLOYEE', status='working').count(), 5
+        )
+        history = PersonnelStatusHistory.objects.filter(new_status='working')
+        self.assertEqual(
+            set(history.values_list('personnel_id', flat=True)), {p.pk for p in self.accepted}
+        )
+        self.assertTrue(all(h.old_status == 'accepted' and h.changed_by == self.superuser for h in history))
+
+    def test_admin_action(self):
+        self.client.force_login(self.superuser)
+        response = self.client.post(reverse('admin:personnel_candidate_changelist'), {
+            'action': 'convert_to_employee',
+            '_selected_action': [p.pk for p in self.accepted] + [self.submitted.pk],
+        }, follow=True)
+
+        messages = [str(message) for message in response.context['messages']]
+        self.assertIn("5 ta nomzod muvaffaqiyatli xodimga o'tkazildi.", messages)
+        self.assertIn("1 ta nomzodni o'tkazib bo'lmadi.", messages)
+        self.assertEqual(Personnel.objects.filter(type='CANDIDATE').get(), self.submitted)
+
+    @override_settings(ADMIN_BACKGROUND_THRESHOLD=3)
+    def test_admin_action_hands_off_large_selections(self):
+        self.client.force_login(self.superuser)
+        response = self.client.post(reverse('admin:personnel_candidate_changelist'), {
+            'action': 'convert_to_employee',
+            '_selected_action': [p.pk for p in self.accepted] + [self.submitted.pk],
+        }, follow=True)
+
+        job = Job.objects.get()
+        messages = [str(message) for message in response.context['messages']]
+        self.assertIn(f"6 ta nomzodni o'tkazish fon vazifasiga topshirildi ({job}).", messages)
+        self.assertEqual(Personnel.objects.filter(type='CANDIDATE').count(), 6)
+
+        work('test', once=True)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.DONE)
+        self.assertEqual(job.result['converted'], 5)
+        self.assertEqual(len(job.result['errors']), 1)
+        self.assertEqual(job.progress_display, '6 / 6')
+        self.assertEqual(Personnel.objects.filter(type='CANDIDATE').get(), self.submitted)
+        self.assertTrue(
+            PersonnelStatusHistory.objects.filter(new_status='working', changed_by=self.superuser).exists()
+        )
+
+
+@override_settings(CACHES=TEST_CACHES)
+class DirtyFieldTrackingTest(PersonnelTestMixin, TestCase):
+    """Personnel yuklangan qiymatlarni eslab qoladi va saqlashdan oldin qayta o'qimaydi"""
+
+    def setUp(self):
+        self.personnel = Personnel.objects.get(pk=self.create_personnel(1).pk)
+
+    def test_changed_fields(self):
+        self.assertEqual(self.personnel.get_changed_fields(), {})
+        self.personnel.status = 'vacation'
+        self.personnel.position = self.positions[2]
+        self.assertEqual(self.personnel.get_changed_fields(), {
+            'status': ('working', 'vacation'),
+            'position_id': (self.positions[1].pk, self.positions[2].pk),
+        })
+        self.personnel.save()
+        self.assertEqual(self.personnel.get_changed_fields(), {})
+
+    def test_update_fields_keep_unsaved_changes(self):
+        self.personnel.status = 'vacation'
+        self.personnel.fullname = 'Yangi ism'
+        self.personnel.save(update_fields=['fullname'])
+        # status yozilmadi: o'zgarish saqlanmagan bo'lib qoladi, tarix va hisoblagich o'zgarmaydi
+        self.assertEqual(self.personnel.get_changed_fields(), {'status': ('working', 'vacation')})
+        self.assertFalse(PersonnelStatusHistory.objects.exists())
+        self.positions[1].refresh_from_db()
+        self.assertEqual((self.positions[1].working_count, self.positions[1].vacation_count), (1, 0))
+
+        self.personnel.save(update_fields=['status'])
+        self.assertEqual(self.personnel.get_changed_fields(), {})
+        self.positions[1].refresh_from_db()
+        self.assertEqual((self.positions[1].working_count, self.positions[1].vacation_count), (0, 1))
+
+    def test_status_change_without_pre_save_select(self):
+        self.personnel.status = 'vacation'
+        # SAVEPOINT, UPDATE, lavozim hisoblagichlari, RELEASE va tarix uchun INSERT;
+        # qidiruv maydonlari o'zgarmagan
+        with self.assertNumQueries(5):
+            self.personnel.save()
+        history = self.personnel.status_history.get()
+        self.assertEqual((history.old_status, history.new_status), ('working', 'vacation'))
+
+    def test_deferred_status_falls_back_to_database(self):
+        personnel = Personnel.objects.only('fullname').get(pk=self.personnel.pk)
+        personnel.status = 'vacation'
+        personnel.save()
+        self.assertEqual(personnel.status_history.get().old_status, 'working')
+
+
+IMPORT_HEADER = [
+    'fullname', 'position', 'birthdate', 'birthplace', 'nationality', 'gender', 'pinfl', 'passport',
+    'place_of_residence', 'address_of_residence', 'phone_number', 'education_level',
+]
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class PersonnelImportTest(PersonnelTestMixin, TestCase):
+    """CSV fayldan xodimlarni import qilish"""
+
+    def import_row(self, number, **kwargs):
+        row = {
+            'fullname': f'Import {number}',
+            'position': 'Mutaxassis (Bo‘lim 1)',
+            'birthdate': '1995-05-17',
+            'birthplace': 'Chilonzor tumani',
+            'nationality': 'o‘zbek',
+            'gender': 'female',
+            'pinfl': f'{number:014d}',
+            'passport': f'AB{number:07d}',
+            'place_of_residence': 'Chilonzor tumani, Toshkent shahri',
+            'address_of_residence': 'Qatortol ko‘chasi',
+            'phone_number': '+998901234567',
+            'education_level': 'Oliy',
+        }
+        row.update(kwargs)
+        return [row[column] for column in IMPORT_HEADER]
+
+    def write_csv(self, rows):
+        handle, path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(handle, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(IMPORT_HEADER)
+            writer.writerows(rows)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_command_imports_in_chunks_and_reports_errors(self):
+        self.create_personnel(99)
+        path = self.write_csv([
+            self.import_row(1),
+            self.import_row(2, position='Mutaxassis'),  # bir nechta bo'limda bor
+            self.import_row(3, pinfl='123'),
+            self.import_row(4),
+            self.import_row(5, pinfl=f'{1:014d}'),  # fayl ichida takror
+            self.import_row(6, passport=f'AA{99:07d}'),  # bazada bor
+            self.import_row(7),
+        ])
+        errors = StringIO()
+        stdout = StringIO()
+        call_command('import_personnel', path, '--chunk-size', '2', stdout=stdout, stderr=errors)
+
+        self.assertIn('Imported 3 personnel, rejected 4 rows', stdout.getvalue())
+        self.assertEqual(
+            [int(line) for line, message in list(csv.reader(StringIO(errors.getvalue())))[1:]],
+            [3, 4, 6, 7]
+        )
+        imported = Personnel.objects.filter(fullname__startswith='Import')
+        self.assertEqual(sorted(imported.values_list('fullname', flat=True)), ['Import 1', 'Import 4', 'Import 7'])
+        self.assertTrue(all(p.position == self.positions[1] and p.status == 'working' for p in imported))
+        self.assertEqual(set(search_personnel(Personnel.objects.all(), 'import').values_list('pk', flat=True)),
+                         set(imported.values_list('pk', flat=True)))
+
+    def test_admin_upload(self):
+        self.client.force_login(self.superuser)
+        content = StringIO()
+        writer = csv.writer(content)
+        writer.writerow(IMPORT_HEADER)
+        writer.writerow(self.import_row(1))
+        writer.writerow(self.import_row(2, nationality='Noma’lum'))
+        upload = SimpleUploadedFile('nomzodlar.csv', content.getvalue().encode('utf-8'))
+
+        response = self.client.post(reverse('admin:personnel_candidate_import'), {
+            'file': upload, 'chunk_size': 100,
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['rejected'], 1)
+        self.assertEqual([line for line, message in response.context['errors']], [3])
+        candidate = Personnel.objects.get(fullname='Import 1')
+        self.assertEqual((candidate.type, candidate.status), ('CANDIDATE', 'submitted'))
+
+    def test_admin_upload_ignores_type_column(self):
+        self.client.force_login(self.superuser)
+        content = StringIO()
+        writer = csv.writer(content)
+        writer.writerow([*IMPORT_HEADER, 'type'])
+        writer.writerow([*self.import_row(1), 'EMPLOYEE'])
+        upload = SimpleUploadedFile('nomzodlar.csv', content.getvalue().encode('utf-8'))
+
+        self.client.post(reverse('admin:personnel_candidate_import'), {'file': upload, 'chunk_size': 100})
+        self.assertEqual(Personnel.objects.get(fullname='Import 1').type, 'CANDIDATE')
+
+    def test_concurrent_duplicates_are_rejected(self):
+        self.create_personnel(99)
+        errors = []
+        importer = PersonnelImporter(chunk_size=10, on_error=lambda line, message: errors.append((line, message)))
+        rows = [dict(zip(IMPORT_HEADER, self.import_row(number))) for number in (1, 2)]
+        rows.insert(1, dict(zip(IMPORT_HEADER, self.import_row(3, pinfl=f'{99:014d}'))))
+        # Tekshiruvdan keyin boshqa so'rov qo'shgan yozuv: oldindan tekshiruv hech narsani ko'rmaydi
+        taken_keys = PersonnelImporter.taken_keys
+        prechecks = iter([(set(), set())])
+
+        def precheck_misses(chunk):
+            return next(prechecks, None) or taken_keys(importer, chunk)
+
+        with mock.patch.object(PersonnelImporter, 'taken_keys', side_effect=precheck_misses):
+            self.assertEqual(importer.run(rows), (2, 1))
+        self.assertEqual(errors, [(3, f'pinfl: {99:014d} allaqachon mavjud')])
+        self.assertEqual(
+            sorted(Personnel.objects.filter(fullname__startswith='Import').values_list('fullname', flat=True)),
+            ['Import 1', 'Import 2']
+        )
+
+    def test_other_integrity_errors_are_reported(self):
+        errors = []
+        importer = PersonnelImporter(on_error=lambda line, message: errors.append((line, message)))
+        # Masalan, lug'atlar qurilgandan keyin lavozim o'chirilgan
+        error = IntegrityError('FOREIGN KEY constraint failed')
+        with mock.patch.object(PersonnelImporter, 'create', side_effect=error):
+            self.assertEqual(importer.run([dict(zip(IMPORT_HEADER, self.import_row(1)))]), (0, 1))
+        self.assertEqual(errors, [(2, 'saqlab bo‘lmadi: FOREIGN KEY constraint failed')])
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class PersonnelExportTest(PersonnelTestMixin, TestCase):
+    """Filtrlangan ro'yxatni eksport qilish"""
+
+    def setUp(self):
+        self.client.force_login(self.superuser)
+        for number in range(3):
+            self.create_personnel(number, fullname=f'Aliyev {number}')
+        self.create_personnel(3, fullname='Karimov', status='vacation')
+
+    def export(self, action, query_string):
+        return self.client.post(reverse('admin:personnel_employee_changelist') + query_string, {
+            'action': action,
+            'select_across': '1',
+            '_selected_action': [Personnel.objects.first().pk],
+        })
+
+    def test_csv_respects_filters_and_search(self):
+        response = self.export('export_csv', '?status__exact=working&q=aliyev')
+        self.assertTrue(response.streaming)
+        content = b''.join(response.streaming_content).decode('utf-8-sig')
+        rows = list(csv.reader(StringIO(content)))
+
+        self.assertEqual(rows[0][:4], ['To‘liq ismi', 'Holati', 'Lavozimi', 'Bo‘lim'])
+        self.assertEqual([row[0] for row in rows[1:]], ['Aliyev 0', 'Aliyev 1', 'Aliyev 2'])
+        self.assertEqual(rows[1][1:4], ['Ishlamoqda', 'Mutaxassis', 'Bo‘lim 0'])
+
+    def test_xlsx(self):
+        from openpyxl import load_workbook
+
+        response = self.export('export_xlsx', '')
+        workbook = load_workbook(BytesIO(b''.join(response.streaming_content)), read_only=True)
+        rows = list(workbook.active.iter_rows(values_only=True))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[-1][0], 'Karimov')
+
+
+class PositionHeadcountTest(PersonnelTestMixin, TestCase):
+    """Lavozim hisoblagichlari Personnel o'zgarishlari bilan birga yangilanadi"""
+
+    def assertHeadcounts(self, position, working, vacation, candidates):
+        position.refresh_from_db()
+        self.assertEqual(
+            (position.working_count, position.vacation_count, position.candidate_count),
+            (working, vacation, candidates)
+        )
+
+    def test_save_delete_and_convert(self):
+        first, second = self.positions[0], self.positions[1]
+        employee = self.create_personnel(0)
+        candidate = self.create_personnel(3, type='CANDIDATE', status='accepted')
+        self.assertHeadcounts(first, 1, 0, 1)
+
+        employee.status = 'vacation'
+        employee.save()
+        self.assertHeadcounts(first, 0, 1, 1)
+
+        employee.position = second
+        employee.save()
+        self.assertHeadcounts(first, 0, 0, 1)
+        self.assertHeadcounts(second, 0, 1, 0)
+
+        Personnel.bulk_convert_to_employee(Personnel.objects.filter(pk=candidate.pk))
+        self.assertHeadcounts(first, 1, 0, 0)
+
+        employee.delete()
+        self.assertHeadcounts(second, 0, 0, 0)
+
+    def test_reconcile_command(self):
+        self.create_personnel(0)
+        self.create_personnel(1, type='CANDIDATE', status='rejected')
+        Position.objects.update(working_count=7, candidate_count=3)
+
+        call_command('reconcile_headcounts', stdout=StringIO())
+        self.assertHeadcounts(self.positions[0], 1, 0, 0)
+        self.assertHeadcounts(self.positions[1], 0, 0, 0)
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class ChangeFormTest(PersonnelTestMixin, TestCase):
+    """Xodim formasi bog'langan jadvallarni to'liq o'qimaydi"""
+
+    def test_foreign_keys_use_autocomplete(self):
+        self.client.force_login(self.superuser)
+        personnel = self.create_personnel(1)
+        url = reverse('admin:personnel_employee_change', args=[personnel.pk])
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        for field in BasePersonnelAdmin.autocomplete_fields:
+            self.assertContains(response, f'data-field-name="{field}"')
+        # Tumanlar viloyatlar bo'yicha guruhlangan, HTML keshdan olinadi
+        self.assertContains(response, f'<option value="{self.district.pk}" selected>Chilonzor tumani</option>', html=True)
+        self.assertContains(response, '<optgroup label="Toshkent shahri">')
+        self.assertFalse([
+            query for query in context.captured_queries
+            if 'FROM "core_region"' in query['sql'] or 'FROM "core_district"' in query['sql']
+        ])
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class ResumeStorageTest(PersonnelTestMixin, TestCase):
+    """Bir xil rezyume bir marta saqlanadi, havolasiz fayllar tozalanadi"""
+
+    def upload(self, content):
+        return SimpleUploadedFile('CV.PDF', content, content_type='application/pdf')
+
+    def test_identical_uploads_share_one_blob(self):
+        first = self.create_personnel(1, resume=self.upload(b'%PDF-1 same'))
+        second = self.create_personnel(2, resume=self.upload(b'%PDF-1 same'))
+        self.assertEqual(first.resume.name, second.resume.name)
+        self.assertRegex(first.resume.name, r'^resumes/[0-9a-f]{2}/[0-9a-f]{64}\.pdf$')
+        blob = ResumeBlob.objects.get()
+        self.assertEqual((blob.ref_count, blob.size), (2, 11))
+        self.assertEqual(ResumeBlob.find(blob.digest), blob)
+
+    def test_replace_and_delete_release_references(self):
+        first = self.create_personnel(1, resume=self.upload(b'%PDF-1 old'))
+        second = self.create_personnel(2, resume=self.upload(b'%PDF-1 old'))
+        old_name = first.resume.name
+
+        first.resume = self.upload(b'%PDF-1 new')
+        first.save()
+        self.assertEqual(ResumeBlob.objects.get(name=old_name).ref_count, 1)
+        self.assertEqual(ResumeBlob.objects.get(name=first.resume.name).ref_count, 1)
+
+        second.delete()
+        self.assertEqual(ResumeBlob.objects.get(name=old_name).ref_count, 0)
+        # Yangi bo'shagan fayl himoya muddati ichida o'chirilmaydi
+        call_command('gc_resumes', stdout=StringIO())
+        self.assertTrue(resume_storage.exists(old_name))
+
+        out = StringIO()
+        call_command('gc_resumes', '--grace-minutes=0', stdout=out)
+        self.assertIn('Deleted 1 orphaned resume files', out.getvalue())
+        self.assertFalse(resume_storage.exists(old_name))
+        self.assertFalse(ResumeBlob.objects.filter(name=old_name).exists())
+        self.assertTrue(resume_storage.exists(first.resume.name))
+
+    def test_files_are_deleted_under_the_row_lock(self):
+        personnel = self.create_personnel(1, resume=self.upload(b'%PDF-1 gc'))
+        name = personnel.resume.name
+        personnel.delete()
+        states = []
+        depth = len(connection.atomic_blocks)
+
+        def delete(name):
+            # collect_garbage() tranzaksiyasi ichida, qator o'chirilgandan keyin
+            states.append((len(connection.atomic_blocks) > depth, ResumeBlob.objects.filter(name=name).exists()))
+            resume_storage.backend.delete(name)
+
+        with mock.patch.object(resume_storage, 'delete', side_effect=delete):
+            call_command('gc_resumes', '--grace-minutes=0', stdout=StringIO())
+        self.assertEqual(states, [(True, False)])
+
+        # Qator bor, lekin fayl yo'q bo'lsa ham bir xil yuklash faylni qayta yozadi
+        ResumeBlob.objects.create(name=name, digest=name.rsplit('/', 1)[1][:64], size=9)
+        self.create_personnel(2, resume=self.upload(b'%PDF-1 gc'))
+        self.assertTrue(resume_storage.exists(name))
+
+    def test_admin_bulk_delete_releases_references(self):
+        personnel = self.create_personnel(1, resume=self.upload(b'%PDF-1 bulk'))
+        self.client.force_login(self.superuser)
+        self.client.post(reverse('admin:personnel_employee_changelist'), {
+            'action': 'delete_selected', '_selected_action': [personnel.pk], 'post': 'yes',
+        })
+        self.assertFalse(Personnel.objects.exists())
+        self.assertEqual(ResumeBlob.objects.get().ref_count, 0)
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class ResumeTextTest(PersonnelTestMixin, TestCase):
+    """Rezyume matni so'rovdan tashqarida ajratiladi va ro'yxat qidiruvida topiladi"""
+
+    def upload(self, text):
+        return SimpleUploadedFile('cv.pdf', make_pdf(text), content_type='application/pdf')
+
+    def test_extract_and_search(self):
+        first = self.create_personnel(1, resume=self.upload('Senior Python developer at Uzcard'))
+        self.create_personnel(2, resume=self.upload('Senior Python developer at Uzcard'))
+        self.create_personnel(3, resume=self.upload('Buxgalter'))
+        self.assertEqual(ResumeText.objects.filter(status='pending').count(), 3)
+        self.assertFalse(search_personnel(Personnel.objects.all(), 'uzcard').exists())
+
+        # Bir xil fayl bir marta ajratiladi
+        self.assertEqual(extract_pending(workers=0), 2)
+        self.assertEqual(ResumeText.objects.get(personnel=first).text, 'senior python developer at uzcard')
+        found = search_personnel(Personnel.objects.all(), 'pyth uzcard')
+        self.assertEqual(sorted(found.values_list('fullname', flat=True)), ['Xodim 0001', 'Xodim 0002'])
+
+    def test_search_terms_are_quoted(self):
+        # PostgreSQL'da to_tsquery, SQLite'da FTS5 MATCH sintaksisi so'rovni buzmasligi kerak
+        self.create_personnel(1, resume=self.upload("O'zbek tili"))
+        extract_pending(workers=0)
+        for term in ("o'zbek", 'tili & !python', 'back\\slash', ':* | ('):
+            list(search_personnel(Personnel.objects.all(), term))
+        self.assertTrue(search_personnel(Personnel.objects.all(), 'tili').exists())
+
+    def test_replaced_resume_is_reindexed(self):
+        personnel = self.create_personnel(1, resume=self.upload('Python'))
+        extract_pending(workers=0)
+        personnel.resume = self.upload('Golang')
+        personnel.save()
+        self.assertEqual(ResumeText.objects.get(personnel=personnel).status, 'pending')
+        self.assertFalse(search_personnel(Personnel.objects.all(), 'python').exists())
+
+        extract_pending(workers=0)
+        self.assertTrue(search_personnel(Personnel.objects.all(), 'golang').exists())
+
+    def test_new_resume_enqueues_extraction(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            personnel = self.create_personnel(1, resume='')
+        self.assertFalse(Job.objects.exists())
+
+        personnel.resume = self.upload('Python')
+        with self.captureOnCommitCallbacks(execute=True):
+            personnel.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_personnel(2, resume=self.upload('Golang'))
+        # Navbatda turgan vazifa qayta qo'yilmaydi
+        job = Job.objects.get()
+        self.assertEqual((job.name, job.status), ('personnel.extract_resume_texts', Job.QUEUED))
+
+    def test_backfill_command(self):
+        personnel = self.create_personnel(1, resume=SimpleUploadedFile('cv.pdf', b'not a pdf'))
+        self.create_personnel(2, resume=self.upload('Python'))
+        ResumeText.objects.all().delete()
+
+        out = StringIO()
+        with self.assertLogs('pypdf', 'WARNING'):
+            call_command('extract_resume_texts', '--all', '--workers=0', stdout=out)
+        self.assertIn('Queued 2 resumes', out.getvalue())
+        self.assertEqual(ResumeText.objects.get(personnel=personnel).status, 'failed')
+        self.assertEqual(ResumeText.objects.filter(status='done').count(), 1)
+
+
+class HeadcountSnapshotTest(PersonnelTestMixin, TestCase):
+    """Tarixdan tiklangan kunlik snapshotlar va sana bo'yicha so'rov"""
+
+    @staticmethod
+    def at(day):
+        return timezone.make_aware(datetime.combine(day, datetime.min.time()) + timedelta(hours=12))
+
+    def setUp(self):
+        # Nomzod: 1-yanvar topshirgan, 5-yanvar qabul qilingan, 10-yanvar xodimga o'tkazilgan
+        self.candidate = self.create_personnel(1, status='working', position=self.positions[0])
+        # Xodim: 3-yanvar ishga kirgan, 8-yanvar ishdan ketgan
+        self.employee = self.create_personnel(2, status='left', position=self.positions[1])
+        Personnel.objects.filter(pk=self.candidate.pk).update(created_at=self.at(date(2025, 1, 1)))
+        Personnel.objects.filter(pk=self.employee.pk).update(created_at=self.at(date(2025, 1, 3)))
+        for personnel, old_status, new_status, day in (
+            (self.candidate, 'submitted', 'accepted', date(2025, 1, 5)),
+            (self.candidate, 'accepted', 'working', date(2025, 1, 10)),
+            (self.employee, 'working', 'left', date(2025, 1, 8)),
+        ):
+            history = PersonnelStatusHistory.objects.create(
+                personnel=personnel, old_status=old_status, new_status=new_status, reason='test'
+            )
+            PersonnelStatusHistory.objects.filter(pk=history.pk).update(created_at=self.at(day))
+
+    def test_backfill_from_history(self):
+        out = StringIO()
+        call_command('build_headcount_snapshots', '--since=2025-01-01', '--until=2025-01-31', stdout=out)
+        self.assertIn('for 5 days', out.getvalue())
+
+        first, second = self.departments[0], self.departments[1]
+        self.assertEqual(count_as_of(date(2024, 12, 31)), 0)
+        self.assertEqual(count_as_of(date(2025, 1, 2), department=first, type='CANDIDATE', status='submitted'), 1)
+        self.assertEqual(count_as_of(date(2025, 1, 4), department=second, status='working'), 1)
+        self.assertEqual(count_as_of(date(2025, 1, 6), department=first, status='accepted'), 1)
+        self.assertEqual(count_as_of(date(2025, 1, 9), department=second, status='working'), 0)
+        self.assertEqual(count_as_of(date(2025, 1, 9), department=second, status='left'), 1)
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                count_as_of(date(2025, 6, 1), department=first, type='EMPLOYEE', status='working'), 1
+            )
+
+    def test_incremental_build(self):
+        build_snapshots(start=date(2025, 1, 1), end=date(2025, 1, 31))
+        # Oxirgi snapshotdan keyin o'zgarish bo'lmagan
+        self.assertEqual(build_snapshots(), 0)
+
+        candidate = Personnel.objects.get(pk=self.candidate.pk)
+        candidate.status = 'vacation'
+        candidate.save()
+        today = timezone.localdate()
+        self.assertEqual(build_snapshots(end=today), 1)
+        self.assertEqual(count_as_of(today, status='vacation'), 1)
+        self.assertEqual(count_as_of(today, status='working'), 0)
+        self.assertEqual(count_as_of(today - timedelta(days=1), status='working'), 1)
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class AgeTenureTest(PersonnelTestMixin, TestCase):
+    """Yosh va ish staji SQL da hisoblanadi va sana oralig'i bilan filtrlanadi"""
+    today = date(2025, 6, 15)
+
+    def setUp(self):
+        self.young = self.create_personnel(1, birthdate=date(1996, 6, 16), hired_date=date(2024, 6, 15))
+        self.middle = self.create_personnel(2, birthdate=date(1985, 6, 15), hired_date=date(2015, 6, 16))
+        # Ayol, 54 yosh: pensiya yoshiga (55) bir yil qoldi
+        self.senior = self.create_personnel(
+            3, birthdate=date(1970, 8, 1), gender='female', hired_date=date(2000, 1, 1), left_date=date(2012, 1, 1)
+        )
+
+    def test_annotations_match_properties(self):
+        with mock.patch('django.utils.timezone.localdate', return_value=self.today):
+            rows = dict(Personnel.objects.with_age().with_tenure().values_list('pk', 'age_years'))
+            tenure = dict(Personnel.objects.with_tenure().values_list('pk', 'tenure_years'))
+        self.assertEqual(rows, {self.young.pk: 28, self.middle.pk: 40, self.senior.pk: 54})
+        self.assertEqual(tenure, {self.young.pk: 1, self.middle.pk: 9, self.senior.pk: 12})
+
+    def test_range_filters(self):
+        def pks(queryset):
+            return set(queryset.values_list('pk', flat=True))
+
+        people = Personnel.objects.all()
+        self.assertEqual(pks(people.age_between(max_age=29, on=self.today)), {self.young.pk})
+        self.assertEqual(pks(people.age_between(40, 49, on=self.today)), {self.middle.pk})
+        self.assertEqual(pks(people.retiring_within(2, on=self.today)), {self.senior.pk})
+        self.assertEqual(pks(people.retired(on=self.today)), set())
+        self.assertEqual(pks(people.tenure_between(min_years=10, on=self.today)), {self.senior.pk})
+        self.assertEqual(pks(people.tenure_between(5, 9, on=self.today)), {self.middle.pk})
+
+    @mock.patch('django.utils.timezone.localdate')
+    def test_admin_columns_and_filters(self, localdate):
+        localdate.return_value = self.today
+        self.client.force_login(self.superuser)
+        url = reverse('admin:personnel_employee_changelist')
+
+        response = self.client.get(url, {'age': 'under30'})
+        self.assertEqual([p.pk for p in response.context['cl'].result_list], [self.young.pk])
+        response = self.client.get(url, {'tenure': '10+'})
+        self.assertEqual([p.pk for p in response.context['cl'].result_list], [self.senior.pk])
+
+        # get_age (6-ustun) bo'yicha o'sish tartibida saralash
+        response = self.client.get(url, {'o': '6'})
+        self.assertEqual(
+            [p.pk for p in response.context['cl'].result_list], [self.young.pk, self.middle.pk, self.senior.pk]
+        )
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class MonthDayWindowTest(PersonnelTestMixin, TestCase):
+    """Tug'ilgan kunlar va ish yubileylari saqlangan MMDD kalitlari bo'yicha qidiriladi"""
+
+    def setUp(self):
+        self.december = self.create_personnel(1, birthdate=date(1990, 12, 30), hired_date=date(2020, 1, 2))
+        self.january = self.create_personnel(2, birthdate=date(1985, 1, 2), hired_date=date(2024, 12, 29))
+        self.leap = self.create_personnel(3, birthdate=date(1992, 2, 29))
+        self.summer = self.create_personnel(4, birthdate=date(1991, 7, 1), hired_date=date(2025, 1, 1))
+
+    def test_keys_are_maintained(self):
+        self.assertEqual(
+            dict(Personnel.objects.values_list('pk', 'birth_month_day')),
+            {self.december.pk: 1230, self.january.pk: 102, self.leap.pk: 229, self.summer.pk: 701}
+        )
+        self.summer.birthdate = date(1991, 8, 15)
+        self.summer.hired_date = None
+        self.summer.save(update_fields=['birthdate', 'hired_date'])
+        self.assertEqual(
+            Personnel.objects.filter(pk=self.summer.pk).values_list('birth_month_day', 'hired_month_day').get(),
+            (815, None)
+        )
+
+    def test_year_wrapping_window(self):
+        people = Personnel.objects.all()
+        birthdays = people.birthdays_between(date(2025, 12, 28), date(2026, 1, 3))
+        self.assertEqual(list(birthdays), [self.december, self.january])
+        anniversaries = people.anniversaries_between(date(2025, 12, 28), date(2026, 1, 3))
+        self.assertEqual(list(anniversaries), [self.january, self.summer, self.december])
+        # Kabisa bo'lmagan yilda 29-fevral 28-fevral bilan birga
+        self.assertEqual(list(people.birthdays_between(date(2025, 2, 28), date(2025, 2, 28))), [self.leap])
+        self.assertEqual(list(people.birthdays_between(date(2024, 2, 28), date(2024, 2, 28))), [])
+
+    def test_admin_page(self):
+        self.client.force_login(self.superuser)
+        url = reverse('admin:personnel_employee_celebrations')
+        response = self.client.get(url, {'kind': 'birthday', 'start': '2025-12-28', 'end': '2026-01-03'})
+        self.assertEqual(
+            [(personnel.pk, day, years) for personnel, day, years in response.context['rows']],
+            [(self.december.pk, date(2025, 12, 30), 35), (self.january.pk, date(2026, 1, 2), 41)]
+        )
+        response = self.client.get(url, {'kind': 'birthday', 'start': '2026-01-03', 'end': '2025-12-28'})
+        self.assertIsNone(response.context['rows'])
+        self.assertContains(self.client.get(reverse('admin:personnel_employee_changelist')), url)
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class AutocompleteListFilterTest(PersonnelTestMixin, TestCase):
+    """Xodim va foydalanuvchi filtrlari har bir qator uchun havola chiqarmaydi"""
+
+    def setUp(self):
+        self.personnel = [self.create_personnel(number) for number in range(5)]
+        for personnel in self.personnel:
+            personnel.status = 'vacation'
+            personnel.save(changed_by=self.superuser)
+        self.client.force_login(self.superuser)
+        self.url = reverse('admin:personnel_personnelstatushistory_changelist')
+
+    def test_sidebar_does_not_list_related_rows(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertNotContains(response, 'personnel__id__exact=')
+        self.assertContains(response, 'data-field-name="personnel"')
+        self.assertContains(response, 'data-field-name="changed_by"')
+        self.assertContains(response, 'select2.full')
+        # Yon panel uchun xodimlar va foydalanuvchilar jadvali to'liq o'qilmaydi
+        self.assertFalse([
+            query for query in queries.captured_queries
+            if query['sql'].startswith('SELECT') and 'WHERE' not in query['sql']
+            and ('FROM "personnel_personnel"' in query['sql'] or 'FROM "accounts_user"' in query['sql'])
+        ])
+
+    def test_selected_value(self):
+        selected = self.personnel[2]
+        response = self.client.get(self.url, {'personnel__id__exact': selected.pk})
+        self.assertEqual([h.personnel_id for h in response.context['cl'].result_list], [selected.pk])
+        self.assertContains(response, f'<option value="{selected.pk}" selected>{selected}</option>', html=True)
+
+    def test_autocomplete_endpoint(self):
+        response = self.client.get(reverse('admin:autocomplete'), {
+            'app_label': 'personnel',
+            'model_name': 'personnelstatushistory',
+            'field_name': 'personnel',
+            'term': 'Xodim 0003',
+        })
+        self.assertEqual([row['id'] for row in response.json()['results']], [str(self.personnel[3].pk)])
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class CachedDateHierarchyTest(PersonnelTestMixin, TestCase):
+    """date_hierarchy paneli keshlangan kunlik sonlardan quriladi"""
+
+    def setUp(self):
+        cache.clear()
+        self.personnel = self.create_personnel(1)
+        self.add_history(datetime(2024, 3, 5, 12), datetime(2025, 1, 10, 12), datetime(2025, 2, 1, 12))
+        self.client.force_login(self.superuser)
+        self.url = reverse('admin:personnel_personnelstatushistory_changelist')
+
+    def add_history(self, *moments):
+        for moment in moments:
+            history = PersonnelStatusHistory.objects.create(
+                personnel=self.personnel, old_status='working', new_status='vacation', reason='test'
+            )
+            PersonnelStatusHistory.objects.filter(pk=history.pk).update(created_at=timezone.make_aware(moment))
+
+    def choices(self, response):
+        return [choice['title'] for choice in response.context['choices']]
+
+    def test_levels_from_cached_buckets(self):
+        response = self.client.get(self.url)
+        self.assertEqual(self.choices(response), ['2024 (1)', '2025 (2)'])
+
+        # Keyingi sahifalar DISTINCT sana so'rovlarini bajarmaydi
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {'created_at__year': '2025'})
+        self.assertEqual(self.choices(response), ['Yanvar 2025-yil (1)', 'Fevral 2025-yil (1)'])
+        self.assertFalse([query for query in queries.captured_queries if 'django_datetime' in query['sql']])
+
+    def test_new_rows_are_added_incrementally(self):
+        self.client.get(self.url)
+        self.add_history(datetime(2025, 2, 3, 12))
+
+        response = self.client.get(self.url, {'created_at__year': '2025', 'created_at__month': '2'})
+        self.assertEqual(self.choices(response), ['1-Fevral (1)', '3-Fevral (1)'])
+
+    @override_settings(ADMIN_DATE_HIERARCHY_RECENT_TIMEOUT=0)
+    def test_late_commits_are_counted(self):
+        self.client.get(self.url)
+        latest = PersonnelStatusHistory.objects.order_by('pk').last().pk
+        # Kichikroq id li qator kattaroq id dan keyin commit bo'lgan holat
+        for pk, moment in ((latest + 10, datetime(2025, 2, 3, 12)), (latest + 5, datetime(2025, 2, 4, 12))):
+            PersonnelStatusHistory.objects.create(
+                pk=pk, personnel=self.personnel, old_status='working', new_status='vacation', reason='test'
+            )
+            PersonnelStatusHistory.objects.filter(pk=pk).update(created_at=timezone.make_aware(moment))
+            self.client.get(self.url)
+
+        response = self.client.get(self.url, {'created_at__year': '2025', 'created_at__month': '2'})
+        self.assertEqual(self.choices(response), ['1-Fevral (1)', '3-Fevral (1)', '4-Fevral (1)'])
+
+    def test_deleted_rows_invalidate_buckets(self):
+        self.client.get(self.url)
+        self.personnel.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(self.choices(response), [])
+
+    def test_filtered_list_uses_default_hierarchy(self):
+        self.client.get(self.url)
+        response = self.client.get(self.url, {'new_status': 'working'})
+        self.assertEqual(self.choices(response), [])
@@ -29,7 +29,7 @@ CORS_ALLOWED_ORIGINS = env.list('CORS_ALLOWED_ORIGINS', default=[])
 
 INSTALLED_APPS = [
     'modeltranslation',
-    'django.contrib.admin',
+    'config.apps.AdminConfig',
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
@@ -44,6 +44,7 @@ INSTALLED_APPS = [
     'apps.accounts',
     'apps.core',
     'apps.departments',
+    'apps.jobs',
     'apps.personnel',
 ]
 
@@ -84,10 +85,49 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# Standart holatda SQLite. Production uchun PostgreSQL (docker-compose.yml dagi db xizmati):
+#   DB_ENGINE=django.db.backends.postgresql DB_NAME=personnel DB_USER=... DB_PASSWORD=... DB_HOST=...
+# PostgreSQL'da ulanishlar so'rovlar orasida saqlanadi (DB_CONN_MAX_AGE, sog'lig'i tekshiriladi).
+# DB_POOL=True bo'lsa ular o'rniga psycopg pool ishlatiladi, Django ikkalasini birga qo'llamaydi
+DB_ENGINE = env.str('DB_ENGINE', default='django.db.backends.sqlite3')
+POSTGRESQL = DB_ENGINE == 'django.db.backends.postgresql'
+DB_POOL = POSTGRESQL and env.bool('DB_POOL', default=False)
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'ENGINE': DB_ENGINE,
+        'NAME': env.str('DB_NAME', default=str(BASE_DIR / 'db.sqlite3')),
+        'USER': env.str('DB_USER', default=''),
+        'PASSWORD': env.str('DB_PASSWORD', default=''),
+        'HOST': env.str('DB_HOST', default=''),
+        'PORT': env.str('DB_PORT', default=''),
+        'CONN_MAX_AGE': env.int('DB_CONN_MAX_AGE', default=60 if POSTGRESQL and not DB_POOL else 0),
+        'CONN_HEALTH_CHECKS': env.bool('DB_CONN_HEALTH_CHECKS', default=POSTGRESQL),
+        'OPTIONS': {},
+        'TEST': {
+            # Testlar ham PostgreSQL'da ishlatilishi mumkin (standart: test_<DB_NAME>)
+            'NAME': env.str('DB_TEST_NAME', default=None),
+        },
+    }
+}
+if DB_POOL:
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': env.int('DB_POOL_MIN_SIZE', default=2),
+        'max_size': env.int('DB_POOL_MAX_SIZE', default=10),
+        'timeout': env.int('DB_POOL_TIMEOUT', default=10),
+    }
+
+
+# Cache
+# Ma'lumotnoma keshi va ro'yxat sonlarining versiyalari shu yerda saqlanadi, shuning uchun backend
+# barcha gunicorn worker'lari va run_workers jarayonlari uchun umumiy bo'lishi kerak. Standart:
+# bazadagi jadval (core 0005 migratsiyasi createcachetable ni chaqiradi), Redis uchun:
+# CACHE_BACKEND=django.core.cache.backends.redis.RedisCache CACHE_LOCATION=redis://localhost:6379
+# LocMemCache har bir jarayonga alohida, u faqat bitta jarayonli ishlab chiqish uchun yaroqli.
+CACHES = {
+    'default': {
+        'BACKEND': env.str('CACHE_BACKEND', default='django.core.cache.backends.db.DatabaseCache'),
+        'LOCATION': env.str('CACHE_LOCATION', default='django_cache'),
     }
 }
 
@@ -159,6 +199,12 @@ STORAGES = {
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Yuklanayotgan fayllar xeshi oqim davomida hisoblanadi (rezyumelarni takrorlamasdan saqlash uchun)
+FILE_UPLOAD_HANDLERS = [
+    'apps.personnel.storage.HashingMemoryFileUploadHandler',
+    'apps.personnel.storage.HashingTemporaryFileUploadHandler',
+]
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
@@ -166,6 +212,20 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'accounts.User'
 
+# Katta ro'yxatlar uchun admin'da OFFSET o'rniga keyset sahifalash
+ADMIN_KEYSET_PAGINATION = env.bool('ADMIN_KEYSET_PAGINATION', default=False)
+
+# Shu sondan kam qatorli ro'yxatlar har doim aniq sanaladi, kattalari keshdan olinadi
+ADMIN_EXACT_COUNT_THRESHOLD = env.int('ADMIN_EXACT_COUNT_THRESHOLD', default=10000)
+ADMIN_COUNT_CACHE_TIMEOUT = env.int('ADMIN_COUNT_CACHE_TIMEOUT', default=300)
+# date_hierarchy paneli uchun kunlik sonlar keshi (yangi qatorlar qo'shilganda to'ldirib boriladi)
+ADMIN_DATE_HIERARCHY_CACHE_TIMEOUT = env.int('ADMIN_DATE_HIERARCHY_CACHE_TIMEOUT', default=86400)
+# Oxirgi id lar (kechikib commit bo'lishi mumkin bo'lgan qatorlar) sonlari shuncha soniyada qayta sanaladi
+ADMIN_DATE_HIERARCHY_RECENT_TIMEOUT = env.int('ADMIN_DATE_HIERARCHY_RECENT_TIMEOUT', default=60)
+
+# Shundan ko'p yozuvli admin amallari so'rov ichida emas, fon vazifasi (run_workers) sifatida bajariladi
+ADMIN_BACKGROUND_THRESHOLD = env.int('ADMIN_BACKGROUND_THRESHOLD', default=200)
+
 LOGIN_REDIRECT_URL = '/'
 LOGIN_URL = '/accounts/login/'
 LOGOUT_REDIRECT_URL = '/accounts/login/'
\ No newline at end of file
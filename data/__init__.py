@@ -0,0 +1,70 @@
+"""
+Boshlang'ich ma'lumotlar (viloyatlar, tumanlar).
+
+Har bir to'plam JSON Lines faylida saqlanadi: bir qator - bitta yozuv. Modulni import qilish
+faylni ochmaydi; iter() faylni qatorma-qator o'qiydi, get()/filter() esa birinchi
+murojaatda indeks quradi va uni xotirada saqlaydi.
+
+    from data import regions, districts
+
+    regions.get(2)                      # region_id bo'yicha
+    districts.get(1)                    # city_id bo'yicha
+    districts.filter(region_id=2)       # viloyat tumanlari
+"""
+import hashlib
+import json
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent
+
+
+class Dataset:
+    """JSON Lines to'plami: oqimli o'qish va kalit bo'yicha indekslangan murojaat"""
+
+    def __init__(self, name, key, path):
+        self.name = name
+        self.key = key
+        self.path = DATA_DIR / path
+        self._index = None
+        self._groups = {}
+
+    def __iter__(self):
+        with self.path.open(encoding='utf-8') as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def index(self):
+        """{kalit: yozuv}, birinchi murojaatda quriladi"""
+        if self._index is None:
+            self._index = {row[self.key]: row for row in self}
+        return self._index
+
+    def get(self, key, default=None):
+        return self.index.get(key, default)
+
+    def filter(self, **lookup):
+        """Bitta maydon qiymati bo'yicha yozuvlar (har bir maydon uchun indeks bir marta quriladi)"""
+        (field, value), = lookup.items()
+        if field not in self._groups:
+            groups = {}
+            for row in self.index.values():
+                groups.setdefault(row[field], []).append(row)
+            self._groups[field] = groups
+        return list(self._groups[field].get(value, ()))
+
+    def checksum(self):
+        """Fayl tarkibining sha256 xeshi"""
+        digest = hashlib.sha256()
+        with self.path.open('rb') as file:
+            for chunk in iter(lambda: file.read(65536), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+
+regions = Dataset('regions', 'region_id', 'regions/regions.jsonl')
+districts = Dataset('districts', 'city_id', 'districts/districts.jsonl')
@@ -1,2002 +0,0 @@
-DISTRICTS = [
-    {
-        "city_id": 1,
-        "names": {
-            "en": "Amudaryo District",
-            "ru": "Амударьинский район",
-            "uz": "Amudaryo tuman"
-        },
-        "active": True,
-        "region_id": 2
-    },
-    {
-        "city_id": 2,
-        "names": {
-            "en": "Beruniy District",
-            "ru": "Берунийский район",
-            "uz": "Beruniy tumani"
-        },
-        "active": True,
-        "region_id": 2
-    },
-    {
-        "city_id": 3,
-        "names": {
-            "en": "Kegeyli District",
-            "ru": "Кегейлийский район",
-            "uz": "Kegeyli tumani"
-        },
-        "active": True,
-        "region_id": 2
-    },
-    {
-        "city_id": 4,
-        "names": {
-            "en": "Qonliko‘l District",
-            "ru": "Канлыкульский район",
-            "uz": "Qanliko‘l tumani"
-        },
-        "active": True,
-        "region_id": 2
-    },
-    {
-        "city_id": 5,
-        "names": {
-            "en": "Qarao‘zak District",
-            "ru": "Караузякский район",
-            "uz": "Qorao‘zak tumani"
-        },
-        "active": True,
-        "region_id": 2
-    },
-    {
-        "city_id": 6,
-        "names": {
-            "en": "Qo‘n‘irat District",
-            "ru": "Кунградский район",
-            "uz": "Qo‘ng‘irot tumani"
-        },
-        "active": True,
-        "region_id": 2
-    },
-    {
-        "city_id": 7,
-        "names": {
-            "en": "Mo‘ynaq District",
-            "ru": "Муйнакский район",
-            "uz": "Mo‘ynoq tumani"
-        },
-        "active": True,
-        "region_id": 2
-    },
-    {
-        "city_id": 8,
-        "names": {
-            "en": "Nukus District",
-            "ru": "Нукусский район",
-            "uz": "Nukus tumani"
-        },
-        "active": True,
-        "region_id": 2
-    },
-    {
-        "city_id": 9,
-        "names": {
-            "en": "Nukus city",
-            "ru": "город Нукус",
-            "uz": "Nukus shahri"
-        },
-        "active": True,
-        "region_id": 2
-    },
-    {
-        "city_id": 10,
-        "names": {
-            "en": "Takhiatash District",
-            "ru": "Тахиаташский район",
-            "uz": "Taxiatosh tumani"
-        },
-        "active": True,
-        "region_id": 2
-    },
-    {
-        "city_id": 11,
-        "names": {
-            "en": "Taxtako‘pir District",
-            "ru": "Тахтакупырский район",
-            "uz": "Taxtako‘pir tumani"
-        },
-        "active": True,
-        "region_id": 2
-    },
-    {
-        "city_id": 12,
-        "names": {
-            "en": "To‘rtkul District",
-            "ru": "Турткульский район",
-            "uz": "To‘rtko‘l tumani "
-        },
-        "active": True,
-        "region_id": 2
-    },
-    {
-        "city_id": 13,
-        "names": {
-            "en": "Xojeli District",
-            "ru": "Ходжейлийский район",
-            "uz": "Xo‘jayli tumani"
-        },
-        "active": True,
-        "region_id": 2
-    },
-    {
-        "city_id": 14,
-        "names": {
-            "en": "Shimbay District",
-            "ru": "Чимбайский район",
-            "uz": "Chimboy tumani"
-        },
-        "active": True,
-        "region_id": 2
-    },
-    {
-        "city_id": 15,
-        "names": {
-            "en": "Shumanay District",
-            "ru": "Шуманайский район",
-            "uz": "Shumanay tumani"
-        },
-        "active": True,
-        "region_id": 2
-    },
-    {
-        "city_id": 16,
-        "names": {
-            "en": "Ellikqala District",
-            "ru": "Элликкалинский район",
-            "uz": "Ellikqalʼa tumani"
-        },
-        "active": True,
-        "region_id": 2
-    },
-    {
-        "city_id": 17,
-        "names": {
-            "en": "Bozataw Distric",
-            "ru": "Бозатауский район",
-            "uz": "Buzatov tumani"
-        },
-        "active": True,
-        "region_id": 2
-    },
-    {
-        "city_id": 18,
-        "names": {
-            "en": "Andijan District",
-            "ru": "Андижанский район",
-            "uz": "Andijon tumani"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 19,
-        "names": {
-            "en": "Andijan",
-            "ru": "Андижан",
-            "uz": "Andijon shahri"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 20,
-        "names": {
-            "en": "Asaka District",
-            "ru": "Асакинский район",
-            "uz": "Asaka tumani"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 21,
-        "names": {
-            "en": "Asaka",
-            "ru": "Асака",
-            "uz": "Asaka shahri"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 22,
-        "names": {
-            "en": "Baliqchi District",
-            "ru": "Балыкчинский район",
-            "uz": "Baliqchi tumani"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 23,
-        "names": {
-            "en": "Boz District",
-            "ru": "Бузский район",
-            "uz": "Bo‘z tumani"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 24,
-        "names": {
-            "en": "Buloqboshi District",
-            "ru": "Булакбашинский район",
-            "uz": "Buloqboshi tumani"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 25,
-        "names": {
-            "en": "Jalaquduq District",
-            "ru": "Джалакудукский район",
-            "uz": "Jalolquduq tumani"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 26,
-        "names": {
-            "en": "Izboskan District",
-            "ru": "Избасканский район",
-            "uz": "Izboskan tumani"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 27,
-        "names": {
-            "en": "Qorasuv",
-            "ru": "Корасув",
-            "uz": "Qorasuv shahri"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 28,
-        "names": {
-            "en": "Kurgontepa District",
-            "ru": "Кургантепинский район",
-            "uz": "Qo‘rg‘ontepa tumani"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 29,
-        "names": {
-            "en": "Marhamat District",
-            "ru": "Мархаматский район",
-            "uz": "Marhamat tumani"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 30,
-        "names": {
-            "en": "Oltinkol District",
-            "ru": "Алтынкульский район",
-            "uz": "Oltinko‘l tumani"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 31,
-        "names": {
-            "en": "Pakhtaabad District",
-            "ru": "Пахтаабадский район",
-            "uz": "Paxtaobod tumani"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 32,
-        "names": {
-            "en": "Ulugnor District",
-            "ru": "Улугнорский район",
-            "uz": "Ulug‘nor tumani"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 33,
-        "names": {
-            "en": "Khanabod",
-            "ru": "Ханабад",
-            "uz": "Xonabod shahri"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 34,
-        "names": {
-            "en": "Khodjaobad District",
-            "ru": "Ходжаабадский район",
-            "uz": "Xo‘jaobod tumani"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 35,
-        "names": {
-            "en": "Shakhrihon District",
-            "ru": "Шахриханский район",
-            "uz": "Shahrixon tumani"
-        },
-        "active": True,
-        "region_id": 3
-    },
-    {
-        "city_id": 36,
-        "names": {
-            "en": "Kasansay District",
-            "ru": "Касансайский район",
-            "uz": "Kosonsoy tumani"
-        },
-        "active": True,
-        "region_id": 4
-    },
-    {
-        "city_id": 37,
-        "names": {
-            "en": "Mingbulak District",
-            "ru": "Мингбулакский район",
-            "uz": "Mingbuloq tumani"
-        },
-        "active": True,
-        "region_id": 4
-    },
-    {
-        "city_id": 38,
-        "names": {
-            "en": "Namangan District",
-            "ru": "Наманганский район",
-            "uz": "Namangan tumani"
-        },
-        "active": True,
-        "region_id": 4
-    },
-    {
-        "city_id": 39,
-        "names": {
-            "en": "Namangan",
-            "ru": "Наманган",
-            "uz": "Namangan shahri"
-        },
-        "active": True,
-        "region_id": 4
-    },
-    {
-        "city_id": 40,
-        "names": {
-            "en": "Naryn District",
-            "ru": "Нарынский район",
-            "uz": "Norin tumani"
-        },
-        "active": True,
-        "region_id": 4
-    },
-    {
-        "city_id": 41,
-        "names": {
-            "en": "Pap District",
-            "ru": "Папский район",
-            "uz": "Pop tumani"
-        },
-        "active": True,
-        "region_id": 4
-    },
-    {
-        "city_id": 42,
-        "names": {
-            "en": "Turakurgan District",
-            "ru": "Туракурганский район",
-            "uz": "To‘raqo‘rg‘on tumani"
-        },
-        "active": True,
-        "region_id": 4
-    },
-    {
-        "city_id": 43,
-        "names": {
-            "en": "Uychi District",
-            "ru": "Уйчинский район",
-            "uz": "Uychi tumani"
-        },
-        "active": True,
-        "region_id": 4
-    },
-    {
-        "city_id": 44,
-        "names": {
-            "en": "Uchkurgan District",
-            "ru": "Учкурганский район",
-            "uz": "Uchqo‘rg‘on tumani"
-        },
-        "active": True,
-        "region_id": 4
-    },
-    {
-        "city_id": 45,
-        "names": {
-            "en": "Chartak District",
-            "ru": "Чартакский район",
-            "uz": "Chortoq tumani"
-        },
-        "active": True,
-        "region_id": 4
-    },
-    {
-        "city_id": 46,
-        "names": {
-            "en": "Chust District",
-            "ru": "Чустский район",
-            "uz": "Chust tumani"
-        },
-        "active": True,
-        "region_id": 4
-    },
-    {
-        "city_id": 47,
-        "names": {
-            "en": "Yangikurgan District",
-            "ru": "Янгикурганский район",
-            "uz": "Yangiqo‘rg‘on tumani"
-        },
-        "active": True,
-        "region_id": 4
-    },
-    {
-        "city_id": 48,
-        "names": {
-            "en": "Beshariq District",
-            "ru": "Бешарыкский район",
-            "uz": "Beshariq tumani"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 49,
-        "names": {
-            "en": "Baghdad District",
-            "ru": "Багдадский район",
-            "uz": "Bog‘dod tumani"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 50,
-        "names": {
-            "en": "Buvayda District",
-            "ru": "Бувайдинский район",
-            "uz": "Buvayda tumani"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 51,
-        "names": {
-            "en": "Dangara District",
-            "ru": "Дангаринский район",
-            "uz": "Dang‘ara tumani"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 52,
-        "names": {
-            "en": "Yozyovon District",
-            "ru": "Язъяванский район",
-            "uz": "Yozyovon tumani"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 53,
-        "names": {
-            "en": "Kirguli District",
-            "ru": "Киргулинский район",
-            "uz": "Kirguli tumani"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 54,
-        "names": {
-            "en": "Quva District",
-            "ru": "Кувинский район",
-            "uz": "Quva tumani"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 55,
-        "names": {
-            "en": "Kuvasay",
-            "ru": "Кувасай",
-            "uz": "Quvasoy shahri"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 56,
-        "names": {
-            "en": "Kokand",
-            "ru": "Коканд",
-            "uz": "Qo‘qon shahri "
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 57,
-        "names": {
-            "en": "Qo‘shtepa District",
-            "ru": "Куштепинский район",
-            "uz": "Qo‘shtepa tumani"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 58,
-        "names": {
-            "en": "Margilan",
-            "ru": "Маргиланский район",
-            "uz": "Marg‘ilon shahri "
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 59,
-        "names": {
-            "en": "Altyariq District",
-            "ru": "Алтыарыкский район",
-            "uz": "Oltiariq tumani"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 60,
-        "names": {
-            "en": "Rishton District",
-            "ru": "Риштанский район",
-            "uz": "Rishton tumani"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 61,
-        "names": {
-            "en": "Sokh District",
-            "ru": "Сохский район",
-            "uz": "So‘x tumani"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 62,
-        "names": {
-            "en": "Tashlaq District",
-            "ru": "Ташлакский район",
-            "uz": "Toshloq tumani"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 63,
-        "names": {
-            "en": "Uzbekistan District",
-            "ru": "Узбекистанский район",
-            "uz": "o‘zbekiston tumani"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 64,
-        "names": {
-            "en": "Uchkuprik District",
-            "ru": "Учкуприкский район",
-            "uz": "Uchko‘prik tumani"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 65,
-        "names": {
-            "en": "Fergana District",
-            "ru": "Ферганский район",
-            "uz": "Farg‘ona tumani"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 66,
-        "names": {
-            "en": "Fergana",
-            "ru": "Фергана",
-            "uz": "Farg‘ona shahri"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 67,
-        "names": {
-            "en": "Furqat District",
-            "ru": "Фуркатский район",
-            "uz": "Furqat tumani"
-        },
-        "active": True,
-        "region_id": 5
-    },
-    {
-        "city_id": 68,
-        "names": {
-            "en": "Bukhara District",
-            "ru": "Бухарский район",
-            "uz": "Buxoro tumani"
-        },
-        "active": True,
-        "region_id": 6
-    },
-    {
-        "city_id": 69,
-        "names": {
-            "en": "Bukhara",
-            "ru": "Бухара",
-            "uz": "Buxoro shahri"
-        },
-        "active": True,
-        "region_id": 6
-    },
-    {
-        "city_id": 70,
-        "names": {
-            "en": "Vobkent District",
-            "ru": "Вабкентский район",
-            "uz": "Vobkent tumani"
-        },
-        "active": True,
-        "region_id": 6
-    },
-    {
-        "city_id": 71,
-        "names": {
-            "en": "g‘ijduvon District",
-            "ru": "Гиждуванский район",
-            "uz": "G‘ijduvon tumani"
-        },
-        "active": True,
-        "region_id": 6
-    },
-    {
-        "city_id": 72,
-        "names": {
-            "en": "Jondor District",
-            "ru": "Жондорский район",
-            "uz": "Jondor tumani"
-        },
-        "active": True,
-        "region_id": 6
-    },
-    {
-        "city_id": 73,
-        "names": {
-            "en": "Kogon District",
-            "ru": "Каганский район",
-            "uz": "Kogon tumani"
-        },
-        "active": True,
-        "region_id": 6
-    },
-    {
-        "city_id": 74,
-        "names": {
-            "en": "Kogon",
-            "ru": "Каган",
-            "uz": "Kogon shahri"
-        },
-        "active": True,
-        "region_id": 6
-    },
-    {
-        "city_id": 75,
-        "names": {
-            "en": "Qorovulbozor District",
-            "ru": "Караулбазарский район",
-            "uz": "Qoravulbozor tumani"
-        },
-        "active": True,
-        "region_id": 6
-    },
-    {
-        "city_id": 76,
-        "names": {
-            "en": "Qorako‘l District",
-            "ru": "Каракульский район",
-            "uz": "Qorako‘l tumani"
-        },
-        "active": True,
-        "region_id": 6
-    },
-    {
-        "city_id": 77,
-        "names": {
-            "en": "Olot District",
-            "ru": "Алатский район",
-            "uz": "Olot tumani"
-        },
-        "active": True,
-        "region_id": 6
-    },
-    {
-        "city_id": 78,
-        "names": {
-            "en": "Peshku District",
-            "ru": "Пешкунский район",
-            "uz": "Peshku tumani"
-        },
-        "active": True,
-        "region_id": 6
-    },
-    {
-        "city_id": 79,
-        "names": {
-            "en": "Romitan District",
-            "ru": "Ромитанский район",
-            "uz": "Romitan tumani"
-        },
-        "active": True,
-        "region_id": 6
-    },
-    {
-        "city_id": 80,
-        "names": {
-            "en": "Shofirkon District",
-            "ru": "Шафирканский район",
-            "uz": "Shofirkon tumani"
-        },
-        "active": True,
-        "region_id": 6
-    },
-    {
-        "city_id": 81,
-        "names": {
-            "en": "Bog‘ot District",
-            "ru": "Багатский район",
-            "uz": "Bog‘ot tumani"
-        },
-        "active": True,
-        "region_id": 7
-    },
-    {
-        "city_id": 83,
-        "names": {
-            "en": "Qo‘shko‘pir District",
-            "ru": "Кушкупырский район",
-            "uz": "Qo‘shko‘pir tumani"
-        },
-        "active": True,
-        "region_id": 7
-    },
-    {
-        "city_id": 84,
-        "names": {
-            "en": "Pitnyak District",
-            "ru": "Питнякский район",
-            "uz": "Pitnak tumani"
-        },
-        "active": True,
-        "region_id": 7
-    },
-    {
-        "city_id": 85,
-        "names": {
-            "en": "Urganch District",
-            "ru": "Ургенческий район",
-            "uz": "Urganch tumani"
-        },
-        "active": True,
-        "region_id": 7
-    },
-    {
-        "city_id": 86,
-        "names": {
-            "en": "Urganch",
-            "ru": "Ургенч",
-            "uz": "Urganch shahri"
-        },
-        "active": True,
-        "region_id": 7
-    },
-    {
-        "city_id": 87,
-        "names": {
-            "en": "Xazorasp District",
-            "ru": "Хазарспский район",
-            "uz": "Xazorasp tumani"
-        },
-        "active": True,
-        "region_id": 7
-    },
-    {
-        "city_id": 88,
-        "names": {
-            "en": "Khiva District",
-            "ru": "Хивинский район",
-            "uz": "Xiva tumani"
-        },
-        "active": True,
-        "region_id": 7
-    },
-    {
-        "city_id": 89,
-        "names": {
-            "en": "Khiva",
-            "ru": "Хива",
-            "uz": "Xiva shahri"
-        },
-        "active": True,
-        "region_id": 7
-    },
-    {
-        "city_id": 90,
-        "names": {
-            "en": "Xonqa District",
-            "ru": "Ханкинский район",
-            "uz": "Xonqa tumani"
-        },
-        "active": True,
-        "region_id": 7
-    },
-    {
-        "city_id": 91,
-        "names": {
-            "en": "Shovot District",
-            "ru": "Шаватский район",
-            "uz": "Shovot tumani"
-        },
-        "active": True,
-        "region_id": 7
-    },
-    {
-        "city_id": 92,
-        "names": {
-            "en": "Yangiariq District",
-            "ru": "Янгарыкский район",
-            "uz": "Yangiariq tumani"
-        },
-        "active": True,
-        "region_id": 7
-    },
-    {
-        "city_id": 93,
-        "names": {
-            "en": "Yangibozor District",
-            "ru": "Янгибазарский район",
-            "uz": "Yangibozor tumani"
-        },
-        "active": True,
-        "region_id": 7
-    },
-    {
-        "city_id": 94,
-        "names": {
-            "en": "Angor District",
-            "ru": "Ангорский район",
-            "uz": "Angor tumani"
-        },
-        "active": True,
-        "region_id": 8
-    },
-    {
-        "city_id": 95,
-        "names": {
-            "en": "Bandixon District",
-            "ru": "Бандыханский район",
-            "uz": "Bandixon tumani"
-        },
-        "active": True,
-        "region_id": 8
-    },
-    {
-        "city_id": 96,
-        "names": {
-            "en": "Boysun District",
-            "ru": "Байсунский район",
-            "uz": "Boysun tumani"
-        },
-        "active": True,
-        "region_id": 8
-    },
-    {
-        "city_id": 97,
-        "names": {
-            "en": "Denov District",
-            "ru": "Денауский район",
-            "uz": "Denov tumani"
-        },
-        "active": True,
-        "region_id": 8
-    },
-    {
-        "city_id": 98,
-        "names": {
-            "en": "Jarkurghon District",
-            "ru": "Джаркурганский район",
-            "uz": "Jarqo‘rg‘on tumani"
-        },
-        "active": True,
-        "region_id": 8
-    },
-    {
-        "city_id": 99,
-        "names": {
-            "en": "Kizirik District",
-            "ru": "Кизирикский район",
-            "uz": "Qiziriq tumani"
-        },
-        "active": True,
-        "region_id": 8
-    },
-    {
-        "city_id": 100,
-        "names": {
-            "en": "Kumkurghon District",
-            "ru": "Кумкурганский район",
-            "uz": "Qumqo‘rg‘on tumani"
-        },
-        "active": True,
-        "region_id": 8
-    },
-    {
-        "city_id": 101,
-        "names": {
-            "en": "Muzrabot District",
-            "ru": "Музрабадский район",
-            "uz": "Muzrobot tumani"
-        },
-        "active": True,
-        "region_id": 8
-    },
-    {
-        "city_id": 102,
-        "names": {
-            "en": "Oltinsoy District",
-            "ru": "Алтынсайский район",
-            "uz": "Oltinsoy tumani"
-        },
-        "active": True,
-        "region_id": 8
-    },
-    {
-        "city_id": 103,
-        "names": {
-            "en": "Sariosiyo District",
-            "ru": "Сариасийский район",
-            "uz": "Sariosiyo tumani"
-        },
-        "active": True,
-        "region_id": 8
-    },
-    {
-        "city_id": 104,
-        "names": {
-            "en": "Termiz District",
-            "ru": "Термезский район",
-            "uz": "Termiz tumani"
-        },
-        "active": True,
-        "region_id": 8
-    },
-    {
-        "city_id": 105,
-        "names": {
-            "en": "Termiz",
-            "ru": "Термез район",
-            "uz": "Termiz shahri "
-        },
-        "active": True,
-        "region_id": 8
-    },
-    {
-        "city_id": 106,
-        "names": {
-            "en": "Uzun District",
-            "ru": "Узунский район",
-            "uz": "Uzun tumani"
-        },
-        "active": True,
-        "region_id": 8
-    },
-    {
-        "city_id": 107,
-        "names": {
-            "en": "Sherobod District",
-            "ru": "Шерабадский район",
-            "uz": "Sherobod tumani"
-        },
-        "active": True,
-        "region_id": 8
-    },
-    {
-        "city_id": 109,
-        "names": {
-            "en": "Guzar District",
-            "ru": "Гузарский район",
-            "uz": "G‘uzor tumani"
-        },
-        "active": True,
-        "region_id": 9
-    },
-    {
-        "city_id": 110,
-        "names": {
-            "en": "Dehkanabad District",
-            "ru": "Дехканабадский район",
-            "uz": "Dehqonobod tumani"
-        },
-        "active": True,
-        "region_id": 9
-    },
-    {
-        "city_id": 111,
-        "names": {
-            "en": "Kasby District",
-            "ru": "Касбийский район",
-            "uz": "Kasbi tumani"
-        },
-        "active": True,
-        "region_id": 9
-    },
-    {
-        "city_id": 112,
-        "names": {
-            "en": "Kitob District",
-            "ru": "Китабский район",
-            "uz": "Kitob tumani"
-        },
-        "active": True,
-        "region_id": 9
-    },
-    {
-        "city_id": 113,
-        "names": {
-            "en": "Koson District",
-            "ru": "Касанский район",
-            "uz": "Koson tumani"
-        },
-        "active": True,
-        "region_id": 9
-    },
-    {
-        "city_id": 114,
-        "names": {
-            "en": "Kamashi District",
-            "ru": "Камашинский район",
-            "uz": "Qamashi tumani"
-        },
-        "active": True,
-        "region_id": 9
-    },
-    {
-        "city_id": 115,
-        "names": {
-            "en": "Karshi District",
-            "ru": "Каршинский район",
-            "uz": "Qarshi tumani"
-        },
-        "active": True,
-        "region_id": 9
-    },
-    {
-        "city_id": 116,
-        "names": {
-            "en": "Karshi",
-            "ru": "Карши",
-            "uz": "Qarshi shahri "
-        },
-        "active": True,
-        "region_id": 9
-    },
-    {
-        "city_id": 117,
-        "names": {
-            "en": "Myrishkor District",
-            "ru": "Миришкорский район",
-            "uz": "Mirishkor tumani"
-        },
-        "active": True,
-        "region_id": 9
-    },
-    {
-        "city_id": 118,
-        "names": {
-            "en": "Muborak District",
-            "ru": "Мубарекский район",
-            "uz": "Muborak tumani"
-        },
-        "active": True,
-        "region_id": 9
-    },
-    {
-        "city_id": 119,
-        "names": {
-            "en": "Nishon District",
-            "ru": "Нишанский район",
-            "uz": "Nishon tumani"
-        },
-        "active": True,
-        "region_id": 9
-    },
-    {
-        "city_id": 120,
-        "names": {
-            "en": "Chirakchi District",
-            "ru": "Чиракчинский район",
-            "uz": "Chiroqchi tumani"
-        },
-        "active": True,
-        "region_id": 9
-    },
-    {
-        "city_id": 121,
-        "names": {
-            "en": "Shakhrisabz District",
-            "ru": "Шахрисабзский район",
-            "uz": "Shaxrisabz tumani"
-        },
-        "active": True,
-        "region_id": 9
-    },
-    {
-        "city_id": 122,
-        "names": {
-            "en": "Yakkabog District",
-            "ru": "Яккабагский район",
-            "uz": "Yakkabog‘ tumani"
-        },
-        "active": True,
-        "region_id": 9
-    },
-    {
-        "city_id": 123,
-        "names": {
-            "en": "Arnasay District",
-            "ru": "Арнасайский район",
-            "uz": "Arnasoy tumani"
-        },
-        "active": True,
-        "region_id": 10
-    },
-    {
-        "city_id": 124,
-        "names": {
-            "en": "Bakhmal Distric",
-            "ru": "Бахмальский район",
-            "uz": "Baxmal tumani"
-        },
-        "active": True,
-        "region_id": 10
-    },
-    {
-        "city_id": 125,
-        "names": {
-            "en": "Gallaorol District",
-            "ru": "Галляаральский район",
-            "uz": "G‘allaorol tumani"
-        },
-        "active": True,
-        "region_id": 10
-    },
-    {
-        "city_id": 126,
-        "names": {
-            "en": "Dustlik District",
-            "ru": "Дустликский район",
-            "uz": "Do‘stlik tumani"
-        },
-        "active": True,
-        "region_id": 10
-    },
-    {
-        "city_id": 127,
-        "names": {
-            "en": "Jizzakh",
-            "ru": "Джиззак",
-            "uz": "Jizzax shahri"
-        },
-        "active": True,
-        "region_id": 10
-    },
-    {
-        "city_id": 128,
-        "names": {
-            "en": "Zarbdar District",
-            "ru": "Зарбдарский район",
-            "uz": "Zarbdor tumani"
-        },
-        "active": True,
-        "region_id": 10
-    },
-    {
-        "city_id": 129,
-        "names": {
-            "en": "Zafarobod District",
-            "ru": "Зафарабадский район",
-            "uz": "Zafarobod tumani"
-        },
-        "active": True,
-        "region_id": 10
-    },
-    {
-        "city_id": 130,
-        "names": {
-            "en": "Zaamin District",
-            "ru": "Зааминский район",
-            "uz": "Zomin tumani"
-        },
-        "active": True,
-        "region_id": 10
-    },
-    {
-        "city_id": 131,
-        "names": {
-            "en": "Mirzachul District",
-            "ru": "Мирзачульский район",
-            "uz": "Mirzacho‘l tumani"
-        },
-        "active": True,
-        "region_id": 10
-    },
-    {
-        "city_id": 132,
-        "names": {
-            "en": "Pakhtakor District",
-            "ru": "Пахтакорский район",
-            "uz": "Paxtakor tumani"
-        },
-        "active": True,
-        "region_id": 10
-    },
-    {
-        "city_id": 133,
-        "names": {
-            "en": "Forish District",
-            "ru": "Фаришский район",
-            "uz": "Forish tumani"
-        },
-        "active": True,
-        "region_id": 10
-    },
-    {
-        "city_id": 134,
-        "names": {
-            "en": "Sharof Rashidov District",
-            "ru": "Шараф-Рашидовский район",
-            "uz": "Sharof Rashidov tumani"
-        },
-        "active": True,
-        "region_id": 10
-    },
-    {
-        "city_id": 135,
-        "names": {
-            "en": "Yangiabad District",
-            "ru": "Янгиабадский район",
-            "uz": "Yangiobod tumani"
-        },
-        "active": True,
-        "region_id": 10
-    },
-    {
-        "city_id": 136,
-        "names": {
-            "en": "Zarafshan District",
-            "ru": "Зарфшанский район",
-            "uz": "Zarafshon tumani"
-        },
-        "active": True,
-        "region_id": 11
-    },
-    {
-        "city_id": 137,
-        "names": {
-            "en": "Karmana District",
-            "ru": "Карманинский район",
-            "uz": "Karmana tumani"
-        },
-        "active": True,
-        "region_id": 11
-    },
-    {
-        "city_id": 138,
-        "names": {
-            "en": "Kanimekh District",
-            "ru": "Канимехский район",
-            "uz": "Konimex tumani"
-        },
-        "active": True,
-        "region_id": 11
-    },
-    {
-        "city_id": 139,
-        "names": {
-            "en": "Qiziltepa District",
-            "ru": "Кызылтепинский район",
-            "uz": "Qiziltepa tumani"
-        },
-        "active": True,
-        "region_id": 11
-    },
-    {
-        "city_id": 140,
-        "names": {
-            "en": "Navbakhor District",
-            "ru": "Навбахорский район",
-            "uz": "Navbahor tumani"
-        },
-        "active": True,
-        "region_id": 11
-    },
-    {
-        "city_id": 141,
-        "names": {
-            "en": "Navoiy District",
-            "ru": "Навоинский район",
-            "uz": "Navoi tumani"
-        },
-        "active": True,
-        "region_id": 11
-    },
-    {
-        "city_id": 142,
-        "names": {
-            "en": "Nurata District",
-            "ru": "Нуратинский район",
-            "uz": "Nurota tumani"
-        },
-        "active": True,
-        "region_id": 11
-    },
-    {
-        "city_id": 144,
-        "names": {
-            "en": "Uchkuduk District",
-            "ru": "Учкудукский район",
-            "uz": "Uchkuduk tumani"
-        },
-        "active": True,
-        "region_id": 11
-    },
-    {
-        "city_id": 145,
-        "names": {
-            "en": "Khatyrchi District",
-            "ru": "Хатырчинский район",
-            "uz": "Xatirchi tumani"
-        },
-        "active": True,
-        "region_id": 11
-    },
-    {
-        "city_id": 146,
-        "names": {
-            "en": "Bulungur District",
-            "ru": "Булунгурский район",
-            "uz": "Bulungur tumani"
-        },
-        "active": True,
-        "region_id": 12
-    },
-    {
-        "city_id": 147,
-        "names": {
-            "en": "Jomboy District",
-            "ru": "Джамбайский район",
-            "uz": "Jomboy tumani"
-        },
-        "active": True,
-        "region_id": 12
-    },
-    {
-        "city_id": 148,
-        "names": {
-            "en": "Ishtikhon District",
-            "ru": "Иштыханский район",
-            "uz": "Ishtikhon tumani"
-        },
-        "active": True,
-        "region_id": 12
-    },
-    {
-        "city_id": 149,
-        "names": {
-            "en": "Kattakurgan District",
-            "ru": "Каттакурганский район",
-            "uz": "Kattakurgan tumani"
-        },
-        "active": True,
-        "region_id": 12
-    },
-    {
-        "city_id": 150,
-        "names": {
-            "en": "Koshrabot District",
-            "ru": "Кошрабадский район",
-            "uz": "Koshrabat tumani"
-        },
-        "active": True,
-        "region_id": 12
-    },
-    {
-        "city_id": 151,
-        "names": {
-            "en": "Narpay District",
-            "ru": "Нарпайский район",
-            "uz": "Narpay tumani"
-        },
-        "active": True,
-        "region_id": 12
-    },
-    {
-        "city_id": 152,
-        "names": {
-            "en": "Nurobod District",
-            "ru": "Нурабадский район",
-            "uz": "Nurobod tumani"
-        },
-        "active": True,
-        "region_id": 12
-    },
-    {
-        "city_id": 153,
-        "names": {
-            "en": "Oqdarya District",
-            "ru": "Акдарьинский район",
-            "uz": "Oqdarya tumani"
-        },
-        "active": True,
-        "region_id": 12
-    },
-    {
-        "city_id": 155,
-        "names": {
-            "en": "Payariq District",
-            "ru": "Пайарыкский район",
-            "uz": "Poyariq tumani"
-        },
-        "active": True,
-        "region_id": 12
-    },
-    {
-        "city_id": 156,
-        "names": {
-            "en": "Pastdargom District",
-            "ru": "Пастдаргомский район",
-            "uz": "Pastdargom tumani"
-        },
-        "active": True,
-        "region_id": 12
-    },
-    {
-        "city_id": 157,
-        "names": {
-            "en": "Samarqand District",
-            "ru": "Самаркандский район",
-            "uz": "Samarkand tumani"
-        },
-        "active": True,
-        "region_id": 12
-    },
-    {
-        "city_id": 158,
-        "names": {
-            "en": "Samarqand",
-            "ru": "Самарканд",
-            "uz": "Samarkand"
-        },
-        "active": True,
-        "region_id": 12
-    },
-    {
-        "city_id": 159,
-        "names": {
-            "en": "Toyloq District",
-            "ru": "Тайлакский район",
-            "uz": "Toyloq tumani"
-        },
-        "active": True,
-        "region_id": 12
-    },
-    {
-        "city_id": 160,
-        "names": {
-            "en": "Urgut District",
-            "ru": "Ургутский район",
-            "uz": "Urgut tumani"
-        },
-        "active": True,
-        "region_id": 12
-    },
-    {
-        "city_id": 161,
-        "names": {
-            "en": "Bayaut District",
-            "ru": "Баяутский район",
-            "uz": "Boyovut tumani"
-        },
-        "active": True,
-        "region_id": 13
-    },
-    {
-        "city_id": 162,
-        "names": {
-            "en": "Gulistan",
-            "ru": "Гулистан",
-            "uz": "Guliston"
-        },
-        "active": True,
-        "region_id": 13
-    },
-    {
-        "city_id": 163,
-        "names": {
-            "en": "Gulistan District",
-            "ru": "Гулистанский район",
-            "uz": "Guliston tumani"
-        },
-        "active": True,
-        "region_id": 13
-    },
-    {
-        "city_id": 164,
-        "names": {
-            "en": "Mirzaabad District",
-            "ru": "Мирзаабадский район",
-            "uz": "Mirzaobod tumani"
-        },
-        "active": True,
-        "region_id": 13
-    },
-    {
-        "city_id": 165,
-        "names": {
-            "en": "Akaltyn District",
-            "ru": "Акалтынский район",
-            "uz": "Oqoltin tumani"
-        },
-        "active": True,
-        "region_id": 13
-    },
-    {
-        "city_id": 166,
-        "names": {
-            "en": "Saikhunabad District",
-            "ru": "Сайхунабадский район",
-            "uz": "Sayxunabad tumani"
-        },
-        "active": True,
-        "region_id": 13
-    },
-    {
-        "city_id": 167,
-        "names": {
-            "en": "Sardoba District",
-            "ru": "Сардобинский район",
-            "uz": "Sardoba tumani"
-        },
-        "active": True,
-        "region_id": 13
-    },
-    {
-        "city_id": 169,
-        "names": {
-            "en": "Khavast District",
-            "ru": "Хавастский район",
-            "uz": "Khovos tumani"
-        },
-        "active": True,
-        "region_id": 13
-    },
-    {
-        "city_id": 170,
-        "names": {
-            "en": "Shirin District",
-            "ru": "Ширинский район",
-            "uz": "Shirin tumani"
-        },
-        "active": True,
-        "region_id": 13
-    },
-    {
-        "city_id": 171,
-        "names": {
-            "en": "Yangiyer District",
-            "ru": "Янгиерский район",
-            "uz": "Yangiyer tumani"
-        },
-        "active": True,
-        "region_id": 13
-    },
-    {
-        "city_id": 172,
-        "names": {
-            "en": "Angren",
-            "ru": "Ангрен",
-            "uz": "Angren"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 173,
-        "names": {
-            "en": "Bekabad District",
-            "ru": "Бекабадский район",
-            "uz": "Bekobod tumani"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 174,
-        "names": {
-            "en": "Bekabad",
-            "ru": "Бекабад",
-            "uz": "Bekobod"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 175,
-        "names": {
-            "en": "Buka District",
-            "ru": "Букинский район",
-            "uz": "Buka"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 176,
-        "names": {
-            "en": "Bostanliq District",
-            "ru": "Бостанлыкский район",
-            "uz": "Bostanlik"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 177,
-        "names": {
-            "en": "Zangiata District",
-            "ru": "Зангиатинский район",
-            "uz": "Zangiota"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 178,
-        "names": {
-            "en": "Qibray District",
-            "ru": "Кибрайский район",
-            "uz": "Qibray"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 179,
-        "names": {
-            "en": "Quyi Chirchiq District",
-            "ru": "Куйичирчикский район",
-            "uz": "Quyi chirchiq tumani"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 180,
-        "names": {
-            "en": "Akkurgan District",
-            "ru": "Аккурганский район",
-            "uz": "Oqqo‘rg‘on tumani"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 181,
-        "names": {
-            "en": "Olmaliq",
-            "ru": "Алмалык",
-            "uz": "Olmaliq shahri"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 182,
-        "names": {
-            "en": "Okhangaron District",
-            "ru": "Ахангаранский район",
-            "uz": "Ohangaron tumani"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 183,
-        "names": {
-            "en": "Okhangaron",
-            "ru": "Ахангаран",
-            "uz": "Ohangaron shahri "
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 184,
-        "names": {
-            "en": "Parkent District",
-            "ru": "Паркентский район",
-            "uz": "Parkent tumani"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 185,
-        "names": {
-            "en": "Piskent District",
-            "ru": "Пскентский район",
-            "uz": "Pskent tumani"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 186,
-        "names": {
-            "en": "Tashkent District",
-            "ru": "Ташкентский район",
-            "uz": "Toshkent tumani"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 187,
-        "names": {
-            "en": "Orta Chirchiq District",
-            "ru": "Уртачирчикский район",
-            "uz": "O‘rta chirchiq tumani"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 188,
-        "names": {
-            "en": "Chinaz District",
-            "ru": "Чиназский район",
-            "uz": "Chinoz tumani"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 189,
-        "names": {
-            "en": "Chirchiq",
-            "ru": "Чирчик",
-            "uz": "Chirchiq shahri"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 190,
-        "names": {
-            "en": "Yukori Chirchiq District",
-            "ru": "Юкоричирчикский район",
-            "uz": "Yuqori chirchiq tumani"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 191,
-        "names": {
-            "en": "Yangiyol District",
-            "ru": "Янгиюльский район",
-            "uz": "Yangiyo‘l tumani"
-        },
-        "active": True,
-        "region_id": 14
-    },
-    {
-        "city_id": 192,
-        "names": {
-            "en": "Bektemir District",
-            "ru": "Бектемирский район",
-            "uz": "Bektemir tumani"
-        },
-        "active": True,
-        "region_id": 1
-    },
-    {
-        "city_id": 193,
-        "names": {
-            "en": "Mirzo Ulugbek District",
-            "ru": "Мирзо-Улугбекский район",
-            "uz": "Mirzo Ulug‘bek tumani"
-        },
-        "active": True,
-        "region_id": 1
-    },
-    {
-        "city_id": 194,
-        "names": {
-            "en": "Mirobod District",
-            "ru": "Мирабадский район",
-            "uz": "Mirobod tumani"
-        },
-        "active": True,
-        "region_id": 1
-    },
-    {
-        "city_id": 195,
-        "names": {
-            "en": "Olmazar District",
-            "ru": "Алмазарский район",
-            "uz": "Olmazor tumani"
-        },
-        "active": True,
-        "region_id": 1
-    },
-    {
-        "city_id": 196,
-        "names": {
-            "en": "Sergeli District",
-            "ru": "Сергелийский район",
-            "uz": "Sirg‘ali tumani"
-        },
-        "active": True,
-        "region_id": 1
-    },
-    {
-        "city_id": 197,
-        "names": {
-            "en": "Uchtepa District",
-            "ru": "Учтепинский район",
-            "uz": "Uchtepa tumani"
-        },
-        "active": True,
-        "region_id": 1
-    },
-    {
-        "city_id": 198,
-        "names": {
-            "en": "Chilanzar District",
-            "ru": "Чиланзарский район",
-            "uz": "Chilonzor tumani"
-        },
-        "active": True,
-        "region_id": 1
-    },
-    {
-        "city_id": 199,
-        "names": {
-            "en": "Shaykhontohur District",
-            "ru": "Шайхантахурский район",
-            "uz": "Shayxontoxur tumani"
-        },
-        "active": True,
-        "region_id": 1
-    },
-    {
-        "city_id": 201,
-        "names": {
-            "en": "Yakkasaray District",
-            "ru": "Яккасарайский район",
-            "uz": "Yakkasaroy tumani"
-        },
-        "active": True,
-        "region_id": 1
-    },
-    {
-        "city_id": 202,
-        "names": {
-            "en": "Yashnobod District",
-            "ru": "Яшнабадский район",
-            "uz": "Yashnobod tumani"
-        },
-        "active": True,
-        "region_id": 1
-    },
-    {
-        "city_id": 203,
-        "names": {
-            "en": "Tashkent city",
-            "ru": "Ташкент",
-            "uz": "Toshkent shahri"
-        },
-        "active": True,
-        "region_id": 1
-    },
-    {
-        "city_id": 82,
-        "names": {
-            "en": "Gurlen District",
-            "ru": "Гурленский район",
-            "uz": "Gurlan tumani"
-        },
-        "active": True,
-        "region_id": 7
-    },
-    {
-        "city_id": 108,
-        "names": {
-            "en": "Shurchi District",
-            "ru": "Шурчинский район",
-            "uz": "Sho‘rchi tumani"
-        },
-        "active": True,
-        "region_id": 8
-    },
-    {
-        "city_id": 143,
-        "names": {
-            "en": "Tamdy District",
-            "ru": "Тамдынский район",
-            "uz": "Tomdi tumani"
-        },
-        "active": True,
-        "region_id": 11
-    }
-]
\ No newline at end of file